@@ -1,12 +1,19 @@
 import streamlit as st
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
+import matplotlib.colors as colors
 import pandas as pd
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import List, Dict, Union, Literal
 import numpy as np
 import os
+import io
+import math
 import operator
+import uuid
+import copy
+from contextlib import nullcontext
+from functools import partial
 from timber_nds.design import (
     check_for_all_elements,
     filter_and_export_results,
@@ -30,26 +37,175 @@ from timber_nds.settings import (
     ElasticModulusAdjustmentFactors,
 )
 import chardet
+from wood_design import (
+    batch_check_for_all_elements,
+    factor_arguments,
+    SectionArrays,
+    MemberArrays,
+)
+from wood_design.cache import CapacityCache, join_capacities
+from wood_design.registry import NamedRegistry, ForceRegistry
+from wood_design.importers import ForcesSummary, import_robot_bar_forces_streaming, import_robot_bar_forces_fast
+from wood_design.envelope import reduce_envelope, verify_envelope
+from wood_design.parallel import parallel_check_for_all_elements
+from wood_design.incremental import IncrementalChecker
+from wood_design.optimize import optimize_sections
+from wood_design.postprocess import postprocess_results, query_results, page_positions, dcr_heatmap_grid
+from wood_design.disk_cache import ResultCache, inputs_fingerprint
+from wood_design.results_io import results_writer, read_results_arrow, compare_results
+from wood_design.diagnostics import Diagnostics
+from wood_design.profiles import DEFAULT_PROFILE, resolve_member_profiles, check_member_profiles, profile_capacity_table
+from wood_design.sweep import sweep_parameters, sweep_grid, sweep_governing, sweep_surface
+from wood_design.jobs import JobQueue, default_job_workers, run_check_job
 
 
-def plot_rectangular_section(section: RectangularSection, color: str) :
-    if not isinstance(section, RectangularSection) :
-        raise TypeError("The section argument must be a RectangularSection object.")
-    if section.depth <= 0 or section.width <= 0 :
-        raise ValueError("Section dimensions must be positive values.")
+def figure_to_png(fig) -> bytes :
+    """
+    Renders a figure to PNG and closes it, so figures do not accumulate in pyplot across reruns.
+    """
+    buffer = io.BytesIO()
+    try :
+        fig.savefig(buffer, format="png", bbox_inches="tight")
+    finally :
+        plt.close(fig)
+    return buffer.getvalue()
+
 
+@st.cache_data(max_entries=128, show_spinner=False)
+def section_figure_png(name: str, width: float, depth: float, color: str) -> bytes :
     fig, ax = plt.subplots()
-    rect = patches.Rectangle((0, 0), section.width, section.depth, linewidth=1, edgecolor="black", facecolor=color)
+    rect = patches.Rectangle((0, 0), width, depth, linewidth=1, edgecolor="black", facecolor=color)
     ax.add_patch(rect)
 
-    ax.set_xlim(-0.1 * section.width, 1.1 * section.width)
-    ax.set_ylim(-0.1 * section.depth, 1.1 * section.depth)
+    ax.set_xlim(-0.1 * width, 1.1 * width)
+    ax.set_ylim(-0.1 * depth, 1.1 * depth)
     ax.set_aspect("equal", adjustable="box")
     ax.set_xlabel("Width")
     ax.set_ylabel("Depth")
-    ax.set_title(f"Rectangular Section: {section.name}")
+    ax.set_title(f"Rectangular Section: {name}")
+    return figure_to_png(fig)
+
+
+def plot_rectangular_section(section: RectangularSection, color: str) :
+    if not isinstance(section, RectangularSection) :
+        raise TypeError("The section argument must be a RectangularSection object.")
+    if section.depth <= 0 or section.width <= 0 :
+        raise ValueError("Section dimensions must be positive values.")
+
+    # Rendered once per name, dimensions and color, then served from the cache on every rerun.
+    st.image(section_figure_png(section.name, float(section.width), float(section.depth), color))
+
+
+def dcr_heatmap_png(grid: pd.DataFrame, xlabel: str = "Load case", ylabel: str = "Member") -> bytes :
+    """
+    Heatmap of a dcr_heatmap_grid (members down and load cases across) or of a sweep surface, red above a DCR of 1.
+    """
+    fig, ax = plt.subplots(figsize=(10, max(3.0, min(12.0, 0.25 * len(grid.index) + 1.5))))
+    values = np.ma.masked_invalid(grid.to_numpy(dtype=float))
+    vmax = float(values.max()) if values.count() else 1.0
+    # Green to yellow up to a DCR of 1, red beyond.
+    norm = colors.TwoSlopeNorm(vmin=0.0, vcenter=1.0, vmax=vmax) if vmax > 1.0 else colors.Normalize(0.0, 2.0)
+    image = ax.imshow(values, aspect="auto", interpolation="nearest", cmap="RdYlGn_r", norm=norm)
+    for axis, labels, set_ticks, set_labels in [
+        ("x", grid.columns, ax.set_xticks, ax.set_xticklabels),
+        ("y", grid.index, ax.set_yticks, ax.set_yticklabels),
+    ] :
+        step = max(1, math.ceil(len(labels) / 40))
+        set_ticks(np.arange(0, len(labels), step))
+        set_labels([f"{label:g}" if isinstance(label, float) else str(label) for label in labels[::step]], rotation=90 if axis == "x" else 0, fontsize=7)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    fig.colorbar(image, ax=ax, label="Governing DCR")
+    return figure_to_png(fig)
+
+
+def table_page(table: pd.DataFrame, key: str) -> pd.DataFrame :
+    """
+    Member, DCR and top-N filters, sorting and pagination of a table, applied on the server.
+
+    Only the rows of the current page are returned, so rendering time depends on the page size
+    and not on the model size. Selections are kept per query until the next calculation.
+    """
+    views = st.session_state.table_views
+    filters = st.columns(4)
+    members = []
+    if "member" in table.columns :
+        if (key, "members") not in views :
+            views[(key, "members")] = list(pd.unique(table["member"]))
+        members = filters[0].multiselect("Members", views[(key, "members")], key=f"{key}_members")
+    min_dcr = filters[1].number_input("Minimum DCR", 0.0, 100.0, 0.0, step=0.1, key=f"{key}_min_dcr")
+    top_n = filters[2].number_input("Top N (0 = all)", 0, 1000000, 0, step=10, key=f"{key}_top_n")
+    columns = list(table.columns)
+    sort_by = filters[3].selectbox("Sort by", columns, index=columns.index("dcr_max") if "dcr_max" in columns else 0,
+                                   key=f"{key}_sort_by")
+    ascending = st.checkbox("Ascending", value=False, key=f"{key}_ascending")
+
+    query = (key, tuple(members), min_dcr, top_n, sort_by, ascending)
+    if query not in views :
+        views[query] = query_results(table, members=members, min_dcr=min_dcr or None, top_n=top_n or None,
+                                     sort_by=sort_by, ascending=ascending)
+    positions = views[query]
+
+    page_size = st.selectbox("Rows per page", [25, 50, 100, 500, 1000], index=1, key=f"{key}_page_size")
+    pages = max(1, math.ceil(len(positions) / page_size))
+    page = st.number_input(f"Page (of {pages})", 1, pages, 1, key=f"{key}_page")
+    st.caption(f"{len(positions):,} of {len(table):,} rows match.")
+    return table.iloc[page_positions(positions, page, page_size)]
+
+
+def session_member_profiles() :
+    """
+    Material and factor profile of every element of the session; elements without an assignment
+    use the current material and the adjustment factors of the Adjustment Factors tab.
+    """
+    materials = {material.name : material for material in st.session_state.materials}
+    materials[st.session_state.material.name] = st.session_state.material
+    return resolve_member_profiles(
+        st.session_state.elements.values(),
+        materials=materials,
+        factor_profiles={**st.session_state.factor_profiles, DEFAULT_PROFILE : st.session_state.adjustment_factors},
+        member_materials=st.session_state.member_materials,
+        member_factor_profiles=st.session_state.member_factor_profiles,
+        default_material=st.session_state.material.name,
+    )
+
 
-    st.pyplot(fig)
+def snapshot_check_kwargs(check_kwargs: dict) -> dict :
+    """
+    Copies of the check inputs for a queued job: the adjustment factor dataclasses of the session
+    are changed in place on every rerun, and must not change under a running job.
+    """
+    return {
+        key : [replace(item) for item in value] if key in ["list_sections", "list_elements"]
+        else dict(value) if isinstance(value, dict) else replace(value)
+        for key, value in check_kwargs.items()
+    }
+
+
+@st.cache_resource(show_spinner=False)
+def shared_job_queue() -> JobQueue :
+    # One queue per server process, shared by every session.
+    return JobQueue(max_workers=default_job_workers())
+
+
+@st.fragment(run_every=1.0)
+def calculation_progress() :
+    """
+    Progress of the session's queued calculation, polled every second without rerunning the whole page.
+    """
+    calculation_job = st.session_state.calculation_job
+    if calculation_job is None :
+        return
+    job = calculation_job["job"]
+    if job.done :
+        st.rerun()
+    st.progress(job.fraction, text=job.describe())
+    if len(job.owners) > 1 :
+        st.caption(f"Shared with {len(job.owners) - 1} other session(s) that submitted identical inputs.")
+    if st.button("Cancel calculation") :
+        shared_job_queue().cancel(job, owner=st.session_state.session_id)
+        st.session_state.calculation_job = None
+        st.rerun()
 
 
 def main() :
@@ -57,14 +213,19 @@ def main() :
 
     if "material" not in st.session_state :
         st.session_state.material = None
+    if "materials" not in st.session_state :
+        st.session_state.materials = NamedRegistry("Material")
     if "sections" not in st.session_state :
-        st.session_state.sections = []
+        st.session_state.sections = NamedRegistry("Section")
     if "elements" not in st.session_state :
-        st.session_state.elements = []
+        st.session_state.elements = NamedRegistry("Element")
     if "forces_data" not in st.session_state :
-        st.session_state.forces_data = []
+        st.session_state.forces_data = ForceRegistry()
     if "results_df" not in st.session_state :
         st.session_state.results_df = pd.DataFrame()
+    if "results_forces" not in st.session_state :
+        # The ForceArrays results_df was computed with, for the demand columns of the download.
+        st.session_state.results_forces = None
     if "adjustment_factors" not in st.session_state :
         st.session_state.adjustment_factors = {
             "tension" : TensionAdjustmentFactors(),
@@ -89,10 +250,44 @@ def main() :
         }
     if "uploaded_file_path" not in st.session_state :
         st.session_state.uploaded_file_path = None
+    if "uploaded_file_key" not in st.session_state :
+        st.session_state.uploaded_file_key = None
+    if "forces_summary" not in st.session_state :
+        st.session_state.forces_summary = None
     if "support_area_values" not in st.session_state :
         st.session_state.support_area_values = {}
+    if "capacity_cache" not in st.session_state :
+        st.session_state.capacity_cache = CapacityCache(maxsize=1024)
+    if "incremental_checker" not in st.session_state :
+        st.session_state.incremental_checker = IncrementalChecker()
+    if "postprocessed" not in st.session_state :
+        st.session_state.postprocessed = None
+    if "result_cache" not in st.session_state :
+        try :
+            st.session_state.result_cache = ResultCache()
+        except OSError :
+            st.session_state.result_cache = None
+    if "optimization_df" not in st.session_state :
+        st.session_state.optimization_df = pd.DataFrame()
+    if "table_views" not in st.session_state :
+        st.session_state.table_views = {}
+    if "factor_profiles" not in st.session_state :
+        st.session_state.factor_profiles = {}
+    if "member_materials" not in st.session_state :
+        st.session_state.member_materials = {}
+    if "member_factor_profiles" not in st.session_state :
+        st.session_state.member_factor_profiles = {}
+    if "sweep_df" not in st.session_state :
+        st.session_state.sweep_df = pd.DataFrame()
+    if "session_id" not in st.session_state :
+        st.session_state.session_id = uuid.uuid4().hex
+    if "calculation_job" not in st.session_state :
+        st.session_state.calculation_job = None
+    if "diagnostics" not in st.session_state :
+        st.session_state.diagnostics = Diagnostics()
+    diagnostics = st.session_state.diagnostics
 
-    tabs = ["Element", "Adjustment Factors", "Forces", "Calculate", "Download"]
+    tabs = ["Element", "Adjustment Factors", "Forces", "Calculate", "Optimize", "Sweep", "Download", "Diagnostics"]
     selected_tab = st.sidebar.radio("Select Tab", tabs)
 
     if selected_tab == "Element" :
@@ -124,6 +319,7 @@ def main() :
                 elastic_modulus=elastic_modulus,
                 color=color,
             )
+            st.session_state.materials.put(wood_material)
             st.session_state.material = wood_material
             st.sidebar.success(f"Material '{material_name}' saved!")
 
@@ -138,8 +334,11 @@ def main() :
 
         if st.sidebar.button("Add Section") :
             rectangular_section = RectangularSection(name=section_name, depth=depth, width=width)
-            st.session_state.sections.append(rectangular_section)
-            st.sidebar.success(f"Section '{section_name}' added!")
+            try :
+                st.session_state.sections.add(rectangular_section)
+                st.sidebar.success(f"Section '{section_name}' added!")
+            except ValueError as e :
+                st.sidebar.error(str(e))
 
         st.sidebar.subheader("Added Sections:")
         for section in st.session_state.sections :
@@ -147,7 +346,7 @@ def main() :
 
         st.header("Rectangular Section Visualization")
         if st.session_state.sections and st.session_state.material :
-            plot_rectangular_section(st.session_state.sections[-1], st.session_state.material.color)
+            plot_rectangular_section(st.session_state.sections.last(), st.session_state.material.color)
 
         st.sidebar.subheader("Element")
         element_name = st.sidebar.text_input("Element Name", "Column 1")
@@ -155,6 +354,8 @@ def main() :
         effective_length_factor_yy = st.sidebar.number_input("Effective Length Factor YY", 0.1, 2.2, 1.0)
         effective_length_factor_zz = st.sidebar.number_input("Effective Length Factor ZZ", 0.1, 2.2, 1.0)
         support_area = st.sidebar.number_input("Support Area (cm2)", 0.1, 10000.0, 100.0)
+        element_material = st.sidebar.selectbox("Element Material", ["Current material"] + st.session_state.materials.names())
+        element_factor_profile = st.sidebar.selectbox("Factor Profile", [DEFAULT_PROFILE] + list(st.session_state.factor_profiles))
 
         member_definition = MemberDefinition(
             name=element_name,
@@ -164,13 +365,22 @@ def main() :
         )
 
         if st.sidebar.button("Add Element") :
-            st.session_state.elements.append(member_definition)
-            st.session_state.support_area_values[element_name] = support_area
-            st.sidebar.success(f"Element '{element_name}' added!")
+            try :
+                st.session_state.elements.add(member_definition)
+                st.session_state.support_area_values[element_name] = support_area
+                if element_material != "Current material" :
+                    st.session_state.member_materials[element_name] = element_material
+                if element_factor_profile != DEFAULT_PROFILE :
+                    st.session_state.member_factor_profiles[element_name] = element_factor_profile
+                st.sidebar.success(f"Element '{element_name}' added!")
+            except ValueError as e :
+                st.sidebar.error(str(e))
 
         st.sidebar.subheader("Added Elements:")
         for element in st.session_state.elements :
-            st.sidebar.text(f"- {element.name} (Length: {element.length} cm)")
+            material_label = st.session_state.member_materials.get(element.name, "current material")
+            profile_label = st.session_state.member_factor_profiles.get(element.name, DEFAULT_PROFILE)
+            st.sidebar.text(f"- {element.name} (Length: {element.length} cm, {material_label}, {profile_label} factors)")
 
     elif selected_tab == "Adjustment Factors" :
         st.sidebar.subheader("Adjustment Factors")
@@ -286,35 +496,119 @@ def main() :
                 st.session_state.saved_factors[factor_type] = st.session_state.adjustment_factors[factor_type]
             st.sidebar.success("Adjustment factors saved!")
 
+        st.sidebar.subheader("Factor Profiles")
+        st.sidebar.write("Save the factors above under a name, then assign the profile to elements in the Element tab.")
+        profile_name = st.sidebar.text_input("Profile Name", "Wet service")
+        if st.sidebar.button("Save as Factor Profile") :
+            if profile_name == DEFAULT_PROFILE :
+                st.sidebar.error(f"'{DEFAULT_PROFILE}' is the name of the factors above, use another name.")
+            else :
+                st.session_state.factor_profiles[profile_name] = {
+                    factor_type : replace(st.session_state.adjustment_factors[factor_type])
+                    for factor_type in factor_types
+                }
+                st.sidebar.success(f"Factor profile '{profile_name}' saved!")
+        for name in st.session_state.factor_profiles :
+            st.sidebar.text(f"- {name}")
+
     elif selected_tab == "Forces" :
         st.sidebar.subheader("Forces")
         uploaded_file = st.sidebar.file_uploader("Upload Forces CSV", type=["csv"])
+        import_method = st.sidebar.radio("Import method", ["Standard", "Streaming (large files)", "Fast (Arrow)"])
+        streaming_import = import_method == "Streaming (large files)"
+        fast_import = import_method == "Fast (Arrow)"
+        chunksize = st.sidebar.number_input("Rows per chunk", 1000, 10000000, 100000, step=1000,
+                                            disabled=not streaming_import)
+        member_filter = st.sidebar.text_input("Only members (comma-separated)", "", disabled=not fast_import)
+        case_filter = st.sidebar.text_input("Only load cases (comma-separated)", "", disabled=not fast_import)
         if uploaded_file is not None :
-            try :
-                st.session_state.uploaded_file_path = uploaded_file.name
-
-                df = import_robot_bar_forces(uploaded_file)
-                if df is not None :
-                    forces_list = create_robot_bar_forces_as_objects(df)
-                    st.session_state.forces_data = forces_list
-                    st.sidebar.success("Forces loaded from CSV!")
-                else :
-                    st.sidebar.error(
-                        "Error loading forces from CSV. Please check the file format.")
-            except Exception as e :
-                st.sidebar.error(f"Error loading CSV: {e}")
+            upload_key = (uploaded_file.name, uploaded_file.size, import_method, chunksize, member_filter, case_filter)
+            if upload_key != st.session_state.uploaded_file_key :
+                try :
+                    st.session_state.uploaded_file_path = uploaded_file.name
+
+                    if fast_import :
+                        with diagnostics.stage("csv import") as record :
+                            forces, summary = import_robot_bar_forces_fast(
+                                uploaded_file,
+                                members=[item.strip() for item in member_filter.split(",") if item.strip()] or None,
+                                cases=[item.strip() for item in case_filter.split(",") if item.strip()] or None,
+                            )
+                            record.rows = len(forces)
+                        st.session_state.forces_data = ForceRegistry(forces)
+                        st.session_state.forces_summary = summary
+                        st.session_state.uploaded_file_key = upload_key
+                        st.sidebar.success("Forces loaded from CSV!")
+                    elif streaming_import :
+                        with diagnostics.stage("csv import") as record :
+                            forces, summary = import_robot_bar_forces_streaming(uploaded_file, chunksize=int(chunksize))
+                            record.rows = len(forces)
+                        st.session_state.forces_data = ForceRegistry(forces)
+                        st.session_state.forces_summary = summary
+                        st.session_state.uploaded_file_key = upload_key
+                        st.sidebar.success("Forces loaded from CSV!")
+                    else :
+                        with diagnostics.stage("csv import") as record :
+                            df = import_robot_bar_forces(uploaded_file)
+                            record.rows = 0 if df is None else len(df)
+                        if df is not None :
+                            with diagnostics.stage("object creation", rows=len(df)) :
+                                forces_list = create_robot_bar_forces_as_objects(df)
+                            st.session_state.forces_data = ForceRegistry.from_forces(forces_list)
+                            summary = ForcesSummary()
+                            summary.update(df.index.get_level_values("Member").unique(),
+                                           df.index.get_level_values("Case").unique(),
+                                           st.session_state.forces_data.arrays)
+                            st.session_state.forces_summary = summary
+                            st.session_state.uploaded_file_key = upload_key
+                            st.sidebar.success("Forces loaded from CSV!")
+                        else :
+                            st.sidebar.error(
+                                "Error loading forces from CSV. Please check the file format.")
+                except Exception as e :
+                    st.sidebar.error(f"Error loading CSV: {e}")
 
         st.sidebar.subheader("Loaded Forces:")
-        if st.session_state.forces_data :
-            for forces in st.session_state.forces_data :
-                st.sidebar.text(
-                    f"- Name: {forces.name}, Axial: {forces.axial}, Shear Y: {forces.shear_y}, Shear Z: {forces.shear_z}, Moment XX: {forces.moment_xx}, Moment YY: {forces.moment_yy}, Moment ZZ: {forces.moment_zz}"
-                )
+        if st.session_state.forces_data and st.session_state.forces_summary :
+            summary = st.session_state.forces_summary
+            st.sidebar.text(f"- Rows: {summary.rows}")
+            st.sidebar.text(f"- Members: {len(summary.members)}")
+            st.sidebar.text(f"- Load cases: {len(summary.cases)}")
+            repeated = st.session_state.forces_data.repeated_names()
+            if repeated :
+                st.sidebar.warning(f"{len(repeated)} force names are repeated "
+                                   f"({st.session_state.forces_data.repeated_rows()} extra rows), e.g. "
+                                   f"{', '.join(map(str, repeated[:5]))}. Every row is checked; "
+                                   f"lookups by name use the first.")
+            st.sidebar.dataframe(summary.envelope())
 
     elif selected_tab == "Calculate" :
         st.header("Results")
         st.subheader("Complete results")
 
+        engine = st.sidebar.radio("Engine", ["Vectorized", "Parallel", "Reference (per row)"])
+        if engine == "Vectorized" :
+            incremental = st.sidebar.checkbox("Incremental recalculation", value=True)
+            if incremental :
+                check_function = st.session_state.incremental_checker.check_for_all_elements
+            else :
+                check_function = batch_check_for_all_elements
+        elif engine == "Parallel" :
+            workers = st.sidebar.number_input("Worker processes", 1, 256, os.cpu_count() or 1)
+            partition = st.sidebar.radio("Partition by", ["section", "member"])
+            check_function = partial(parallel_check_for_all_elements, workers=int(workers), partition=partition)
+        else :
+            check_function = check_for_all_elements
+        use_job_queue = st.sidebar.checkbox("Run in shared job queue", value=False,
+                                            help="Queue the calculation on the server's shared workers, "
+                                                 "with progress and cancellation.")
+        envelope_prefilter = st.sidebar.checkbox("Envelope pre-filter", value=False)
+        verify_prefilter = st.sidebar.checkbox("Verify pre-filter against full run", value=False,
+                                               disabled=not envelope_prefilter or use_job_queue)
+        use_result_cache = st.sidebar.checkbox("Use result cache", value=st.session_state.result_cache is not None,
+                                               disabled=st.session_state.result_cache is None)
+        profile_run = st.sidebar.checkbox("Profile this calculation (cProfile)", value=False)
+
         if st.sidebar.button("Calculate") :
             st.write("")
 
@@ -331,10 +625,9 @@ def main() :
                 elastic_modulus_factors = st.session_state.adjustment_factors["elastic_modulus"]
 
                 try :
-                    st.session_state.results_df = check_for_all_elements(
-                        list_sections=st.session_state.sections,
-                        list_elements=st.session_state.elements,
-                        list_forces=st.session_state.forces_data,
+                    check_kwargs = dict(
+                        list_sections=st.session_state.sections.values(),
+                        list_elements=st.session_state.elements.values(),
                         material=st.session_state.material,
                         tension_factors=tension_factors,
                         bending_factors_yy=bending_factors_yy,
@@ -346,126 +639,227 @@ def main() :
                         elastic_modulus_factors=elastic_modulus_factors,
                         support_area_values=st.session_state.support_area_values
                     )
-                    st.write("", st.session_state.results_df)
+
+                    profiles = session_member_profiles()
+                    mixed_profiles = profiles.mixed(st.session_state.material.name)
+                    if mixed_profiles :
+                        # Members with other materials or factors than the main ones: one vectorized pass over all profiles.
+                        st.info(f"Elements use {len(profiles)} material and factor profile(s), "
+                                f"checked with the vectorized engine.")
+
+                        def check_function(list_forces, list_sections, list_elements, support_area_values, **factors) :
+                            return check_member_profiles(list_sections, list_elements, list_forces,
+                                                         support_area_values, profiles)
+
+                    def as_engine_forces(forces: ForceRegistry) :
+                        if check_function is check_for_all_elements :
+                            return forces.values()
+                        return forces.arrays
+
+                    result_cache = st.session_state.result_cache if use_result_cache else None
+                    cache_key = None
+                    cached = None
+                    if result_cache is not None or use_job_queue :
+                        cache_key = inputs_fingerprint(
+                            material=st.session_state.material,
+                            list_sections=check_kwargs["list_sections"],
+                            list_elements=check_kwargs["list_elements"],
+                            adjustment_factors=st.session_state.adjustment_factors,
+                            support_area_values=st.session_state.support_area_values,
+                            forces=st.session_state.forces_data.arrays,
+                            options={"envelope_prefilter" : envelope_prefilter, "profiles" : profiles.fingerprint()},
+                        )
+                    if result_cache is not None :
+                        cached = result_cache.get(cache_key)
+
+                    forces_registry = st.session_state.forces_data
+                    if cached is not None :
+                        st.session_state.results_df = cached["results"]
+                        st.session_state.results_forces = reduce_envelope(forces_registry.arrays).forces \
+                            if envelope_prefilter else forces_registry.arrays
+                        st.info("Identical inputs were calculated before, results loaded from the result cache.")
+                    else :
+                        if envelope_prefilter :
+                            reduction = reduce_envelope(forces_registry.arrays)
+                            forces_registry = ForceRegistry(reduction.forces)
+                            st.info(f"Envelope pre-filter kept {reduction.rows_out} of {reduction.rows_in} force rows "
+                                    f"({reduction.pruned} pruned).")
+
+                        if use_job_queue :
+                            previous_job = st.session_state.calculation_job
+                            if previous_job is not None :
+                                shared_job_queue().cancel(previous_job["job"], owner=st.session_state.session_id)
+                            # The incremental checker keeps per-session state, queued jobs use the stateless engine.
+                            job_check = batch_check_for_all_elements if engine == "Vectorized" and incremental \
+                                and not mixed_profiles else check_function
+                            list_forces = as_engine_forces(forces_registry)
+                            job_kwargs = snapshot_check_kwargs(check_kwargs)
+                            n_sections, n_elements = len(check_kwargs["list_sections"]), len(check_kwargs["list_elements"])
+                            # Identical inputs give identical results with every engine, so the input hash deduplicates jobs.
+                            job = shared_job_queue().submit(
+                                partial(run_check_job, check_function=job_check, list_forces=list_forces, **job_kwargs),
+                                key=cache_key,
+                                owner=st.session_state.session_id,
+                                label=f"{n_sections} sections x {n_elements} elements x {len(list_forces):,} forces",
+                                cost=n_sections * n_elements * len(list_forces),
+                                total=len(list_forces),
+                                unit="forces",
+                            )
+                            st.session_state.calculation_job = {
+                                "job" : job,
+                                "cache_key" : cache_key if result_cache is not None else None,
+                                # Mixed profiles are checked with their combined factors, computed when resolved.
+                                "profiles" : copy.deepcopy(profiles),
+                                "check_kwargs" : job_kwargs,
+                                "forces" : forces_registry.arrays,
+                            }
+                            st.rerun()
+
+                        with diagnostics.stage("check") as record, \
+                                diagnostics.profile() if profile_run else nullcontext() :
+                            st.session_state.results_df = check_function(
+                                list_forces=as_engine_forces(forces_registry), **check_kwargs
+                            )
+                            st.session_state.results_forces = forces_registry.arrays
+                            record.rows = len(st.session_state.results_df)
+                        if engine == "Vectorized" and incremental and not mixed_profiles :
+                            st.caption(st.session_state.incremental_checker.plan.describe())
+
+                        if result_cache is not None and not st.session_state.results_df.empty :
+                            capacities = profile_capacity_table(
+                                st.session_state.capacity_cache,
+                                list_sections=check_kwargs["list_sections"],
+                                list_elements=check_kwargs["list_elements"],
+                                support_area_values=st.session_state.support_area_values,
+                                profiles=profiles,
+                            )
+                            result_cache.put(cache_key, {"results" : st.session_state.results_df,
+                                                         "capacities" : capacities})
+                    with diagnostics.stage("post-processing", rows=len(st.session_state.results_df)) :
+                        st.session_state.postprocessed = postprocess_results(st.session_state.results_df)
+                    st.session_state.table_views = {}
+
+                    if envelope_prefilter and verify_prefilter :
+                        # The incremental checker keeps state, verify with the stateless engine instead.
+                        verify_function = batch_check_for_all_elements if engine == "Vectorized" and not mixed_profiles \
+                            else check_function
+                        full_results = verify_function(
+                            list_forces=as_engine_forces(st.session_state.forces_data), **check_kwargs
+                        )
+                        if verify_envelope(full_results, st.session_state.results_df) :
+                            st.success("Governing DCRs of the pre-filtered run match the full run.")
+                        else :
+                            st.error("Governing DCRs of the pre-filtered run differ from the full run.")
+                    st.success(f"{len(st.session_state.results_df):,} result rows calculated.")
                 except Exception as e :
                     st.error(f"An error occurred during calculation: {e}")
             else :
                 st.error("Please ensure forces, elements, and sections are defined.")
 
+        calculation_job = st.session_state.calculation_job
+        if calculation_job is not None and not calculation_job["job"].done :
+            calculation_progress()
+        elif calculation_job is not None :
+            st.session_state.calculation_job = None
+            job = calculation_job["job"]
+            if job.status == "done" :
+                st.session_state.results_df = job.result
+                st.session_state.results_forces = calculation_job["forces"]
+                diagnostics.add("check (queued)", job.finished - job.started, rows=len(job.result), started=job.started)
+                if calculation_job["cache_key"] is not None and not job.result.empty :
+                    capacities = profile_capacity_table(
+                        st.session_state.capacity_cache,
+                        list_sections=calculation_job["check_kwargs"]["list_sections"],
+                        list_elements=calculation_job["check_kwargs"]["list_elements"],
+                        support_area_values=calculation_job["check_kwargs"]["support_area_values"],
+                        profiles=calculation_job["profiles"],
+                    )
+                    st.session_state.result_cache.put(calculation_job["cache_key"],
+                                                      {"results" : job.result, "capacities" : capacities})
+                with diagnostics.stage("post-processing", rows=len(job.result)) :
+                    st.session_state.postprocessed = postprocess_results(job.result)
+                st.session_state.table_views = {}
+                st.success(f"{len(job.result):,} result rows calculated.")
+            elif job.status == "cancelled" :
+                st.warning("The calculation was cancelled.")
+            else :
+                st.error(f"An error occurred during calculation: {job.error}")
+
         if not st.session_state.results_df.empty :
             st.subheader("Filtered Results")
-            forces_tab, strength_tab, dcr_tab = st.tabs(["Forces", "Strength", "DCR"])
+            if st.session_state.postprocessed is None :
+                st.session_state.postprocessed = postprocess_results(st.session_state.results_df)
+                st.session_state.table_views = {}
+            postprocessed = st.session_state.postprocessed
+            # Aggregated views first; detail tables are only built and sent to the browser on request, one page at a time.
+            governing_tab, dcr_tab, strength_tab, forces_tab = st.tabs(["Governing", "DCR", "Strength", "Forces"])
 
-            with forces_tab :
-                st.subheader("Forces Data")
-                df = pd.DataFrame(st.session_state.forces_data)
-                if not df.empty :
-                    df.insert(0, 'force', df['name'])
-                    dcr_max_values_dict = {}
-                    for _, results_row in st.session_state.results_df.iterrows() :
-                        force_name = results_row["force"]
-                        if force_name not in dcr_max_values_dict :
-                            dcr_max_values_dict[force_name] = max(results_row.get(key, 0) for key in [
-                                "tension (dcr)", "biaxial bending (dcr)",
-                                "shear y (dcr)", "shear z (dcr)",
-                                "compression (dcr)", "bending and compression (dcr)", "compression perpendicular (dcr)"
-                            ])
-
-                    dcr_max_values = [dcr_max_values_dict.get(force_name, 0) for force_name in df['force']]
-
-                    st.dataframe(
-                        df[["force", "axial", "shear_y", "shear_z", "moment_xx", "moment_yy", "moment_zz"]])
+            with governing_tab :
+                st.subheader("Governing Summary per Member")
+                with diagnostics.stage("rendering", rows=len(postprocessed.member_summary)) :
+                    st.dataframe(postprocessed.member_summary)
+                st.subheader("DCR Heatmap (Members x Load Cases)")
+                heatmap_section = st.selectbox("Section", ["All sections"] + list(pd.unique(postprocessed.member_summary["section"])),
+                                               key="heatmap_section")
+                views = st.session_state.table_views
+                if ("heatmap", heatmap_section) not in views :
+                    with diagnostics.stage("heatmap", rows=len(postprocessed.results)) :
+                        grid = dcr_heatmap_grid(postprocessed.results,
+                                                section=None if heatmap_section == "All sections" else heatmap_section)
+                        views[("heatmap", heatmap_section)] = dcr_heatmap_png(grid) if not grid.empty else None
+                if views[("heatmap", heatmap_section)] is not None :
+                    st.image(views[("heatmap", heatmap_section)])
+                st.subheader("Governing Row per Member")
+                st.dataframe(postprocessed.by_member)
+                st.subheader("Governing Row per Force")
+                with diagnostics.stage("rendering") as record :
+                    page = table_page(postprocessed.by_force, "by_force")
+                    st.dataframe(page)
+                    record.rows = len(page)
+
+            with dcr_tab :
+                st.subheader("Demand-Capacity Ratio (DCR)")
+                if st.checkbox("Show DCR detail", value=False, key="dcr_detail") :
+                    columns_to_display = ["member", "section", "force", "dcr_max", "governing check"]
+                    columns_to_display += [col for col in postprocessed.results.columns if "(dcr)" in col]
+                    with diagnostics.stage("rendering") as record :
+                        page = table_page(postprocessed.results, "dcr")[columns_to_display]
+                        st.dataframe(page)
+                        record.rows = len(page)
 
             with strength_tab :
                 st.subheader("Section Strength")
-
-                all_capacities = []
-                for index, row in st.session_state.results_df.iterrows() :
-
-                    element = next((element for element in st.session_state.elements if element.name == row['member']),
-                                   None)
-                    section = next((section for section in st.session_state.sections if section.name == row['section']),
-                                   None)
-                    force = next((force for force in st.session_state.forces_data if force.name == row['force']), None)
-                    material = st.session_state.material
-
-                    if element and section and force and material :
-                        section_properties = RectangularSectionProperties(width=section.width, depth=section.depth)
-                        support_area = st.session_state.support_area_values.get(element.name, 1.0)
-
-                        wood_calculator = WoodElementCalculator(
-                            tension_factors=st.session_state.adjustment_factors["tension"],
-                            bending_factors_yy=st.session_state.adjustment_factors["bending_yy"],
-                            bending_factors_zz=st.session_state.adjustment_factors["bending_zz"],
-                            shear_factors=st.session_state.adjustment_factors["shear"],
-                            compression_factors_yy=st.session_state.adjustment_factors["compression_yy"],
-                            compression_factors_zz=st.session_state.adjustment_factors["compression_zz"],
-                            compression_perp_factors=st.session_state.adjustment_factors["compression_perp"],
-                            elastic_modulus_factors=st.session_state.adjustment_factors["elastic_modulus"],
-                            material_properties=material,
-                            section_properties=section_properties,
+                if st.session_state.material and st.checkbox("Show strength detail", value=False, key="strength_detail") :
+                    page = table_page(postprocessed.results, "strength")[["member", "section", "force", "dcr_max"]]
+                    # Capacities are joined on the displayed page only.
+                    with diagnostics.stage("strength table", rows=len(page)) :
+                        capacity_table = profile_capacity_table(
+                            st.session_state.capacity_cache,
+                            list_sections=st.session_state.sections.values(),
+                            list_elements=st.session_state.elements.values(),
+                            support_area_values=st.session_state.support_area_values,
+                            profiles=session_member_profiles(),
                         )
+                        capacities_df = join_capacities(page, capacity_table)
+                    if not capacities_df.empty :
+                        st.dataframe(capacities_df[["member", "section", "force", "dcr_max", "tension_capacity",
+                                                    "bending_yy_capacity", "bending_zz_capacity", "shear_capacity",
+                                                    "compression_yy_capacity", "compression_zz_capacity",
+                                                    "compression_perp_capacity"]])
 
-                        tension_capacity = wood_calculator.tension_strength()
-                        bending_capacity_yy = wood_calculator.bending_strength("yy")
-                        bending_capacity_zz = wood_calculator.bending_strength("zz")
-                        shear_capacity = wood_calculator.shear_strength()
-                        compression_capacity_yy = wood_calculator.compression_strength("yy")
-                        compression_capacity_zz = wood_calculator.compression_strength("zz")
-                        compression_perp_capacity = wood_calculator.compression_perp_strength(support_area)
-
-                        dcr_max_value = max(row.get(key, 0) for key in [
-                            "tension (dcr)", "biaxial bending (dcr)",
-                            "shear y (dcr)", "shear z (dcr)",
-                            "compression (dcr)", "bending and compression (dcr)", "compression perpendicular (dcr)"
-                        ])
-
-                        capacity_data = {
-                            "member" : row["member"],
-                            "section" : row["section"],
-                            "force" : row["force"],
-                            "tension_capacity" : tension_capacity,
-                            "bending_yy_capacity" : bending_capacity_yy,
-                            "bending_zz_capacity" : bending_capacity_zz,
-                            "shear_capacity" : shear_capacity,
-                            "compression_yy_capacity" : compression_capacity_yy,
-                            "compression_zz_capacity" : compression_capacity_zz,
-                            "compression_perp_capacity" : compression_perp_capacity,
-                            "dcr_max" : dcr_max_value
-                        }
-                        all_capacities.append(capacity_data)
-
-                capacities_df = pd.DataFrame(all_capacities)
-                if not capacities_df.empty :
-                    st.dataframe(capacities_df[["member", "section", "force", "dcr_max", "tension_capacity",
-                                                "bending_yy_capacity", "bending_zz_capacity", "shear_capacity",
-                                                "compression_yy_capacity", "compression_zz_capacity",
-                                                "compression_perp_capacity"]])
-
-            with dcr_tab :
-                st.subheader("Demand-Capacity Ratio (DCR)")
-                dcr_columns = ["member", "section", "force"] + [col for col in st.session_state.results_df.columns if
-                                                                "(dcr)" in col]
-                df = st.session_state.results_df[dcr_columns].copy()
-                if not df.empty :
-                    dcr_max_values = []
-                    for index, row in df.iterrows() :
-                        dcr_max_value = max(row.get(key, 0) for key in [
-                            "tension (dcr)", "shear y (dcr)", "shear z (dcr)",
-                            "compression (dcr)", "biaxial bending (dcr)", "bending and compression (dcr)",
-                            "compression perpendicular (dcr)"
-                        ])
-                        dcr_max_values.append(dcr_max_value)
-
-                    df['dcr_max'] = dcr_max_values
-
-                    columns_to_display = ["member", "section", "force", "dcr_max"]
-
-                    for col in df.columns :
-                        if "(dcr)" in col :
-                            columns_to_display.append(col)
-
-                    st.dataframe(df[columns_to_display])
+            with forces_tab :
+                st.subheader("Forces Data")
+                if st.checkbox("Show forces detail", value=False, key="forces_detail") :
+                    views = st.session_state.table_views
+                    if "forces_frame" not in views :
+                        df = st.session_state.forces_data.to_frame()
+                        df.insert(0, 'force', df['name'])
+                        dcr_max_by_force = postprocessed.by_force.set_index("force")["dcr_max"]
+                        df["dcr_max"] = df["force"].map(dcr_max_by_force)
+                        views["forces_frame"] = df[["force", "dcr_max", "axial", "shear_y", "shear_z",
+                                                    "moment_xx", "moment_yy", "moment_zz"]]
+                    if not views["forces_frame"].empty :
+                        st.dataframe(table_page(views["forces_frame"], "forces"))
         else :
             st.write("No calculation results available.")
 
@@ -500,17 +894,189 @@ def main() :
                 for element in st.session_state.elements :
                     st.write(f"- **{element.name}:** Length: {element.length} cm")
 
+    elif selected_tab == "Optimize" :
+        st.header("Section Optimization")
+        st.write("Finds the lightest catalog section of every element whose governing DCR is within the limit.")
+
+        catalog_source = st.sidebar.radio("Section catalog", ["Added sections", "Upload catalog CSV"])
+        catalog_sections = st.session_state.sections.values()
+        catalog_cost = None
+        if catalog_source == "Upload catalog CSV" :
+            catalog_file = st.sidebar.file_uploader("Catalog CSV (name;width;depth[;cost])", type=["csv"])
+            catalog_sections = []
+            if catalog_file is not None :
+                try :
+                    catalog_df = pd.read_csv(catalog_file, sep=";", decimal=",")
+                    catalog_sections = [
+                        RectangularSection(name=str(row["name"]), width=float(row["width"]), depth=float(row["depth"]))
+                        for _, row in catalog_df.iterrows()
+                    ]
+                    if "cost" in catalog_df.columns :
+                        catalog_cost = catalog_df["cost"].to_numpy(dtype=float)
+                except Exception as e :
+                    st.sidebar.error(f"Error loading catalog: {e}")
+
+        sort_by = st.sidebar.radio("Sort catalog by", ["Area", "Cost"], disabled=catalog_cost is None)
+        dcr_limit = st.sidebar.number_input("DCR limit", 0.01, 10.0, 1.0)
+
+        if st.sidebar.button("Optimize") :
+            if not st.session_state.material :
+                st.error("Please define a material before continuing.")
+            elif st.session_state.forces_data and st.session_state.elements and catalog_sections :
+                try :
+                    # Every group of elements sharing a material and factor profile is optimized with its own.
+                    profiles = session_member_profiles()
+                    elements = st.session_state.elements.values()
+                    tables = []
+                    for profile in range(len(profiles)) :
+                        tables.append(optimize_sections(
+                            catalog=SectionArrays.from_sections(catalog_sections),
+                            members=MemberArrays.from_members(
+                                [element for element, code in zip(elements, profiles.member_profile) if code == profile],
+                                st.session_state.support_area_values,
+                            ),
+                            forces=st.session_state.forces_data.arrays,
+                            material=profiles.materials[profile],
+                            combined=profiles.combined[profile],
+                            cost=catalog_cost if sort_by == "Cost" else None,
+                            limit=dcr_limit,
+                        ))
+                    order = {element.name : i for i, element in enumerate(elements)}
+                    optimization_df = pd.concat(tables, ignore_index=True)
+                    st.session_state.optimization_df = optimization_df.iloc[
+                        np.argsort(optimization_df["member"].map(order).to_numpy(), kind="stable")
+                    ].reset_index(drop=True)
+                except Exception as e :
+                    st.error(f"An error occurred during optimization: {e}")
+            else :
+                st.error("Please ensure forces, elements, and a section catalog are defined.")
+
+        if not st.session_state.optimization_df.empty :
+            st.dataframe(st.session_state.optimization_df)
+
+    elif selected_tab == "Sweep" :
+        st.header("Parametric Sweep")
+        st.write("Governing DCR of every element and section over a grid of adjustment factors and material "
+                 "strengths, starting from the current material and the factors of the Adjustment Factors tab.")
+
+        parameters = st.sidebar.multiselect("Swept parameters", sweep_parameters(st.session_state.adjustment_factors),
+                                            default=["due_moisture"])
+        values = {}
+        for name in parameters :
+            st.sidebar.write(f"{name.replace('_', ' ').title()}:")
+            start = st.sidebar.number_input("From", value=0.5 if "strength" not in name else 50.0, key=f"sweep_{name}_start")
+            stop = st.sidebar.number_input("To", value=1.0 if "strength" not in name else 300.0, key=f"sweep_{name}_stop")
+            count = st.sidebar.number_input("Points", 1, 1000, 6, key=f"sweep_{name}_count")
+            values[name] = np.linspace(start, stop, count)
+
+        if st.sidebar.button("Run Sweep") :
+            if not st.session_state.material :
+                st.error("Please define a material before continuing.")
+            elif session_member_profiles().mixed(st.session_state.material.name) :
+                st.error("Sweeps vary the current material and factors, remove the element material and factor "
+                         "profile assignments first.")
+            elif st.session_state.forces_data and st.session_state.elements and st.session_state.sections and parameters :
+                try :
+                    grid = sweep_grid(values)
+                    with diagnostics.stage("sweep", rows=len(grid) * len(st.session_state.forces_data)) :
+                        st.session_state.sweep_df = sweep_governing(
+                            SectionArrays.from_sections(st.session_state.sections.values()),
+                            MemberArrays.from_members(st.session_state.elements.values(),
+                                                      st.session_state.support_area_values),
+                            st.session_state.forces_data.arrays,
+                            st.session_state.material,
+                            st.session_state.adjustment_factors,
+                            grid,
+                        )
+                except Exception as e :
+                    st.error(f"An error occurred during the sweep: {e}")
+            else :
+                st.error("Please ensure forces, sections, elements and at least one swept parameter are defined.")
+
+        sweep_df = st.session_state.sweep_df
+        if not sweep_df.empty :
+            swept = [column for column in sweep_df.columns if column not in ["member", "section", "dcr_max", "governing check"]]
+            st.write(f"{sweep_df[swept].drop_duplicates().shape[0]:,} grid points.")
+            choices = st.columns(4)
+            member = choices[0].selectbox("Element", list(pd.unique(sweep_df["member"])), key="sweep_member")
+            section = choices[1].selectbox("Section", list(pd.unique(sweep_df["section"])), key="sweep_section")
+            index = choices[2].selectbox("Rows", swept, key="sweep_index")
+            columns = choices[3].selectbox("Columns", ["(none)"] + [name for name in swept if name != index],
+                                           key="sweep_columns")
+            surface = sweep_surface(sweep_df, member, section, index, None if columns == "(none)" else columns)
+            if len(swept) > (1 if columns == "(none)" else 2) :
+                st.caption("Other parameters are reduced to their largest governing DCR.")
+            st.subheader("Governing DCR Surface")
+            if columns == "(none)" :
+                st.line_chart(surface)
+            else :
+                st.image(dcr_heatmap_png(surface, xlabel=columns, ylabel=index))
+            st.dataframe(surface)
+            st.download_button(
+                label="Download Sweep as CSV",
+                data=sweep_df.to_csv(sep=";", index=False),
+                file_name="sweep.csv",
+                mime="text/csv",
+            )
+
     elif selected_tab == "Download" :
         if not st.session_state.results_df.empty :
+            file_format = st.sidebar.radio("File format", ["CSV", "Arrow (columnar)"])
+            # Written straight into one binary buffer, instead of a CSV string plus its encoded copy.
+            buffer = io.BytesIO()
+            with diagnostics.stage(f"{file_format.split()[0].lower()} encoding", rows=len(st.session_state.results_df)), \
+                    results_writer(buffer, arrow=file_format != "CSV") as writer :
+                writer.write(st.session_state.results_df, st.session_state.results_forces)
+            buffer.seek(0)
             st.download_button(
-                label="Download Results as CSV",
-                data=st.session_state.results_df.to_csv(index=False, sep=';').encode('utf-8'),
-                file_name="results.csv",
-                mime="text/csv",
+                label=f"Download Results as {file_format.split()[0]}",
+                data=buffer,
+                file_name="results.csv" if file_format == "CSV" else "results.arrow",
+                mime="text/csv" if file_format == "CSV" else "application/vnd.apache.arrow.file",
             )
         else :
             st.write("No results available to download.")
 
+        previous_file = st.sidebar.file_uploader("Open a previous run (.arrow)", type=["arrow", "feather"])
+        if previous_file is not None :
+            previous = read_results_arrow(previous_file, memory_map=False)
+            st.write(f"Previous run: {len(previous):,} rows.")
+            if not st.session_state.results_df.empty :
+                st.dataframe(compare_results(previous, st.session_state.results_df))
+            else :
+                st.dataframe(previous)
+
+    elif selected_tab == "Diagnostics" :
+        st.header("Diagnostics")
+        st.write("Wall time, rows and throughput of every pipeline stage run in this session.")
+        track_memory = st.sidebar.checkbox("Track peak memory (tracemalloc)", value=diagnostics.track_memory,
+                                           help="Slows every stage down while enabled.")
+        diagnostics.set_track_memory(track_memory)
+        if st.sidebar.button("Clear diagnostics") :
+            diagnostics.clear()
+
+        if diagnostics.records :
+            st.subheader("Totals per stage")
+            st.dataframe(diagnostics.summary())
+            st.subheader("Stage runs")
+            st.dataframe(diagnostics.to_frame())
+            st.download_button(
+                label="Download Diagnostics as JSON",
+                data=diagnostics.to_json(),
+                file_name="diagnostics.json",
+                mime="application/json",
+            )
+        else :
+            st.write("No stages recorded yet.")
+
+        jobs = shared_job_queue().to_frame()
+        if not jobs.empty :
+            st.subheader("Shared job queue")
+            st.dataframe(jobs)
+
+        if diagnostics.profile_text :
+            st.subheader("Profile of the last profiled calculation")
+            st.code(diagnostics.profile_text)
 
 if __name__ == "__main__" :
     main()
@@ -0,0 +1,247 @@
+"""
+Pipeline benchmark on synthetic Robot bar-force exports.
+
+Generates exports in the Beams.csv format (';' separated, decimal commas) at the requested
+sizes and times every stage of the app's pipeline: CSV import, design checks, capacity table,
+DCR post-processing and export (CSV and Arrow). A sample of every file is also checked with
+the reference per-row engine (timber_nds.design.check_for_all_elements), and the run fails if
+any DCR differs.
+
+    python benchmarks/bench_pipeline.py --rows 1000 10000 100000 --sections 2 --elements 2
+    python benchmarks/bench_pipeline.py --rows 1000000 --compare
+
+Every run appends one record per configuration to benchmarks/results.jsonl, with the current
+commit, so timings can be compared across commits (--compare prints the change against the
+previous record of the same configuration).
+"""
+
+from typing import List, Optional
+import argparse
+import datetime
+import io
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from timber_nds.settings import WoodMaterial, RectangularSection, MemberDefinition
+from wood_design.cache import CapacityCache, join_capacities
+from wood_design.cli import check_project
+from wood_design.diagnostics import Diagnostics
+from wood_design.engine import DCR_COLUMNS, ForceArrays
+from wood_design.importers import import_robot_bar_forces_fast, import_robot_bar_forces_streaming
+from wood_design.postprocess import postprocess_results
+from wood_design.project import Project
+from wood_design.results_io import results_writer
+
+ROBOT_HEADER = "Member/Node/Case;FX (kgf);FY (kgf);FZ (kgf);MX (kgfcm);MY (kgfcm);MZ (kgfcm)\n"
+
+DEFAULT_RESULTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results.jsonl")
+
+
+def generate_robot_csv(path: str, rows: int, members: int = 100, seed: int = 0, chunk_rows: int = 200_000) :
+    """
+    Writes a synthetic Robot bar-force export.
+
+    Every member has two nodes and the load cases are numbered until the requested number of rows
+    is reached, so all labels are unique. Forces are drawn in the ranges of Beams.csv: axial and
+    shear forces up to a few hundred kgf, moments up to a few thousand kgfcm, about a third of them zero.
+    """
+    rng = np.random.default_rng(seed)
+    per_case = 2 * members
+    with open(path, "w", encoding="utf-8", newline="") as file :
+        file.write(ROBOT_HEADER)
+        for start in range(0, rows, chunk_rows) :
+            index = np.arange(start, min(rows, start + chunk_rows))
+            member = index % per_case // 2 + 1
+            node = 2 * member - 1 + index % 2
+            case = index // per_case + 1
+            scale = np.array([300.0, 150.0, 150.0, 50.0, 5000.0, 5000.0])
+            values = rng.normal(size=(len(index), 6)) * scale
+            values[rng.random(size=values.shape) < 0.3] = 0.0
+            frame = pd.DataFrame(values)
+            frame.insert(0, "label", [f" {m}/ {n}/ {c}" for m, n, c in zip(member, node, case)])
+            frame.to_csv(file, sep=";", decimal=",", float_format="%.2f", header=False, index=False)
+
+
+def synthetic_project(sections: int, elements: int) -> Project :
+    """
+    Project with the app's default material and factors and evenly spread section sizes and lengths.
+    """
+    material = WoodMaterial(
+        name="Teca G1", specific_gravity=0.58, fibre_saturation_point=30.0, tension_strength=84.0,
+        bending_strength=212.0, shear_strength=94.9, compression_perpendicular_strength=8.54,
+        compression_parallel_strength=81.4, elastic_modulus=127000.0, color="#8B4513",
+    )
+    list_sections = [
+        RectangularSection(name=f"S{i + 1}", width=5.0 + 2.5 * i, depth=7.5 + 5.0 * i) for i in range(sections)
+    ]
+    list_elements = [
+        MemberDefinition(name=f"E{i + 1}", length=200.0 + 50.0 * i,
+                         effective_length_factor_yy=1.0, effective_length_factor_zz=1.0)
+        for i in range(elements)
+    ]
+    support_area_values = {element.name : 100.0 for element in list_elements}
+    return Project(material, list_sections, list_elements, support_area_values=support_area_values)
+
+
+def sample_forces(forces: ForceArrays, size: int) -> ForceArrays :
+    index = np.linspace(0, len(forces) - 1, min(size, len(forces))).astype(int)
+    return ForceArrays(**{name : getattr(forces, name)[index] for name in forces.__dataclass_fields__})
+
+
+def check_equivalence(project: Project, forces: ForceArrays) -> dict :
+    """
+    Compares the vectorized engine with the reference per-row engine on the same forces.
+
+    Returns:
+        Rows compared, rows with any differing DCR and the largest absolute difference.
+    """
+    vectorized = check_project(project, forces, "vectorized")
+    reference = check_project(project, forces, "reference")
+    keys = ["member", "section", "force"]
+    merged = vectorized.merge(reference, on=keys, how="outer", suffixes=("", " reference"), indicator=True)
+    missing = int((merged["_merge"] != "both").sum())
+    current = merged[DCR_COLUMNS].to_numpy(dtype=float)
+    expected = merged[[f"{column} reference" for column in DCR_COLUMNS]].to_numpy(dtype=float)
+    same = (current == expected) | (np.isnan(current) & np.isnan(expected))
+    difference = np.abs(current - expected)
+    return {
+        "rows" : len(merged),
+        "mismatched rows" : int((~same.all(axis=1)).sum()) + missing,
+        "max abs difference" : float(np.nanmax(difference)) if np.isfinite(difference).any() else 0.0,
+    }
+
+
+def run_benchmark(path: str, project: Project, diagnostics: Diagnostics, parser: str, directory: str) :
+    with diagnostics.stage("import") as record :
+        if parser == "arrow" :
+            forces, _ = import_robot_bar_forces_fast(path)
+        else :
+            forces, _ = import_robot_bar_forces_streaming(path)
+        record.rows = len(forces)
+
+    with diagnostics.stage("check") as record :
+        results_df = check_project(project, forces, "vectorized")
+        record.rows = len(results_df)
+
+    with diagnostics.stage("capacities", rows=len(results_df)) :
+        capacity_table = CapacityCache().capacity_table(
+            material=project.material,
+            list_sections=project.sections,
+            list_elements=project.elements,
+            adjustment_factors=project.adjustment_factors,
+            support_area_values=project.support_area_values,
+        )
+        join_capacities(results_df, capacity_table)
+
+    with diagnostics.stage("post-processing", rows=len(results_df)) :
+        postprocess_results(results_df)
+
+    for name, suffix in [("export csv", ".csv"), ("export arrow", ".arrow")] :
+        with diagnostics.stage(name, rows=len(results_df)) :
+            with results_writer(os.path.join(directory, f"results{suffix}")) as writer :
+                writer.write(results_df, forces)
+    return forces
+
+
+def current_commit() -> Optional[str] :
+    try :
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError) :
+        return None
+
+
+def previous_record(path: str, config: dict, commit: Optional[str]) -> Optional[dict] :
+    if not os.path.exists(path) :
+        return None
+    previous = None
+    with open(path, "r", encoding="utf-8") as file :
+        for line in file :
+            record = json.loads(line)
+            if record.get("config") == config and record.get("commit") != commit :
+                previous = record
+    return previous
+
+
+def print_comparison(stages: dict, previous: dict) :
+    print(f"  compared with {previous['commit']} ({previous['date']}):")
+    for stage, seconds in stages.items() :
+        before = previous["stages"].get(stage)
+        if before :
+            print(f"    {stage:<16}{before:>10.3f} s ->{seconds:>10.3f} s{(seconds / before - 1) * 100:>+8.1f} %")
+
+
+def main(argv: Optional[List[str]] = None) -> int :
+    parser = argparse.ArgumentParser(description="Benchmark the wood_design pipeline on synthetic Robot exports.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000], help="Force rows per file.")
+    parser.add_argument("--sections", type=int, nargs="+", default=[2], help="Number of sections.")
+    parser.add_argument("--elements", type=int, nargs="+", default=[2], help="Number of elements.")
+    parser.add_argument("--members", type=int, default=100, help="Members in the generated exports.")
+    parser.add_argument("--parser", choices=["arrow", "pandas"], default="arrow", help="CSV reader.")
+    parser.add_argument("--reference-rows", type=int, default=200,
+                        help="Forces checked against the reference engine per configuration (0 to skip).")
+    parser.add_argument("--memory", action="store_true", help="Record peak memory (tracemalloc, slower).")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed of the generator.")
+    parser.add_argument("--results", default=DEFAULT_RESULTS, help="JSON lines file the records are appended to.")
+    parser.add_argument("--no-record", action="store_true", help="Do not append the records.")
+    parser.add_argument("--compare", action="store_true", help="Compare with the previous record of each configuration.")
+    args = parser.parse_args(argv)
+
+    commit = current_commit()
+    failed = False
+    with tempfile.TemporaryDirectory() as directory :
+        for rows in args.rows :
+            path = os.path.join(directory, f"forces_{rows}.csv")
+            generate_robot_csv(path, rows, members=args.members, seed=args.seed)
+            for sections, elements in itertools.product(args.sections, args.elements) :
+                config = {"rows" : rows, "sections" : sections, "elements" : elements,
+                          "members" : args.members, "parser" : args.parser, "seed" : args.seed}
+                print(f"{rows:,} forces, {sections} sections, {elements} elements")
+                project = synthetic_project(sections, elements)
+                diagnostics = Diagnostics(track_memory=args.memory)
+                forces = run_benchmark(path, project, diagnostics, args.parser, directory)
+                print("\n".join(f"  {line}" for line in diagnostics.report().splitlines()))
+
+                equivalence = None
+                if args.reference_rows :
+                    equivalence = check_equivalence(project, sample_forces(forces, args.reference_rows))
+                    status = "OK" if equivalence["mismatched rows"] == 0 else "MISMATCH"
+                    print(f"  reference check: {equivalence['rows']:,} rows, {equivalence['mismatched rows']} "
+                          f"mismatched, max abs difference {equivalence['max abs difference']:.3g} [{status}]")
+                    failed |= equivalence["mismatched rows"] > 0
+
+                summary = diagnostics.summary()
+                stages = dict(zip(summary["stage"], summary["seconds"].astype(float)))
+                if args.compare :
+                    previous = previous_record(args.results, config, commit)
+                    if previous is not None :
+                        print_comparison(stages, previous)
+                if not args.no_record :
+                    record = {
+                        "commit" : commit,
+                        "date" : datetime.datetime.now().isoformat(timespec="seconds"),
+                        "python" : platform.python_version(),
+                        "pandas" : pd.__version__,
+                        "numpy" : np.__version__,
+                        "config" : config,
+                        "stages" : stages,
+                        "peak_mb" : {stage : float(peak) for stage, peak in
+                                     zip(summary["stage"], summary["peak memory (MB)"]) if pd.notna(peak)},
+                        "equivalence" : equivalence,
+                    }
+                    with open(args.results, "a", encoding="utf-8") as file :
+                        file.write(json.dumps(record) + "\n")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__" :
+    sys.exit(main())
@@ -0,0 +1,71 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from timber_nds.settings import WoodMaterial, RectangularSection, MemberDefinition
+from wood_design.engine import SectionArrays, MemberArrays, combined_factors, factor_arguments
+from wood_design.importers import import_robot_bar_forces_fast
+from wood_design.project import Project, default_adjustment_factors
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ROBOT_HEADER = "Member/Node/Case;FX (kgf);FY (kgf);FZ (kgf);MX (kgfcm);MY (kgfcm);MZ (kgfcm)\n"
+
+
+@pytest.fixture(scope="session")
+def project() -> Project :
+    """
+    The app's default material and factors, two sections and two elements.
+    """
+    material = WoodMaterial(
+        name="Teca G1", specific_gravity=0.58, fibre_saturation_point=30.0, tension_strength=84.0,
+        bending_strength=212.0, shear_strength=94.9, compression_perpendicular_strength=8.54,
+        compression_parallel_strength=81.4, elastic_modulus=127000.0, color="#8B4513",
+    )
+    sections = [RectangularSection(name="2 x 3", width=5.08, depth=7.62),
+                RectangularSection(name="4 x 6", width=10.16, depth=15.24)]
+    elements = [MemberDefinition(name="Column 1", length=300.0, effective_length_factor_yy=1.0,
+                                 effective_length_factor_zz=1.0),
+                MemberDefinition(name="Beam 1", length=450.0, effective_length_factor_yy=0.8,
+                                 effective_length_factor_zz=1.0)]
+    return Project(material, sections, elements, adjustment_factors=default_adjustment_factors(),
+                   support_area_values={"Column 1" : 12.0, "Beam 1" : 40.0})
+
+
+@pytest.fixture(scope="session")
+def arrays(project) :
+    """
+    SectionArrays, MemberArrays and combined factors of the project.
+    """
+    return (SectionArrays.from_sections(project.sections),
+            MemberArrays.from_members(project.elements, project.support_area_values),
+            combined_factors(**factor_arguments(project.adjustment_factors)))
+
+
+@pytest.fixture(scope="session")
+def beams_forces() :
+    return import_robot_bar_forces_fast(os.path.join(ROOT, "Beams.csv"))[0]
+
+
+@pytest.fixture(scope="session")
+def synthetic_forces(tmp_path_factory) :
+    """
+    A few thousand forces in the Beams.csv format, with zero components, repeated extremes and negative values.
+    """
+    rng = np.random.default_rng(0)
+    rows, members = 4000, 10
+    index = np.arange(rows)
+    member = index % (2 * members) // 2 + 1
+    node = 2 * member - 1 + index % 2
+    case = index // (2 * members) + 1
+    values = rng.normal(size=(rows, 6)) * np.array([300.0, 150.0, 150.0, 50.0, 5000.0, 5000.0])
+    values[rng.random(size=values.shape) < 0.3] = 0.0
+    values[rng.random(size=rows) < 0.05] = 0.0
+    values[1000 :1010] = values[0]
+    frame = pd.DataFrame(values)
+    frame.insert(0, "label", [f" {m}/ {n}/ {c}" for m, n, c in zip(member, node, case)])
+    path = tmp_path_factory.mktemp("forces") / "synthetic.csv"
+    with open(path, "w", encoding="utf-8", newline="") as file :
+        file.write(ROBOT_HEADER)
+        frame.to_csv(file, sep=";", decimal=",", float_format="%.2f", header=False, index=False)
+    return import_robot_bar_forces_fast(str(path))[0]
@@ -0,0 +1,54 @@
+from dataclasses import replace
+import numpy as np
+import pytest
+from wood_design.cache import CapacityCache, compute_capacities, join_capacities
+from wood_design.engine import CAPACITY_COLUMNS, check_arrays, member_capacities, section_capacities
+
+
+def test_capacity_cache_hits_and_misses(project) :
+    cache = CapacityCache()
+    section = project.sections[0]
+    first = cache.get(project.material, section, project.adjustment_factors, 12.0)
+    assert first == compute_capacities(project.material, section, project.adjustment_factors, 12.0)
+    assert cache.get(project.material, replace(section, name="renamed"), project.adjustment_factors, 12.0) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    factors = {**project.adjustment_factors, "shear" : replace(project.adjustment_factors["shear"], due_moisture=0.5)}
+    changed = cache.get(project.material, section, factors, 12.0)
+    assert changed["shear_capacity"] != first["shear_capacity"]
+    cache.get(project.material, section, project.adjustment_factors, 40.0)
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_capacity_cache_evicts_least_recently_used(project) :
+    cache = CapacityCache(maxsize=2)
+    section = project.sections[0]
+    for support_area in [1.0, 2.0, 1.0, 3.0] :
+        cache.get(project.material, section, project.adjustment_factors, support_area)
+    assert len(cache) == 2
+    cache.get(project.material, section, project.adjustment_factors, 1.0)
+    assert cache.hits == 2
+    cache.get(project.material, section, project.adjustment_factors, 2.0)
+    assert cache.misses == 4
+    cache.clear()
+    assert len(cache) == 0 and cache.hits == cache.misses == 0
+    with pytest.raises(ValueError) :
+        CapacityCache(maxsize=0)
+
+
+def test_capacity_table_matches_the_engine(arrays, project, beams_forces) :
+    sections, members, combined = arrays
+    table = CapacityCache().capacity_table(project.material, project.sections, project.elements,
+                                           project.adjustment_factors, project.support_area_values)
+    assert list(table[["section", "member"]].itertuples(index=False, name=None)) == \
+        [(section.name, element.name) for section in project.sections for element in project.elements]
+    expected = section_capacities(sections, project.material, combined)
+    for column in CAPACITY_COLUMNS[:-1] :
+        np.testing.assert_allclose(table[column].to_numpy(), np.repeat(expected[column], len(members)), rtol=1e-12)
+    np.testing.assert_allclose(table["compression_perp_capacity"].to_numpy(),
+                               np.tile(member_capacities(members, project.material, combined)["compression_perp_capacity"],
+                                       len(sections)), rtol=1e-12)
+
+    results = check_arrays(sections, members, beams_forces, project.material, combined)
+    joined = join_capacities(results, table)
+    assert len(joined) == len(results) and set(CAPACITY_COLUMNS) <= set(joined.columns)
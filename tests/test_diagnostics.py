@@ -0,0 +1,103 @@
+import json
+import tracemalloc
+import pandas as pd
+import pytest
+from wood_design.diagnostics import DIAGNOSTICS_COLUMNS, Diagnostics
+
+MB = 2 ** 20
+
+
+@pytest.fixture
+def diagnostics() :
+    diagnostics = Diagnostics(track_memory=True)
+    yield diagnostics
+    diagnostics.set_track_memory(False)
+
+
+def test_nested_stage_peaks(diagnostics) :
+    with diagnostics.stage("outer") as outer :
+        buffer = bytearray(16 * MB)
+        del buffer
+        # The inner stage resets the global peak: the outer stage must keep the 16 MB it reached before.
+        with diagnostics.stage("inner") as inner :
+            buffer = bytearray(4 * MB)
+            del buffer
+        with diagnostics.stage("inner") as second :
+            pass
+
+    assert [record.stage for record in diagnostics.records] == ["inner", "inner", "outer"]
+    assert 4 * MB <= inner.peak_bytes < 16 * MB
+    assert second.peak_bytes < 4 * MB
+    assert outer.peak_bytes >= 16 * MB
+    assert outer.seconds >= inner.seconds + second.seconds
+
+
+def test_tracing_stops_with_memory_tracking(diagnostics) :
+    if tracemalloc.is_tracing() :
+        pytest.skip("tracemalloc already started outside the diagnostics")
+    with diagnostics.stage("import") :
+        pass
+    assert tracemalloc.is_tracing()
+    diagnostics.set_track_memory(False)
+    assert not tracemalloc.is_tracing()
+    with diagnostics.stage("check") as record :
+        pass
+    assert record.peak_bytes is None
+
+
+def test_failed_stage_is_recorded() :
+    diagnostics = Diagnostics()
+    with pytest.raises(RuntimeError) :
+        with diagnostics.stage("check", rows=10) :
+            raise RuntimeError("failed")
+    assert [(record.stage, record.rows) for record in diagnostics.records] == [("check", 10)]
+
+
+def test_summary_and_report() :
+    diagnostics = Diagnostics(max_records=4)
+    diagnostics.add("import", 0.5)
+    diagnostics.add("import", 2.0, rows=1000)
+    diagnostics.add("check", 1.0, rows=4000)
+    diagnostics.add("check", 3.0, rows=4000)
+    diagnostics.add("export", 0.25)
+    assert len(diagnostics.records) == 4
+    assert list(diagnostics.to_frame().columns) == DIAGNOSTICS_COLUMNS
+
+    summary = diagnostics.summary().set_index("stage")
+    assert list(summary.index) == ["import", "check", "export"]
+    assert summary.loc["import", "runs"] == 1
+    assert summary.loc["check", "seconds"] == 4.0
+    assert summary.loc["check", "rows"] == 8000
+    assert summary.loc["check", "rows/s"] == 2000.0
+    assert pd.isna(summary.loc["export", "rows"])
+    assert summary["peak memory (MB)"].isna().all()
+
+    lines = diagnostics.report().splitlines()
+    assert lines[0].split() == ["import", "2.000", "s", "1,000", "rows", "500", "rows/s"]
+    assert lines[1].split() == ["check", "4.000", "s", "8,000", "rows", "2,000", "rows/s"]
+    assert lines[2].split() == ["export", "0.250", "s"]
+
+
+def test_report_with_memory(diagnostics) :
+    with diagnostics.stage("check", rows=100) :
+        buffer = bytearray(2 * MB)
+        del buffer
+    line = diagnostics.report()
+    assert line.split()[-2 :] == ["MB", "peak"]
+    assert float(line.split()[-3]) >= 2.0
+
+
+def test_empty_summary_and_json() :
+    diagnostics = Diagnostics()
+    assert diagnostics.summary().empty
+    assert diagnostics.report() == ""
+
+    diagnostics.add("check", 2.0, rows=10, started=100.0)
+    with diagnostics.profile() :
+        sum(range(1000))
+    data = json.loads(diagnostics.to_json())
+    assert data["records"] == [{"stage" : "check", "seconds" : 2.0, "rows" : 10, "peak_bytes" : None,
+                                "started" : 100.0, "throughput" : 5.0}]
+    assert "cumulative" in data["profile"]
+    diagnostics.clear()
+    assert diagnostics.records == [] and diagnostics.profile_text is None
@@ -0,0 +1,138 @@
+from dataclasses import replace
+import json
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from wood_design.disk_cache import CACHE_FORMAT, MANIFEST, ResultCache, inputs_fingerprint
+
+
+def frames(rows: int = 100, seed: int = 0) -> dict :
+    rng = np.random.default_rng(seed)
+    results = pd.DataFrame({"member" : [f"M{i % 7}" for i in range(rows)], "dcr" : rng.random(rows)})
+    results.loc[3, "dcr"] = np.nan
+    return {"results" : results, "summary" : results.groupby("member", as_index=False)["dcr"].max()}
+
+
+def touch(cache: ResultCache, key: str, when: float) :
+    os.utime(os.path.join(cache.directory, key, MANIFEST), (when, when))
+
+
+def test_put_get_round_trip(tmp_path) :
+    cache = ResultCache(str(tmp_path))
+    assert cache.get("a") is None
+    stored = frames()
+    cache.put("a", stored)
+
+    loaded = cache.get("a")
+    assert set(loaded) == set(stored)
+    for name, frame in stored.items() :
+        pd.testing.assert_frame_equal(loaded[name], frame, check_dtype=False)
+    assert (cache.hits, cache.misses, cache.corrupted) == (1, 1, 0)
+    assert "a" in cache and len(cache) == 1
+
+
+def test_manifest_records_every_file(tmp_path) :
+    cache = ResultCache(str(tmp_path))
+    cache.put("a", frames())
+    with open(tmp_path / "a" / MANIFEST, encoding="utf-8") as file :
+        manifest = json.load(file)
+    assert manifest["format"] == CACHE_FORMAT
+    assert set(manifest["files"]) == {"results", "summary"}
+    for name, info in manifest["files"].items() :
+        assert os.path.getsize(tmp_path / "a" / f"{name}.arrow") == info["size"]
+    assert cache.size_bytes() == sum(info["size"] for info in manifest["files"].values())
+    # No staging directory is left behind.
+    assert sorted(os.listdir(tmp_path)) == ["a"]
+
+
+def test_put_keeps_the_first_entry(tmp_path) :
+    cache = ResultCache(str(tmp_path))
+    cache.put("a", frames(seed=0))
+    cache.put("a", frames(seed=1))
+    pd.testing.assert_frame_equal(cache.get("a")["results"], frames(seed=0)["results"], check_dtype=False)
+
+
+@pytest.mark.parametrize("damage", ["truncate", "flip", "delete", "manifest"])
+def test_corrupted_entry_is_a_miss(tmp_path, damage) :
+    cache = ResultCache(str(tmp_path))
+    cache.put("a", frames())
+    path = tmp_path / "a" / "results.arrow"
+    data = path.read_bytes()
+    if damage == "truncate" :
+        path.write_bytes(data[:-10])
+    elif damage == "flip" :
+        path.write_bytes(data[:100] + bytes([data[100] ^ 0xFF]) + data[101 :])
+    elif damage == "delete" :
+        path.unlink()
+    else :
+        (tmp_path / "a" / MANIFEST).write_text("{", encoding="utf-8")
+
+    assert cache.get("a") is None
+    assert "a" not in cache
+    if damage != "manifest" :
+        assert cache.corrupted == 1
+        assert not (tmp_path / "a").exists()
+    # A damaged entry is replaced by the next put.
+    cache.put("a", frames())
+    assert cache.get("a") is not None
+
+
+def test_evicts_least_recently_used_entries(tmp_path) :
+    cache = ResultCache(str(tmp_path), max_entries=3)
+    for i, key in enumerate("abc") :
+        cache.put(key, frames(seed=i))
+        touch(cache, key, 1000.0 + i)
+    # Reading 'a' makes 'b' the least recently used entry.
+    assert cache.get("a") is not None
+    cache.put("d", frames(seed=3))
+    assert sorted(cache.keys()) == ["a", "c", "d"]
+
+
+def test_evicts_beyond_max_bytes(tmp_path) :
+    cache = ResultCache(str(tmp_path))
+    for i, key in enumerate("abc") :
+        cache.put(key, frames(seed=i))
+        touch(cache, key, 1000.0 + i)
+    entry_size = cache.size_bytes() // 3
+
+    cache.max_bytes = 2 * entry_size + entry_size // 2
+    cache.evict()
+    assert sorted(cache.keys()) == ["b", "c"]
+    assert cache.size_bytes() <= cache.max_bytes
+
+    # Another cache instance on the same directory sees the same entries.
+    shared = ResultCache(str(tmp_path))
+    assert sorted(shared.keys()) == ["b", "c"]
+    shared.clear()
+    assert len(cache) == 0
+
+    with pytest.raises(ValueError) :
+        ResultCache(str(tmp_path), max_bytes=0)
+
+
+def test_inputs_fingerprint(project, beams_forces, synthetic_forces) :
+    def fingerprint(**changes) :
+        arguments = dict(material=project.material, list_sections=project.sections, list_elements=project.elements,
+                         adjustment_factors=project.adjustment_factors,
+                         support_area_values=project.support_area_values, forces=beams_forces)
+        arguments.update(changes)
+        return inputs_fingerprint(**arguments)
+
+    key = fingerprint()
+    assert fingerprint() == key
+    assert fingerprint(options={}) == key
+    # Support areas of elements that are not checked do not matter.
+    assert fingerprint(support_area_values={**project.support_area_values, "Other" : 5.0}) == key
+
+    changed = [
+        fingerprint(material=replace(project.material, bending_strength=200.0)),
+        fingerprint(list_sections=project.sections[: :-1]),
+        fingerprint(list_elements=[replace(project.elements[0], length=310.0), project.elements[1]]),
+        fingerprint(adjustment_factors={**project.adjustment_factors,
+                                        "shear" : replace(project.adjustment_factors["shear"], due_moisture=0.8)}),
+        fingerprint(support_area_values={**project.support_area_values, "Beam 1" : 41.0}),
+        fingerprint(forces=synthetic_forces),
+        fingerprint(options={"envelope" : True}),
+    ]
+    assert len({key, *changed}) == len(changed) + 1
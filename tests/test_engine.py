@@ -0,0 +1,66 @@
+from dataclasses import replace
+import numpy as np
+import pandas as pd
+import pytest
+from timber_nds.design import check_for_all_elements
+from wood_design.engine import DCR_COLUMNS, batch_check_for_all_elements, factor_arguments
+from wood_design.registry import ForceRegistry
+
+
+def check_arguments(project, forces) -> dict :
+    return dict(list_sections=project.sections, list_elements=project.elements,
+                list_forces=ForceRegistry(forces).values(), material=project.material,
+                support_area_values=project.support_area_values, **factor_arguments(project.adjustment_factors))
+
+
+def with_missing_values(forces) :
+    """
+    Beams.csv forces with empty cells, as pandas reads them (NaN), in every component.
+    """
+    columns = {key : value.copy() for key, value in forces.__dict__.items()}
+    for i, key in enumerate(["axial", "shear_y", "shear_z", "moment_xx", "moment_yy", "moment_zz"]) :
+        columns[key][i :: 5] = np.nan
+    return replace(forces, **columns)
+
+
+def assert_same_results(current, expected) :
+    # The reference keeps integer zeros in columns without any demand: compare values, not dtypes.
+    pd.testing.assert_frame_equal(current, expected, check_exact=True, check_dtype=False)
+
+
+def test_batch_check_matches_reference_on_beams(project, beams_forces) :
+    expected = check_for_all_elements(**check_arguments(project, beams_forces))
+    current = batch_check_for_all_elements(**check_arguments(project, beams_forces))
+    assert_same_results(current, expected)
+
+
+def test_batch_check_matches_reference_with_nan_forces(project, beams_forces) :
+    forces = with_missing_values(beams_forces)
+    expected = check_for_all_elements(**check_arguments(project, forces))
+    current = batch_check_for_all_elements(**check_arguments(project, forces))
+    assert expected[DCR_COLUMNS].isna().any().any()
+    assert_same_results(current, expected)
+
+
+def test_batch_check_matches_reference_on_synthetic_export(project, synthetic_forces) :
+    expected = check_for_all_elements(**check_arguments(project, synthetic_forces))
+    assert_same_results(batch_check_for_all_elements(**check_arguments(project, synthetic_forces)), expected)
+
+
+@pytest.mark.filterwarnings("ignore:divide by zero:RuntimeWarning")
+def test_batch_check_matches_reference_without_support_area(project, beams_forces) :
+    arguments = {**check_arguments(project, beams_forces), "support_area_values" : {"Column 1" : 0.0, "Beam 1" : 40.0}}
+    assert_same_results(batch_check_for_all_elements(**arguments), check_for_all_elements(**arguments))
+
+
+def test_batch_check_accepts_force_arrays(project, beams_forces) :
+    arguments = check_arguments(project, beams_forces)
+    expected = batch_check_for_all_elements(**arguments)
+    current = batch_check_for_all_elements(**{**arguments, "list_forces" : beams_forces})
+    pd.testing.assert_frame_equal(current, expected, check_exact=True)
+
+
+def test_batch_check_empty_inputs(project, beams_forces) :
+    arguments = check_arguments(project, beams_forces)
+    assert batch_check_for_all_elements(**{**arguments, "list_forces" : []}).empty
+    assert batch_check_for_all_elements(**{**arguments, "list_sections" : []}).empty
@@ -0,0 +1,72 @@
+from dataclasses import replace
+import numpy as np
+import pandas as pd
+import pytest
+from wood_design.engine import check_arrays
+from wood_design.envelope import (
+    dominated_mask,
+    governing_dcr,
+    reduce_envelope,
+    verify_envelope,
+)
+
+
+def brute_force_dominated(demands: np.ndarray, groups: np.ndarray) -> np.ndarray :
+    """
+    dominated_mask by its definition, comparing every pair of rows.
+    """
+    dominated = np.zeros(len(demands), dtype=bool)
+    finite = ~np.isnan(demands).any(axis=1)
+    for i in np.flatnonzero(finite) :
+        for j in np.flatnonzero(finite & (groups == groups[i])) :
+            if j != i and (demands[j] >= demands[i]).all() and ((demands[j] > demands[i]).any() or j < i) :
+                dominated[i] = True
+                break
+    return dominated
+
+
+@pytest.fixture(scope="module")
+def demands() :
+    rng = np.random.default_rng(1)
+    demands = rng.integers(0, 4, size=(600, 4)).astype(float)
+    demands[::37, 2] = np.nan
+    return demands
+
+
+@pytest.mark.parametrize("small_group, max_block", [(256, 20_000_000), (0, 20_000_000), (0, 50), (16, 50)])
+def test_dominated_mask_matches_brute_force(demands, small_group, max_block) :
+    groups = np.repeat(["1/1", "1/2", "2/3"], [20, 80, 500])
+    expected = brute_force_dominated(demands, groups)
+    current = dominated_mask(demands, groups, max_block=max_block, small_group=small_group)
+    np.testing.assert_array_equal(current, expected)
+
+
+def full_and_reduced(arrays, project, forces) :
+    sections, members, combined = arrays
+    reduction = reduce_envelope(forces)
+    full = check_arrays(sections, members, forces, project.material, combined)
+    reduced = check_arrays(sections, members, reduction.forces, project.material, combined)
+    return reduction, full, reduced
+
+
+@pytest.mark.parametrize("forces_fixture", ["beams_forces", "synthetic_forces"])
+def test_reduce_envelope_keeps_governing_rows(request, arrays, project, forces_fixture) :
+    forces = request.getfixturevalue(forces_fixture)
+    reduction, full, reduced = full_and_reduced(arrays, project, forces)
+    assert verify_envelope(full, reduced)
+    pd.testing.assert_frame_equal(governing_dcr(reduced), governing_dcr(full), check_exact=True)
+
+    # The reduced run is the full run restricted to the kept forces, so its governing rows are rows of the full run.
+    blocks = np.arange(len(full) // len(forces))[:, None] * len(forces)
+    kept_rows = full.iloc[(blocks + reduction.kept_index).ravel()].reset_index(drop=True)
+    pd.testing.assert_frame_equal(reduced, kept_rows, check_exact=True)
+    assert reduction.rows_out < reduction.rows_in
+
+
+def test_reduce_envelope_keeps_forces_with_missing_values(arrays, project, synthetic_forces) :
+    moment_yy = synthetic_forces.moment_yy.copy()
+    moment_yy[::97] = np.nan
+    forces = replace(synthetic_forces, moment_yy=moment_yy)
+    reduction, full, reduced = full_and_reduced(arrays, project, forces)
+    assert np.isin(np.flatnonzero(np.isnan(moment_yy)), reduction.kept_index).all()
+    pd.testing.assert_frame_equal(governing_dcr(reduced), governing_dcr(full), check_exact=True)
@@ -0,0 +1,89 @@
+import io
+import os
+import numpy as np
+import pytest
+from timber_nds.calculation import import_robot_bar_forces, create_robot_bar_forces_as_objects
+from wood_design.engine import ForceArrays
+from wood_design.importers import (
+    import_robot_bar_forces_fast,
+    import_robot_bar_forces_streaming,
+    iter_robot_bar_forces_fast,
+)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def beams_text(variant: str) -> bytes :
+    """
+    Beams.csv, with a '.' thousands separator in the last row or a short row in the middle.
+    """
+    with open(os.path.join(ROOT, "Beams.csv"), encoding="utf-8") as file :
+        lines = file.read().splitlines()
+    if variant == "thousands" :
+        cells = lines[-1].split(";")
+        cells[5] = "1.234,56"
+        lines[-1] = ";".join(cells)
+    elif variant == "short" :
+        lines[8] = ";".join(lines[8].split(";")[:4])
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def assert_same_forces(current: ForceArrays, expected: ForceArrays) :
+    for key, value in expected.__dict__.items() :
+        np.testing.assert_array_equal(getattr(current, key), value)
+
+
+@pytest.fixture(params=["plain", "thousands", "short"])
+def export(request, tmp_path) :
+    data = beams_text(request.param)
+    path = tmp_path / f"{request.param}.csv"
+    path.write_bytes(data)
+    return data, str(path)
+
+
+@pytest.mark.parametrize("source", ["path", "buffer"])
+def test_import_fast_matches_pandas_import(export, source) :
+    data, path = export
+    expected, expected_summary = import_robot_bar_forces_streaming(io.BytesIO(data))
+    forces, summary = import_robot_bar_forces_fast(path if source == "path" else io.BytesIO(data))
+    assert_same_forces(forces, expected)
+    assert summary.rows == expected_summary.rows and summary.members == expected_summary.members
+
+
+@pytest.mark.parametrize("source", ["path", "buffer"])
+def test_iter_fast_yields_every_row_once(export, source) :
+    data, path = export
+    expected, _ = import_robot_bar_forces_streaming(io.BytesIO(data))
+    # Small blocks, so the parse error of a late row comes after batches were yielded.
+    chunks = [forces for forces, _, _ in iter_robot_bar_forces_fast(path if source == "path" else io.BytesIO(data),
+                                                                     block_size=256)]
+    assert len(chunks) > 1
+    assert_same_forces(ForceArrays.concatenate(chunks), expected)
+
+
+def test_import_fast_filters_with_the_pandas_fallback() :
+    data = beams_text("short")
+    forces, summary = import_robot_bar_forces_fast(io.BytesIO(data), members=["2"], cases=["4"])
+    assert len(forces) and all(name.startswith("2/") and name.split("/")[4] == "4" for name in forces.names)
+    assert summary.rows == len(forces)
+
+
+@pytest.mark.parametrize("chunksize", [1, 3, 100_000])
+def test_streaming_import_matches_the_reference_import(chunksize) :
+    path = os.path.join(ROOT, "Beams.csv")
+    expected = ForceArrays.from_forces(create_robot_bar_forces_as_objects(import_robot_bar_forces(path)))
+    forces, summary = import_robot_bar_forces_streaming(path, chunksize=chunksize)
+    assert_same_forces(forces, expected)
+    assert summary.rows == len(expected) and summary.chunks == -(-len(expected) // chunksize)
+    assert summary.members == {name.split("/")[0] + "/" for name in expected.names}
+    assert summary.cases == {name.split("/")[4] for name in expected.names}
+    envelope = summary.envelope()
+    assert envelope.loc["moment_zz", "min"] == expected.moment_zz.min()
+    assert envelope.loc["shear_z", "max"] == expected.shear_z.max()
+
+
+def test_streaming_import_errors() :
+    with pytest.raises(ValueError) :
+        import_robot_bar_forces_streaming(os.path.join(ROOT, "Beams.csv"), chunksize=0)
+    with pytest.raises(ValueError, match="Missing columns") :
+        import_robot_bar_forces_streaming(io.BytesIO(b"Member/Node/Case;FX (kgf)\n 1/ 1/ 1;0,0\n"))
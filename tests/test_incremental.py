@@ -0,0 +1,90 @@
+from dataclasses import replace
+import pandas as pd
+import pytest
+from wood_design.engine import SECTION_DCR_COLUMNS, MEMBER_DCR_COLUMNS, batch_check_for_all_elements, factor_arguments
+from wood_design.incremental import IncrementalChecker
+
+
+def check_arguments(project, forces, **changes) -> dict :
+    arguments = dict(list_sections=project.sections, list_elements=project.elements, list_forces=forces,
+                     material=project.material, support_area_values=project.support_area_values,
+                     **factor_arguments(project.adjustment_factors))
+    arguments.update(changes)
+    return arguments
+
+
+@pytest.fixture
+def checker(project, beams_forces) :
+    checker = IncrementalChecker()
+    checker.check_for_all_elements(**check_arguments(project, beams_forces))
+    return checker
+
+
+def assert_matches_batch(checker, arguments) :
+    current = checker.check_for_all_elements(**arguments)
+    pd.testing.assert_frame_equal(current, batch_check_for_all_elements(**arguments), check_exact=True)
+
+
+def test_first_run_and_new_forces_recompute_everything(project, beams_forces, synthetic_forces) :
+    checker = IncrementalChecker()
+    assert_matches_batch(checker, check_arguments(project, beams_forces))
+    assert checker.plan.full
+
+    assert_matches_batch(checker, check_arguments(project, beams_forces))
+    assert checker.plan.is_empty()
+    assert checker.plan.describe() == "No input changed, results reused."
+
+    assert_matches_batch(checker, check_arguments(project, synthetic_forces))
+    assert checker.plan.full
+
+
+def test_factor_change_recomputes_only_dependent_columns(project, beams_forces, checker) :
+    factors = dict(project.adjustment_factors)
+    factors["shear"] = replace(factors["shear"], due_moisture=0.8)
+    assert_matches_batch(checker, check_arguments(project, beams_forces, **factor_arguments(factors)))
+
+    names = [section.name for section in project.sections]
+    recomputed = {column for column, sections in checker.plan.sections.items() if sections}
+    assert recomputed == {"shear y (dcr)", "shear z (dcr)"}
+    assert checker.plan.sections["shear y (dcr)"] == names
+    assert checker.plan.members == []
+
+
+def test_section_change_recomputes_only_that_section(project, beams_forces, checker) :
+    sections = [project.sections[0], replace(project.sections[1], width=12.0)]
+    assert_matches_batch(checker, check_arguments(project, beams_forces, list_sections=sections))
+    assert {tuple(names) for names in checker.plan.sections.values()} == {(sections[1].name,)}
+    assert set(checker.plan.sections) == set(SECTION_DCR_COLUMNS)
+    assert checker.plan.members == []
+
+    sections.append(replace(project.sections[0], name="3 x 8", depth=20.32))
+    assert_matches_batch(checker, check_arguments(project, beams_forces, list_sections=sections))
+    assert all(names == ["3 x 8"] for names in checker.plan.sections.values())
+
+
+def test_support_area_change_recomputes_only_that_member(project, beams_forces, checker) :
+    support_areas = {**project.support_area_values, "Beam 1" : 55.0}
+    assert_matches_batch(checker, check_arguments(project, beams_forces, support_area_values=support_areas))
+    assert checker.plan.members == ["Beam 1"]
+    assert not any(checker.plan.sections.values())
+    assert checker.plan.describe() == f"Recomputed {', '.join(MEMBER_DCR_COLUMNS)}: Beam 1."
+
+
+def test_material_change(project, beams_forces, checker) :
+    material = replace(project.material, compression_perpendicular_strength=10.0)
+    assert_matches_batch(checker, check_arguments(project, beams_forces, material=material))
+    assert checker.plan.members == [element.name for element in project.elements]
+    assert not any(checker.plan.sections.values())
+
+    material = replace(material, bending_strength=180.0)
+    assert_matches_batch(checker, check_arguments(project, beams_forces, material=material))
+    recomputed = {column for column, sections in checker.plan.sections.items() if sections}
+    assert recomputed == {"biaxial bending (dcr)", "bending and compression (dcr)"}
+    assert checker.plan.members == []
+
+
+def test_reordered_inputs_reuse_every_slice(project, beams_forces, checker) :
+    arguments = check_arguments(project, beams_forces, list_elements=project.elements[: :-1],
+                                list_sections=project.sections[: :-1])
+    assert_matches_batch(checker, arguments)
+    assert checker.plan.is_empty()
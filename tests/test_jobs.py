@@ -0,0 +1,95 @@
+import threading
+import time
+import pandas as pd
+import pytest
+from wood_design.engine import batch_check_for_all_elements, factor_arguments
+from wood_design.jobs import JobQueue, run_check_job
+from wood_design.registry import ForceRegistry
+
+
+@pytest.fixture
+def queue() :
+    queue = JobQueue(max_workers=1)
+    yield queue
+    queue.shutdown()
+
+
+def check_kwargs(project) -> dict :
+    return dict(list_sections=project.sections, list_elements=project.elements, material=project.material,
+                support_area_values=project.support_area_values, **factor_arguments(project.adjustment_factors))
+
+
+def blocking_job(started: threading.Event, release: threading.Event) :
+    def function(job) :
+        started.set()
+        release.wait(10)
+        return "released"
+    return function
+
+
+@pytest.mark.parametrize("chunk_size", [7, 333, 4000, 10_000])
+def test_chunked_check_job_matches_single_run(queue, project, synthetic_forces, chunk_size) :
+    expected = batch_check_for_all_elements(list_forces=synthetic_forces, **check_kwargs(project))
+    job = queue.submit(lambda job : run_check_job(job, batch_check_for_all_elements, synthetic_forces,
+                                                  chunk_size=chunk_size, **check_kwargs(project)),
+                       key=f"chunks {chunk_size}", owner="a", total=len(synthetic_forces))
+    assert job.wait(60) and job.status == "done"
+    pd.testing.assert_frame_equal(job.result, expected, check_exact=True)
+    assert job.fraction == 1.0 and job.progress.n == len(synthetic_forces)
+
+
+def test_chunked_check_job_with_forces_objects(queue, project, beams_forces) :
+    list_forces = ForceRegistry(beams_forces).values()
+    expected = batch_check_for_all_elements(list_forces=list_forces, **check_kwargs(project))
+    job = queue.submit(lambda job : run_check_job(job, batch_check_for_all_elements, list_forces, chunk_size=5,
+                                                  **check_kwargs(project)), key="objects", owner="a")
+    assert job.wait(60) and job.status == "done"
+    pd.testing.assert_frame_equal(job.result, expected, check_exact=True)
+
+
+def test_cancel_queued_job(queue) :
+    started, release = threading.Event(), threading.Event()
+    running = queue.submit(blocking_job(started, release), key="running", owner="a")
+    assert started.wait(10)
+    queued = queue.submit(lambda job : "never", key="queued", owner="b")
+    assert queued.status == "queued"
+    assert queue.cancel(queued)
+    assert queued.wait(10) and queued.status == "cancelled" and queued.result is None
+    release.set()
+    assert running.wait(10) and running.result == "released"
+    assert queue._owner_slots == {} and queue._owner_jobs == {}
+
+
+def test_cancel_running_job(queue) :
+    started = threading.Event()
+
+    def function(job) :
+        started.set()
+        while True :
+            job.update(1)
+            time.sleep(0.01)
+
+    job = queue.submit(function, key="running", owner="a", total=10_000)
+    assert started.wait(10)
+    assert queue.cancel(job)
+    assert job.wait(10) and job.status == "cancelled"
+    assert queue.to_frame().set_index("id").loc[job.id, "status"] == "cancelled"
+
+
+def test_cancel_before_the_loop_starts_the_job(queue) :
+    # Keep the loop busy so the job is withdrawn by its only owner before _start runs.
+    queue._loop.call_soon_threadsafe(time.sleep, 0.5)
+    job = queue.submit(lambda job : "never", key="late", owner="a")
+    assert queue.cancel(job, owner="a")
+    assert job.wait(10) and job.status == "cancelled"
+    assert queue.to_frame().set_index("id").loc[job.id, "status"] == "cancelled"
+    assert queue._owner_slots == {}
+
+
+def test_identical_jobs_are_shared_until_every_owner_withdraws(queue) :
+    started, release = threading.Event(), threading.Event()
+    job = queue.submit(blocking_job(started, release), key="same", owner="a")
+    assert queue.submit(lambda job : "other", key="same", owner="b") is job
+    assert not queue.cancel(job, owner="a")
+    release.set()
+    assert job.wait(10) and job.status == "done" and job.owners == {"b"}
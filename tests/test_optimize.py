@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+from wood_design.engine import DCR_COLUMNS, MEMBER_DCR_COLUMNS, MemberArrays, SectionArrays, check_arrays
+from wood_design.optimize import optimize_sections, sort_catalog
+
+INCHES = 2.54
+
+
+@pytest.fixture(scope="module")
+def catalog() -> SectionArrays :
+    """
+    Nominal sizes from 2 x 3 to 12 x 16, out of weight order.
+    """
+    sizes = [(8, 12), (2, 3), (6, 8), (12, 16), (4, 6), (3, 4), (10, 14), (4, 4), (6, 10), (8, 8)]
+    return SectionArrays(names=np.array([f"{b} x {d}" for b, d in sizes], dtype=object),
+                         width=np.array([b * INCHES for b, _ in sizes], dtype=float),
+                         depth=np.array([d * INCHES for _, d in sizes], dtype=float))
+
+
+@pytest.fixture(scope="module")
+def members(project) -> MemberArrays :
+    """
+    The project's members on supports large enough for compression perpendicular to pass.
+    """
+    return MemberArrays.from_members(project.elements, {"Column 1" : 100.0, "Beam 1" : 100.0})
+
+
+def lightest_passing(catalog, members, forces, material, combined, limit, member_forces=None) -> dict :
+    """
+    Brute force: checks every section of the catalog and keeps the lightest one within the limit.
+    """
+    results = check_arrays(catalog, members, forces, material, combined)
+    results["dcr_max"] = results[DCR_COLUMNS].max(axis=1)
+    results["force_index"] = np.tile(np.arange(len(forces)), len(catalog) * len(members))
+    if member_forces is not None :
+        keep = [index in member_forces[member] for member, index in zip(results["member"], results["force_index"])]
+        results = results[keep]
+    governing = results.groupby(["member", "section"], sort=False)["dcr_max"].max()
+    area = dict(zip(catalog.names, catalog.width * catalog.depth))
+    best = {}
+    for (member, section), dcr_max in governing.items() :
+        if dcr_max <= limit and (member not in best or area[section] < area[best[member][0]]) :
+            best[member] = (section, dcr_max)
+    return best
+
+
+def test_sort_catalog(catalog) :
+    ordered = sort_catalog(catalog)
+    assert list(ordered.names[:3]) == ["2 x 3", "3 x 4", "4 x 4"]
+    assert (np.diff(ordered.width * ordered.depth) >= 0).all()
+    assert list(sort_catalog(catalog, cost=-np.arange(len(catalog))).names) == list(catalog.names[::-1])
+
+
+@pytest.mark.parametrize("block_size", [1, 100, 4096])
+def test_lightest_passing_section(catalog, members, arrays, project, synthetic_forces, block_size) :
+    _, _, combined = arrays
+    table = optimize_sections(catalog, members, synthetic_forces, project.material, combined, block_size=block_size)
+    expected = lightest_passing(catalog, members, synthetic_forces, project.material, combined, 1.0)
+
+    assert list(table["member"]) == list(members.names)
+    assert set(expected) == set(members.names)
+    for row in table.to_dict("records") :
+        assert row["status"] == "OK"
+        assert row["section"] == expected[row["member"]][0]
+        assert row["dcr_max"] == pytest.approx(expected[row["member"]][1])
+
+
+def test_member_forces(catalog, members, arrays, project, synthetic_forces) :
+    _, _, combined = arrays
+    member_forces = {"Column 1" : np.arange(0, 50), "Beam 1" : np.arange(50, len(synthetic_forces))}
+    table = optimize_sections(catalog, members, synthetic_forces, project.material, combined,
+                              member_forces=member_forces)
+    expected = lightest_passing(catalog, members, synthetic_forces, project.material, combined, 1.0,
+                                member_forces={key : set(value.tolist()) for key, value in member_forces.items()})
+    for row in table.to_dict("records") :
+        assert row["section"] == expected[row["member"]][0]
+        assert row["dcr_max"] == pytest.approx(expected[row["member"]][1])
+        assert row["governing force"] in synthetic_forces.names[member_forces[row["member"]]]
+
+
+def test_no_section_passes(members, arrays, project, synthetic_forces) :
+    _, _, combined = arrays
+    catalog = SectionArrays(names=np.array(["2 x 2", "2 x 3"], dtype=object),
+                            width=np.array([2 * INCHES, 2 * INCHES]), depth=np.array([2 * INCHES, 3 * INCHES]))
+    table = optimize_sections(catalog, members, synthetic_forces, project.material, combined,
+                              cost=np.array([2.0, 1.0]))
+    assert (table["status"] == "no section passes").all()
+    assert table["section"].isna().all()
+    # 2 x 3 is checked first and fails; 2 x 2 is weaker in every capacity and is skipped.
+    assert (table["sections checked"] == 1).all()
+
+
+def test_compression_perpendicular_has_no_solution(catalog, project, synthetic_forces, arrays) :
+    _, _, combined = arrays
+    members = MemberArrays.from_members(project.elements, {"Column 1" : 12.0, "Beam 1" : 100.0})
+    table = optimize_sections(catalog, members, synthetic_forces, project.material, combined).set_index("member")
+    assert table.loc["Column 1", "status"] == "compression perpendicular exceeds limit"
+    assert table.loc["Column 1", "governing check"] == MEMBER_DCR_COLUMNS[0]
+    assert table.loc["Column 1", "sections checked"] == 0
+    assert table.loc["Beam 1", "status"] == "OK"
+
+
+def test_block_size_must_be_positive(catalog, members, arrays, project, synthetic_forces) :
+    _, _, combined = arrays
+    with pytest.raises(ValueError) :
+        optimize_sections(catalog, members, synthetic_forces, project.material, combined, block_size=0)
@@ -0,0 +1,74 @@
+from functools import partial
+from multiprocessing.shared_memory import SharedMemory
+import numpy as np
+import pandas as pd
+import pytest
+from wood_design.engine import (
+    DCR_COLUMNS,
+    batch_check_for_all_elements,
+    check_arrays,
+    factor_arguments,
+    section_capacities,
+    member_capacities,
+)
+from wood_design.parallel import (
+    FORCE_MATRIX_FIELDS,
+    _check_partition,
+    parallel_check_arrays,
+    parallel_check_for_all_elements,
+    partition_bounds,
+)
+
+
+@pytest.mark.parametrize("partition", ["section", "member"])
+@pytest.mark.parametrize("workers", [1, 2, 3])
+def test_parallel_check_matches_check_arrays(arrays, project, synthetic_forces, partition, workers) :
+    sections, members, combined = arrays
+    expected = check_arrays(sections, members, synthetic_forces, project.material, combined)
+    current = parallel_check_arrays(sections, members, synthetic_forces, project.material, combined,
+                                    workers=workers, partition=partition)
+    pd.testing.assert_frame_equal(current, expected, check_exact=True)
+
+
+def test_parallel_check_for_all_elements_matches_batch_check(project, beams_forces) :
+    arguments = dict(list_sections=project.sections, list_elements=project.elements, list_forces=beams_forces,
+                     material=project.material, support_area_values=project.support_area_values,
+                     **factor_arguments(project.adjustment_factors))
+    check = partial(parallel_check_for_all_elements, workers=2, partition="member")
+    pd.testing.assert_frame_equal(check(**arguments), batch_check_for_all_elements(**arguments), check_exact=True)
+
+
+def test_partition_bounds_cover_every_item() :
+    assert partition_bounds(5, 2) == [(0, 2), (2, 5)]
+    assert partition_bounds(2, 4) == [(0, 1), (1, 2)]
+    with pytest.raises(ValueError) :
+        parallel_check_arrays(None, None, None, None, None, partition="force")
+
+
+def test_worker_writes_its_partition_in_place(arrays, project, synthetic_forces) :
+    sections, members, combined = arrays
+    capacities = section_capacities(sections, project.material, combined)
+    capacities.update(member_capacities(members, project.material, combined))
+    capacities["compression_perp_capacity"] = capacities["compression_perp_capacity"][1 :]
+    shape = (len(DCR_COLUMNS), len(sections), len(members), len(synthetic_forces))
+    memory = SharedMemory(create=True, size=int(np.prod(shape)) * 8)
+    try :
+        output = np.ndarray(shape, dtype=np.float64, buffer=memory.buf)
+        output[:] = -1.0
+        rows = _check_partition({
+            "capacities" : capacities,
+            "forces" : np.column_stack([getattr(synthetic_forces, key) for key in FORCE_MATRIX_FIELDS]),
+            "output" : memory.name,
+            "shape" : shape,
+            "index" : (slice(None), slice(1, None)),
+        })
+        assert rows == len(sections) * (len(members) - 1) * len(synthetic_forces)
+        expected = check_arrays(sections, members, synthetic_forces, project.material, combined)
+        for i, column in enumerate(DCR_COLUMNS) :
+            values = expected[column].to_numpy().reshape(shape[1 :])
+            np.testing.assert_array_equal(output[i, :, 1 :], values[:, 1 :])
+            assert (output[i, :, 0] == -1.0).all()
+        del output
+    finally :
+        memory.close()
+        memory.unlink()
@@ -0,0 +1,131 @@
+import numpy as np
+import pandas as pd
+import pytest
+from wood_design.engine import DCR_COLUMNS, check_arrays
+from wood_design.postprocess import (
+    GOVERNING_COLUMNS,
+    MEMBER_SUMMARY_COLUMNS,
+    governing_dcr_columns,
+    member_summary,
+    page_positions,
+    postprocess_results,
+    query_results,
+)
+
+
+@pytest.fixture(scope="module")
+def results_df(arrays, project, synthetic_forces) -> pd.DataFrame :
+    sections, members, combined = arrays
+    return check_arrays(sections, members, synthetic_forces, project.material, combined)
+
+
+def test_governing_dcr_columns_match_row_wise_max(results_df) :
+    governing = governing_dcr_columns(results_df)
+    np.testing.assert_array_equal(governing["dcr_max"], results_df[DCR_COLUMNS].max(axis=1))
+    # Ties go to the first DCR column, as with idxmax.
+    assert list(governing["governing check"]) == list(results_df[DCR_COLUMNS].idxmax(axis=1))
+
+
+def test_governing_dcr_columns_ignore_nan() :
+    frame = pd.DataFrame([[np.nan, 0.5, 0.2], [np.nan, np.nan, np.nan], [0.1, np.nan, 0.3]],
+                         columns=DCR_COLUMNS[:3], index=[10, 11, 12])
+    governing = governing_dcr_columns(frame)
+    assert list(governing.index) == [10, 11, 12]
+    np.testing.assert_array_equal(governing["dcr_max"], [0.5, np.nan, 0.3])
+    assert list(governing["governing check"].isna()) == [False, True, False]
+    assert list(governing["governing check"].dropna()) == [DCR_COLUMNS[1], DCR_COLUMNS[2]]
+
+
+def test_governing_rows_per_member_and_force(results_df) :
+    processed = postprocess_results(results_df)
+    results = processed.results
+    assert list(results.columns[:5]) == ["member", "section", "force", "dcr_max", "governing check"]
+    pd.testing.assert_frame_equal(results.drop(columns=["dcr_max", "governing check"]), results_df)
+
+    for key, table in [("member", processed.by_member), ("force", processed.by_force)] :
+        index = results.groupby(key, sort=False)["dcr_max"].idxmax()
+        expected = results.loc[index, GOVERNING_COLUMNS].reset_index(drop=True)
+        pd.testing.assert_frame_equal(table, expected)
+    assert list(processed.by_force["force"]) == list(pd.unique(results_df["force"]))
+
+
+def test_member_summary(results_df) :
+    results = postprocess_results(results_df).results
+    summary = member_summary(results, limit=0.5)
+    assert list(summary.columns) == MEMBER_SUMMARY_COLUMNS
+
+    rows = []
+    for (member, section), group in results.groupby(["member", "section"], sort=False) :
+        governing = group.loc[group["dcr_max"].idxmax()]
+        rows.append([member, section, governing["dcr_max"], governing["governing check"], governing["force"],
+                     len(group), int((group["dcr_max"] > 0.5).sum())])
+    expected = pd.DataFrame(rows, columns=MEMBER_SUMMARY_COLUMNS)
+    # Members first, in results order, then their sections.
+    expected = expected.sort_values("member", key=lambda member : member.map(
+        {name : i for i, name in enumerate(pd.unique(results["member"]))}), kind="stable").reset_index(drop=True)
+    pd.testing.assert_frame_equal(summary, expected, check_dtype=False)
+    assert summary["forces over limit"].sum() > 0
+
+
+def test_postprocess_results_recomputes_governing_columns(results_df) :
+    once = postprocess_results(results_df).results
+    twice = postprocess_results(once).results
+    pd.testing.assert_frame_equal(twice, once)
+
+
+def test_postprocess_empty_results() :
+    processed = postprocess_results(pd.DataFrame())
+    assert processed.results.empty
+    assert list(processed.by_member.columns) == GOVERNING_COLUMNS
+    assert list(processed.member_summary.columns) == MEMBER_SUMMARY_COLUMNS
+
+
+@pytest.fixture(scope="module")
+def results(results_df) -> pd.DataFrame :
+    results = postprocess_results(results_df).results
+    results.loc[results.index[::50], "dcr_max"] = np.nan
+    return results
+
+
+def test_query_results_filters_and_sorts(results) :
+    positions = query_results(results, members=["Beam 1"], min_dcr=0.2)
+    expected = results[(results["member"] == "Beam 1") & (results["dcr_max"] >= 0.2)]
+    expected = expected.sort_values("dcr_max", ascending=False, kind="stable")
+    pd.testing.assert_frame_equal(results.iloc[positions], expected)
+
+    positions = query_results(results, sort_by="force", ascending=True)
+    pd.testing.assert_frame_equal(results.iloc[positions], results.sort_values("force", kind="stable"))
+
+    positions = query_results(results, sort_by=None)
+    np.testing.assert_array_equal(positions, np.arange(len(results)))
+
+
+def test_query_results_puts_missing_values_last(results) :
+    for ascending in [False, True] :
+        positions = query_results(results, ascending=ascending)
+        values = results["dcr_max"].to_numpy()[positions]
+        missing = int(results["dcr_max"].isna().sum())
+        assert np.isnan(values[-missing :]).all()
+        steps = np.diff(values[:-missing])
+        assert (steps >= 0).all() if ascending else (steps <= 0).all()
+
+
+@pytest.mark.parametrize("ascending", [False, True])
+@pytest.mark.parametrize("top_n", [1, 25, 10 ** 6])
+def test_query_results_top_n_matches_full_sort(results, top_n, ascending) :
+    positions = query_results(results, top_n=top_n, ascending=ascending)
+    full = query_results(results, ascending=ascending)
+    assert len(positions) == min(top_n, len(results))
+    # The partial selection may break ties differently, not the values.
+    np.testing.assert_array_equal(results["dcr_max"].to_numpy()[positions],
+                                  results["dcr_max"].to_numpy()[full[:top_n]])
+
+
+def test_page_positions() :
+    positions = np.arange(100, 125)
+    np.testing.assert_array_equal(page_positions(positions, 1, 10), np.arange(100, 110))
+    np.testing.assert_array_equal(page_positions(positions, 3, 10), np.arange(120, 125))
+    np.testing.assert_array_equal(page_positions(positions, 0, 10), np.arange(100, 110))
+    assert len(page_positions(positions, 4, 10)) == 0
+    pages = [page_positions(positions, page, 7) for page in range(1, 5)]
+    np.testing.assert_array_equal(np.concatenate(pages), positions)
@@ -0,0 +1,61 @@
+from dataclasses import replace
+import os
+import pandas as pd
+import pytest
+from wood_design.cli import check_project, main
+from wood_design.engine import check_arrays, combined_factors, factor_arguments
+from wood_design.profiles import DEFAULT_PROFILE
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def weak_project(project) :
+    """
+    The test project with every element using one non-default material.
+    """
+    weak = replace(project.material, name="Weak", tension_strength=8.4, bending_strength=21.2, shear_strength=9.49)
+    return replace(project, materials={"Weak" : weak},
+                   member_materials={element.name : "Weak" for element in project.elements})
+
+
+def test_single_non_default_profile_is_mixed(project, weak_project) :
+    assert not project.member_profiles().mixed(project.material.name)
+    profiles = weak_project.member_profiles()
+    assert len(profiles) == 1 and profiles.labels == [("Weak", DEFAULT_PROFILE)]
+    assert profiles.mixed(weak_project.material.name)
+
+
+def test_single_non_default_profile_is_checked_with_its_material(arrays, weak_project, beams_forces) :
+    sections, members, combined = arrays
+    expected = check_arrays(sections, members, beams_forces, weak_project.materials["Weak"], combined)
+    pd.testing.assert_frame_equal(check_project(weak_project, beams_forces), expected, check_exact=True)
+
+
+def test_single_non_default_factor_profile(project, arrays, beams_forces) :
+    sections, members, _ = arrays
+    factors = {**project.adjustment_factors, "tension" : replace(project.adjustment_factors["tension"], due_moisture=0.5)}
+    wet = replace(project, factor_profiles={"Wet" : factors},
+                  member_factor_profiles={element.name : "Wet" for element in project.elements})
+    expected = check_arrays(sections, members, beams_forces, project.material,
+                            combined_factors(**factor_arguments(factors)))
+    pd.testing.assert_frame_equal(check_project(wet, beams_forces), expected, check_exact=True)
+
+
+@pytest.mark.parametrize("engine", ["parallel", "reference"])
+def test_other_engines_refuse_a_single_non_default_profile(weak_project, beams_forces, engine) :
+    with pytest.raises(ValueError, match="vectorized engine") :
+        check_project(weak_project, beams_forces, engine)
+
+
+def test_sweep_command_refuses_a_single_non_default_profile(tmp_path, capsys) :
+    project_file = tmp_path / "project.toml"
+    project_file.write_text(
+        '[material]\nname = "Pine"\n\n'
+        '[[materials]]\nname = "Weak"\ntension_strength = 8.4\n\n'
+        '[[sections]]\nname = "2 x 3"\nwidth = 5.08\ndepth = 7.62\n\n'
+        '[[elements]]\nname = "Column 1"\nlength = 300.0\nsupport_area = 12.0\nmaterial = "Weak"\n'
+    )
+    status = main(["sweep", str(project_file), os.path.join(ROOT, "Beams.csv"), "--param", "due_moisture=0.8,1.0",
+                   "-o", str(tmp_path / "sweep.csv")])
+    assert status == 1 and "must not reference other profiles" in capsys.readouterr().err
@@ -0,0 +1,41 @@
+from dataclasses import replace
+import numpy as np
+from wood_design.engine import ForceArrays
+from wood_design.registry import ForceRegistry
+
+
+def test_force_registry_keeps_repeated_names(beams_forces) :
+    registry = ForceRegistry(beams_forces)
+    registry.extend(beams_forces)
+    assert len(registry) == 2 * len(beams_forces)
+    assert registry.names() == list(beams_forces.names) * 2
+    assert registry.index_of(beams_forces.names[3]) == 3
+    values = registry.values()
+    np.testing.assert_array_equal([forces.axial for forces in values], np.tile(beams_forces.axial, 2))
+    assert registry.at(len(beams_forces) + 3).name == registry.get(beams_forces.names[3]).name
+
+
+def test_force_registry_from_forces_round_trips(beams_forces) :
+    registry = ForceRegistry.from_forces(ForceRegistry(beams_forces).values())
+    for key, value in beams_forces.__dict__.items() :
+        np.testing.assert_array_equal(getattr(registry.arrays, key), value)
+    assert registry.get("missing") is None and "missing" not in registry
+    assert len(ForceRegistry(ForceArrays.from_forces([]))) == 0
+
+
+def test_force_registry_reports_repeated_names(beams_forces) :
+    registry = ForceRegistry(beams_forces)
+    assert registry.repeated_names() == [] and registry.repeated_rows() == 0
+    shifted = replace(beams_forces, axial=beams_forces.axial + 1.0)
+    registry.extend(ForceArrays(**{key : value[:3] for key, value in shifted.__dict__.items()}))
+    assert registry.repeated_names() == list(beams_forces.names[:3])
+    assert registry.repeated_rows() == 3
+
+
+def test_force_registry_get_returns_the_first_row_on_purpose(beams_forces) :
+    shifted = replace(beams_forces, axial=beams_forces.axial + 1.0)
+    registry = ForceRegistry(ForceArrays.concatenate([beams_forces, shifted]))
+    name = beams_forces.names[5]
+    assert registry.get(name).axial == beams_forces.axial[5]
+    assert registry.index_of(name) == 5
+    assert registry.at(len(beams_forces) + 5).axial == shifted.axial[5]
@@ -0,0 +1,48 @@
+from dataclasses import replace
+import io
+import numpy as np
+import pandas as pd
+import pytest
+from wood_design.engine import ForceArrays, check_arrays
+from wood_design.envelope import reduce_envelope
+from wood_design.results_io import export_frame, write_results_csv
+
+
+def test_csv_matches_to_csv_byte_for_byte(arrays, project, beams_forces) :
+    sections, members, combined = arrays
+    results = check_arrays(sections, members, beams_forces, project.material, combined)
+    expected = export_frame(results, beams_forces).to_csv(sep=";", index=False)
+    assert write_results_csv(results, None, beams_forces) == expected
+
+
+def test_csv_float_formatting_round_trips() :
+    rng = np.random.default_rng(0)
+    values = 10 ** rng.uniform(-12, 20, 2000) * rng.choice([-1.0, 1.0], 2000)
+    values[::7] = np.round(values[::7])
+    values[:6] = [4.534978894806515e-06, 0.0, -0.0, np.nan, np.inf, 1e16]
+    results = pd.DataFrame({"member" : "1", "section" : "2 x 3", "force" : "1//1//1/nan", "tension (dcr)" : values})
+    text = write_results_csv(results, None)
+    assert text == export_frame(results).to_csv(sep=";", index=False)
+    reloaded = pd.read_csv(io.StringIO(text), sep=";", float_precision="round_trip")
+    np.testing.assert_array_equal(reloaded["tension (dcr)"].to_numpy(), values)
+
+
+def test_export_lines_demands_up_by_position(arrays, project, beams_forces) :
+    sections, members, combined = arrays
+    forces = ForceArrays.concatenate([beams_forces, replace(beams_forces, axial=beams_forces.axial + 1.0)])
+    reduced = reduce_envelope(forces).forces
+    results = check_arrays(sections, members, reduced, project.material, combined)
+    export = export_frame(results, reduced)
+    expected = np.tile(np.where(reduced.axial > 0, reduced.axial, 0.0), len(sections) * len(members))
+    np.testing.assert_array_equal(export["axial tension"].to_numpy(), expected)
+    with pytest.raises(ValueError) :
+        export_frame(results, forces)
+
+
+def test_export_with_repeated_force_names(arrays, project, beams_forces) :
+    sections, members, combined = arrays
+    forces = ForceArrays.concatenate([beams_forces, replace(beams_forces, shear_y=beams_forces.shear_y * 2.0)])
+    results = check_arrays(sections, members, forces, project.material, combined)
+    export = export_frame(results, forces)
+    expected = np.tile(np.abs(forces.shear_y), len(sections) * len(members))
+    np.testing.assert_array_equal(export["shear y"].to_numpy(), expected)
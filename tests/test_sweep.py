@@ -0,0 +1,75 @@
+from dataclasses import replace
+import numpy as np
+import pandas as pd
+import pytest
+from wood_design.engine import check_arrays, combined_factors, factor_arguments
+from wood_design.postprocess import postprocess_results
+from wood_design.sweep import SWEEP_COLUMNS, apply_point, sweep_governing, sweep_grid, sweep_parameters, sweep_surface
+
+GRID = {
+    "due_moisture" : [0.7, 0.85, 1.0],
+    "bending_yy.due_temperature" : [0.8, 1.0],
+    "compression_perpendicular_strength" : [4.0, 8.54],
+    "shear_strength" : [60.0, 94.9],
+}
+
+
+def brute_force(arrays, project, forces, grid) -> pd.DataFrame :
+    """
+    Governing DCR of every member and section at every point, from a full calculation per point.
+    """
+    sections, members, _ = arrays
+    summaries = []
+    for point in grid.to_dict("records") :
+        material, factors = apply_point(project.material, project.adjustment_factors, point)
+        results = check_arrays(sections, members, forces, material, combined_factors(**factor_arguments(factors)))
+        summary = postprocess_results(results).member_summary
+        summary = summary.set_index(["section", "member"]).loc[
+            pd.MultiIndex.from_product([sections.names, members.names])].reset_index()
+        summaries.append(summary.assign(**point))
+    return pd.concat(summaries, ignore_index=True)[list(grid.columns) + SWEEP_COLUMNS]
+
+
+@pytest.mark.parametrize("max_block", [20_000_000, 1])
+def test_sweep_matches_full_check_at_every_point(arrays, project, synthetic_forces, max_block) :
+    sections, members, _ = arrays
+    grid = sweep_grid(GRID)
+    current = sweep_governing(sections, members, synthetic_forces, project.material, project.adjustment_factors,
+                              grid, max_block=max_block)
+    expected = brute_force(arrays, project, synthetic_forces, grid)
+    pd.testing.assert_frame_equal(current, expected, check_exact=True, check_dtype=False)
+
+
+def test_sweep_matches_full_check_with_missing_values(arrays, project, beams_forces) :
+    sections, members, _ = arrays
+    moment_zz = beams_forces.moment_zz.copy()
+    moment_zz[::3] = np.nan
+    forces = replace(beams_forces, moment_zz=moment_zz)
+    grid = sweep_grid({"bending_strength" : [150.0, 212.0], "tension.due_moisture" : [0.9, 1.0]})
+    current = sweep_governing(sections, members, forces, project.material, project.adjustment_factors, grid)
+    pd.testing.assert_frame_equal(current, brute_force(arrays, project, forces, grid), check_exact=True,
+                                  check_dtype=False)
+
+
+def test_apply_point_leaves_the_inputs_unchanged(project) :
+    factors = project.adjustment_factors
+    material, point_factors = apply_point(project.material, factors, {"due_moisture" : 0.5, "tension_strength" : 1.0})
+    assert material.tension_strength == 1.0 and project.material.tension_strength != 1.0
+    assert all(point_factors[factor_type].due_moisture == 0.5 for factor_type in point_factors
+               if "due_moisture" in point_factors[factor_type].__dict__)
+    assert all(factors[factor_type].due_moisture != 0.5 for factor_type in factors
+               if "due_moisture" in factors[factor_type].__dict__)
+    assert "tension.due_moisture" in sweep_parameters(factors)
+    with pytest.raises(ValueError) :
+        apply_point(project.material, factors, {"unknown" : 1.0})
+
+
+def test_sweep_surface(arrays, project, beams_forces) :
+    sections, members, _ = arrays
+    grid = sweep_grid({"due_moisture" : [0.8, 1.0], "shear_strength" : [60.0, 80.0, 94.9]})
+    table = sweep_governing(sections, members, beams_forces, project.material, project.adjustment_factors, grid)
+    surface = sweep_surface(table, "Column 1", "2 x 3", "due_moisture", "shear_strength")
+    assert surface.shape == (2, 3)
+    rows = table[(table["member"] == "Column 1") & (table["section"] == "2 x 3")]
+    point = rows[(rows["due_moisture"] == 0.8) & (rows["shear_strength"] == 60.0)]
+    assert surface.loc[0.8, 60.0] == point["dcr_max"].item()
@@ -0,0 +1,59 @@
+"""
+Batch design-check engine for the wood_design Streamlit app.
+"""
+
+from .engine import (
+    FACTOR_TYPES,
+    FACTOR_ARGUMENTS,
+    DCR_COLUMNS,
+    SECTION_DCR_COLUMNS,
+    MEMBER_DCR_COLUMNS,
+    RESULT_COLUMNS,
+    CAPACITY_COLUMNS,
+    DCR_DEPENDENCIES,
+    ForceArrays,
+    SectionArrays,
+    MemberArrays,
+    factor_arguments,
+    combined_factors,
+    section_capacities,
+    member_capacities,
+    section_dcr_arrays,
+    member_dcr_arrays,
+    expand_dcr_arrays,
+    dcr_arrays,
+    check_arrays,
+    results_frame,
+    profile_capacities,
+    profile_dcr_arrays,
+    check_profile_arrays,
+    batch_check_for_all_elements,
+)
+
+__all__ = [
+    "FACTOR_TYPES",
+    "FACTOR_ARGUMENTS",
+    "DCR_COLUMNS",
+    "SECTION_DCR_COLUMNS",
+    "MEMBER_DCR_COLUMNS",
+    "RESULT_COLUMNS",
+    "CAPACITY_COLUMNS",
+    "DCR_DEPENDENCIES",
+    "ForceArrays",
+    "SectionArrays",
+    "MemberArrays",
+    "factor_arguments",
+    "combined_factors",
+    "section_capacities",
+    "member_capacities",
+    "section_dcr_arrays",
+    "member_dcr_arrays",
+    "expand_dcr_arrays",
+    "dcr_arrays",
+    "check_arrays",
+    "results_frame",
+    "profile_capacities",
+    "profile_dcr_arrays",
+    "check_profile_arrays",
+    "batch_check_for_all_elements",
+]
@@ -0,0 +1,149 @@
+from collections import OrderedDict
+from dataclasses import astuple
+from typing import Dict, Hashable, List, Tuple
+import pandas as pd
+from timber_nds.design import WoodElementCalculator
+from timber_nds.calculation import RectangularSectionProperties
+from timber_nds.settings import WoodMaterial, RectangularSection, MemberDefinition
+from wood_design.engine import FACTOR_TYPES, CAPACITY_COLUMNS
+
+
+def capacity_key(
+        material: WoodMaterial,
+        section: RectangularSection,
+        adjustment_factors: dict,
+        support_area: float,
+) -> Tuple :
+    """
+    Builds a hashable fingerprint of everything a section capacity depends on.
+
+    Args:
+        material: Wood material.
+        section: Rectangular section (only its dimensions enter the key).
+        adjustment_factors: Dictionary of adjustment factor dataclasses keyed by FACTOR_TYPES.
+        support_area: Support area used for compression perpendicular to grain.
+
+    Returns:
+        A tuple usable as a dictionary key.
+    """
+    return (
+        astuple(material),
+        (float(section.width), float(section.depth)),
+        tuple(astuple(adjustment_factors[factor_type]) for factor_type in FACTOR_TYPES),
+        float(support_area),
+    )
+
+
+def compute_capacities(
+        material: WoodMaterial,
+        section: RectangularSection,
+        adjustment_factors: dict,
+        support_area: float,
+) -> Dict[str, float] :
+    """
+    Computes the seven section capacities with WoodElementCalculator.
+
+    Returns:
+        A dictionary keyed by CAPACITY_COLUMNS.
+    """
+    wood_calculator = WoodElementCalculator(
+        tension_factors=adjustment_factors["tension"],
+        bending_factors_yy=adjustment_factors["bending_yy"],
+        bending_factors_zz=adjustment_factors["bending_zz"],
+        shear_factors=adjustment_factors["shear"],
+        compression_factors_yy=adjustment_factors["compression_yy"],
+        compression_factors_zz=adjustment_factors["compression_zz"],
+        compression_perp_factors=adjustment_factors["compression_perp"],
+        elastic_modulus_factors=adjustment_factors["elastic_modulus"],
+        material_properties=material,
+        section_properties=RectangularSectionProperties(width=section.width, depth=section.depth),
+    )
+    return {
+        "tension_capacity" : wood_calculator.tension_strength(),
+        "bending_yy_capacity" : wood_calculator.bending_strength("yy"),
+        "bending_zz_capacity" : wood_calculator.bending_strength("zz"),
+        "shear_capacity" : wood_calculator.shear_strength(),
+        "compression_yy_capacity" : wood_calculator.compression_strength("yy"),
+        "compression_zz_capacity" : wood_calculator.compression_strength("zz"),
+        "compression_perp_capacity" : wood_calculator.compression_perp_strength(support_area),
+    }
+
+
+class CapacityCache :
+    """
+    Memoizes section capacities with least-recently-used eviction.
+
+    Args:
+        maxsize: Maximum number of capacity sets kept in memory.
+
+    Assumptions:
+        - Capacities only depend on material, section dimensions, adjustment factors
+          and support area, never on the forces.
+    """
+
+    def __init__(self, maxsize: int = 1024) :
+        if maxsize <= 0 :
+            raise ValueError("maxsize must be a positive integer.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Dict[str, float]]" = OrderedDict()
+
+    def __len__(self) -> int :
+        return len(self._entries)
+
+    def get(
+            self,
+            material: WoodMaterial,
+            section: RectangularSection,
+            adjustment_factors: dict,
+            support_area: float,
+    ) -> Dict[str, float] :
+        key = capacity_key(material, section, adjustment_factors, support_area)
+        if key in self._entries :
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        self.misses += 1
+        capacities = compute_capacities(material, section, adjustment_factors, support_area)
+        self._entries[key] = capacities
+        if len(self._entries) > self.maxsize :
+            self._entries.popitem(last=False)
+        return capacities
+
+    def clear(self) :
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def capacity_table(
+            self,
+            material: WoodMaterial,
+            list_sections: List[RectangularSection],
+            list_elements: List[MemberDefinition],
+            adjustment_factors: dict,
+            support_area_values: dict,
+    ) -> pd.DataFrame :
+        """
+        Builds one capacity row per (member, section) pair, ready to be joined on results.
+
+        Returns:
+            A DataFrame with columns member, section and CAPACITY_COLUMNS.
+        """
+        rows = []
+        for section in list_sections :
+            for element in list_elements :
+                support_area = support_area_values.get(element.name, 1.0)
+                row = {"member" : element.name, "section" : section.name}
+                row.update(self.get(material, section, adjustment_factors, support_area))
+                rows.append(row)
+        return pd.DataFrame(rows, columns=["member", "section"] + CAPACITY_COLUMNS)
+
+
+def join_capacities(results_df: pd.DataFrame, capacities_df: pd.DataFrame) -> pd.DataFrame :
+    """
+    Joins a capacity table onto a results table by member and section.
+    """
+    capacities_df = capacities_df.drop_duplicates(subset=["member", "section"], keep="first")
+    return results_df.merge(capacities_df, on=["member", "section"], how="inner", sort=False)
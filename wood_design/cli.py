@@ -0,0 +1,289 @@
+"""
+Headless batch runner: runs the design checks of a project file on a Robot bar-force export
+and writes the results in the Beams_results.csv format, or as an Arrow file for .arrow/.feather outputs.
+
+    python -m wood_design run project.toml forces.csv -o results.csv
+    python -m wood_design sweep project.toml forces.csv --param due_moisture=0.7:1.0:7 -o sweep.csv
+
+Only the engine modules are imported, never Streamlit or matplotlib.
+"""
+
+from contextlib import nullcontext
+from typing import List, Optional
+import argparse
+import sys
+import numpy as np
+import pandas as pd
+from wood_design.engine import (
+    ForceArrays,
+    SectionArrays,
+    MemberArrays,
+    combined_factors,
+    factor_arguments,
+    profile_capacities,
+    profile_dcr_arrays,
+    check_profile_arrays,
+    results_frame,
+)
+from wood_design.importers import (
+    iter_robot_bar_forces,
+    iter_robot_bar_forces_fast,
+    import_robot_bar_forces_streaming,
+    import_robot_bar_forces_fast,
+)
+from wood_design.diagnostics import Diagnostics
+from wood_design.project import Project, load_project
+from wood_design.results_io import results_writer
+from wood_design.sweep import sweep_grid, sweep_governing
+
+ENGINES = ["vectorized", "parallel", "reference"]
+
+
+def check_project(project: Project, forces: ForceArrays, engine: str = "vectorized",
+                  workers: Optional[int] = None, partition: str = "section") -> pd.DataFrame :
+    """
+    Runs the design checks of a project with one of the app's engines.
+
+    Args:
+        project: Material, sections, elements, factors and support areas.
+        forces: Forces as column arrays.
+        engine: "vectorized", "parallel" or "reference" (timber_nds.design.check_for_all_elements).
+        workers, partition: Options of the parallel engine.
+
+    Returns:
+        The results table with RESULT_COLUMNS.
+    """
+    if engine not in ENGINES :
+        raise ValueError(f"engine must be one of {', '.join(ENGINES)}.")
+    profiles = project.member_profiles()
+    if engine != "vectorized" and profiles.mixed(project.material.name) :
+        raise ValueError("Elements with different materials or factor profiles need the vectorized engine.")
+    if engine == "reference" :
+        from timber_nds.design import check_for_all_elements
+        from wood_design.registry import ForceRegistry
+        return check_for_all_elements(
+            list_sections=project.sections,
+            list_elements=project.elements,
+            list_forces=ForceRegistry(forces).values(),
+            material=project.material,
+            support_area_values=project.support_area_values,
+            **factor_arguments(project.adjustment_factors),
+        )
+
+    sections = SectionArrays.from_sections(project.sections)
+    members = MemberArrays.from_members(project.elements, project.support_area_values)
+    if engine == "parallel" :
+        from wood_design.parallel import parallel_check_arrays
+        combined = combined_factors(**factor_arguments(project.adjustment_factors))
+        return parallel_check_arrays(sections, members, forces, project.material, combined,
+                                     workers=workers, partition=partition)
+    return check_profile_arrays(sections, members, forces, profiles.materials, profiles.combined,
+                                profiles.member_profile)
+
+
+def run_streaming(project: Project, args: argparse.Namespace, diagnostics: Diagnostics) -> int :
+    """
+    Imports, checks and writes one chunk of forces at a time, so memory stays bounded
+    by the chunk size whatever the size of the export.
+
+    Returns:
+        Number of result rows written.
+    """
+    sections = SectionArrays.from_sections(project.sections)
+    members = MemberArrays.from_members(project.elements, project.support_area_values)
+    profiles = project.member_profiles()
+    capacities = profile_capacities(sections, members, profiles.materials, profiles.combined, profiles.member_profile)
+
+    if args.parser == "arrow" :
+        chunks = iter_robot_bar_forces_fast(args.forces, encoding=args.encoding, members=args.members, cases=args.cases)
+    else :
+        chunks = iter_robot_bar_forces(args.forces, chunksize=args.chunksize, encoding=args.encoding)
+    with results_writer(args.output) as writer :
+        while True :
+            with diagnostics.stage("import") as record :
+                chunk = next(chunks, None)
+                record.rows = 0 if chunk is None else len(chunk[0])
+            if chunk is None :
+                break
+            forces = chunk[0]
+
+            with diagnostics.stage("check") as record :
+                results_df = results_frame(sections, members, forces,
+                                           profile_dcr_arrays(capacities, profiles.member_profile, forces))
+                record.rows = len(results_df)
+
+            with diagnostics.stage("export", rows=len(results_df)) :
+                writer.write(results_df, forces)
+    return writer.rows
+
+
+def run_stages(project: Project, args: argparse.Namespace, diagnostics: Diagnostics) -> int :
+    """
+    Imports, checks and writes the results, streaming when the engine allows it.
+
+    Returns:
+        Number of result rows written.
+    """
+    if args.engine == "vectorized" and not args.envelope :
+        return run_streaming(project, args, diagnostics)
+
+    with diagnostics.stage("import") as record :
+        if args.parser == "arrow" :
+            forces, _ = import_robot_bar_forces_fast(args.forces, encoding=args.encoding,
+                                                     members=args.members, cases=args.cases)
+        else :
+            forces, _ = import_robot_bar_forces_streaming(args.forces, chunksize=args.chunksize, encoding=args.encoding)
+        record.rows = len(forces)
+
+    if args.envelope :
+        from wood_design.envelope import reduce_envelope
+        with diagnostics.stage("envelope", rows=len(forces)) :
+            reduction = reduce_envelope(forces)
+        print(f"Envelope pre-filter kept {reduction.rows_out:,} of {reduction.rows_in:,} forces.")
+        forces = reduction.forces
+
+    with diagnostics.stage("check") as record :
+        results_df = check_project(project, forces, args.engine, args.workers, args.partition)
+        record.rows = len(results_df)
+
+    with diagnostics.stage("export", rows=len(results_df)) :
+        with results_writer(args.output) as writer :
+            writer.write(results_df, forces)
+    return len(results_df)
+
+
+def run(args: argparse.Namespace) -> int :
+    """
+    Entry point of the 'run' command.
+    """
+    project = load_project(args.project)
+    if not project.sections or not project.elements :
+        print("The project must define at least one section and one element.", file=sys.stderr)
+        return 1
+
+    if args.parser == "pandas" and (args.members or args.cases) :
+        print("--members and --cases need the Arrow reader.", file=sys.stderr)
+        return 1
+
+    diagnostics = Diagnostics(track_memory=args.memory)
+    with diagnostics.profile() if args.profile else nullcontext() :
+        written = run_stages(project, args, diagnostics)
+
+    print(diagnostics.report())
+    if args.profile :
+        print(diagnostics.profile_text)
+    if args.diagnostics :
+        with open(args.diagnostics, "w", encoding="utf-8") as file :
+            file.write(diagnostics.to_json())
+    print(f"Wrote {written:,} result rows to {args.output}.")
+    return 0
+
+
+def parse_sweep_values(text: str) -> tuple :
+    """
+    Parses 'name=start:stop:count' (evenly spaced values) or 'name=v1,v2,...'.
+    """
+    name, separator, values = text.partition("=")
+    if not separator or not name or not values :
+        raise argparse.ArgumentTypeError(f"expected name=start:stop:count or name=v1,v2,..., got '{text}'")
+    try :
+        if ":" in values :
+            start, stop, count = values.split(":")
+            return name, np.linspace(float(start), float(stop), int(count))
+        return name, [float(value) for value in values.split(",")]
+    except ValueError :
+        raise argparse.ArgumentTypeError(f"invalid values in '{text}'")
+
+
+def sweep(args: argparse.Namespace) -> int :
+    """
+    Entry point of the 'sweep' command.
+    """
+    project = load_project(args.project)
+    if not project.sections or not project.elements :
+        print("The project must define at least one section and one element.", file=sys.stderr)
+        return 1
+    if project.member_profiles().mixed(project.material.name) :
+        print("Sweeps vary the main material and factors, elements must not reference other profiles.", file=sys.stderr)
+        return 1
+
+    diagnostics = Diagnostics(track_memory=args.memory)
+    with diagnostics.stage("import") as record :
+        forces, _ = import_robot_bar_forces_fast(args.forces, encoding=args.encoding,
+                                                 members=args.members, cases=args.cases)
+        record.rows = len(forces)
+
+    grid = sweep_grid(dict(args.param))
+    with diagnostics.stage("sweep") as record :
+        table = sweep_governing(
+            SectionArrays.from_sections(project.sections),
+            MemberArrays.from_members(project.elements, project.support_area_values),
+            forces,
+            project.material,
+            project.adjustment_factors,
+            grid,
+        )
+        record.rows = len(grid) * len(forces)
+
+    with diagnostics.stage("export", rows=len(table)) :
+        table.to_csv(args.output, sep=";", index=False)
+    print(diagnostics.report())
+    print(f"Wrote the governing DCRs of {len(grid):,} grid points to {args.output}.")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser :
+    parser = argparse.ArgumentParser(prog="python -m wood_design", description="Wood design checks without the Streamlit app.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the design checks of a project on a Robot bar-force export.")
+    run_parser.add_argument("project", help="Project TOML file (material, sections, elements, adjustment factors).")
+    run_parser.add_argument("forces", help="Robot bar-force CSV export.")
+    run_parser.add_argument("-o", "--output", default="results.csv", help="Results file, CSV or Arrow (.arrow/.feather) (default: results.csv).")
+    run_parser.add_argument("--engine", choices=ENGINES, default="vectorized", help="Design check engine.")
+    run_parser.add_argument("--workers", type=int, default=None, help="Worker processes of the parallel engine.")
+    run_parser.add_argument("--partition", choices=["section", "member"], default="section",
+                            help="Axis split across workers by the parallel engine.")
+    run_parser.add_argument("--parser", choices=["arrow", "pandas"], default="arrow",
+                            help="CSV reader: the multi-threaded Arrow reader or the pandas reader.")
+    run_parser.add_argument("--members", type=lambda value : value.split(","), default=None,
+                            help="Comma-separated member numbers to import (Arrow reader only).")
+    run_parser.add_argument("--cases", type=lambda value : value.split(","), default=None,
+                            help="Comma-separated load case numbers to import (Arrow reader only).")
+    run_parser.add_argument("--chunksize", type=int, default=100_000, help="Rows parsed per chunk by the pandas reader.")
+    run_parser.add_argument("--encoding", default=None, help="Text encoding of the export.")
+    run_parser.add_argument("--envelope", action="store_true",
+                            help="Check only the candidate governing forces of every member and node.")
+    run_parser.add_argument("--memory", action="store_true",
+                            help="Report the peak memory of every stage (tracemalloc, slows the run down).")
+    run_parser.add_argument("--profile", action="store_true", help="Print a cProfile of the run.")
+    run_parser.add_argument("--diagnostics", default=None, metavar="JSON",
+                            help="Write the stage timings (and profile) to a JSON file.")
+    run_parser.set_defaults(handler=run)
+
+    sweep_parser = commands.add_parser("sweep", help="Governing DCRs over a grid of adjustment factors and material strengths.")
+    sweep_parser.add_argument("project", help="Project TOML file (material, sections, elements, adjustment factors).")
+    sweep_parser.add_argument("forces", help="Robot bar-force CSV export.")
+    sweep_parser.add_argument("--param", type=parse_sweep_values, action="append", required=True,
+                              metavar="NAME=VALUES",
+                              help="Swept parameter, e.g. due_moisture=0.7:1.0:7 (start:stop:count), "
+                                   "tension.due_time_effect=0.6,0.8,1.0 or bending_strength=150,212. Repeat for a grid.")
+    sweep_parser.add_argument("-o", "--output", default="sweep.csv", help="Output CSV (default: sweep.csv).")
+    sweep_parser.add_argument("--members", type=lambda value : value.split(","), default=None,
+                              help="Comma-separated member numbers to import.")
+    sweep_parser.add_argument("--cases", type=lambda value : value.split(","), default=None,
+                              help="Comma-separated load case numbers to import.")
+    sweep_parser.add_argument("--encoding", default=None, help="Text encoding of the export.")
+    sweep_parser.add_argument("--memory", action="store_true",
+                              help="Report the peak memory of every stage (tracemalloc, slows the run down).")
+    sweep_parser.set_defaults(handler=sweep)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int :
+    args = build_parser().parse_args(argv)
+    try :
+        return args.handler(args)
+    except (OSError, ValueError) as error :
+        print(f"error: {error}", file=sys.stderr)
+        return 1
@@ -0,0 +1,178 @@
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import Iterator, List, Optional
+import cProfile
+import io
+import json
+import pstats
+import time
+import tracemalloc
+import pandas as pd
+
+DIAGNOSTICS_COLUMNS = ["stage", "seconds", "rows", "rows/s", "peak memory (MB)"]
+
+
+@dataclass
+class StageRecord :
+    """
+    Timing of one run of a pipeline stage.
+
+    Args:
+        stage: Stage name, e.g. "import" or "check".
+        seconds: Wall time.
+        rows: Rows processed, None when not meaningful.
+        peak_bytes: Peak traced memory during the stage, None when memory is not tracked.
+        started: Start time (time.time()).
+    """
+    stage: str
+    seconds: float = 0.0
+    rows: Optional[int] = None
+    peak_bytes: Optional[int] = None
+    started: float = 0.0
+
+    @property
+    def throughput(self) -> Optional[float] :
+        if self.rows is None or self.seconds <= 0 :
+            return None
+        return self.rows / self.seconds
+
+
+class Diagnostics :
+    """
+    Collects per-stage wall time, row counts, throughput and, optionally, peak memory.
+
+    Args:
+        track_memory: Trace allocations with tracemalloc to report the peak memory of every stage.
+            Tracing slows Python allocations down noticeably, so it is off by default.
+        max_records: Oldest records are dropped beyond this number.
+    """
+
+    def __init__(self, track_memory: bool = False, max_records: int = 1000) :
+        self.records: List[StageRecord] = []
+        self.max_records = max_records
+        self.track_memory = track_memory
+        self.profile_text: Optional[str] = None
+        self._stack: List[list] = []
+        self._started_tracing = False
+
+    def set_track_memory(self, track_memory: bool) :
+        self.track_memory = track_memory
+        if not track_memory and self._started_tracing and not self._stack :
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @contextmanager
+    def stage(self, name: str, rows: Optional[int] = None) -> Iterator[StageRecord] :
+        """
+        Times a stage; set record.rows inside the block when the row count is only known at the end.
+
+        Nested stages are recorded separately, the outer stage including the time and peak of the inner ones.
+        """
+        record = StageRecord(stage=name, rows=rows, started=time.time())
+        tracking = self.track_memory
+        if tracking :
+            if not tracemalloc.is_tracing() :
+                tracemalloc.start()
+                self._started_tracing = True
+            if self._stack :
+                # reset_peak is global: fold the running peak into the enclosing stage first.
+                self._stack[-1][1] = max(self._stack[-1][1], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        frame = [record, 0]
+        self._stack.append(frame)
+        start = time.perf_counter()
+        try :
+            yield record
+        finally :
+            record.seconds = time.perf_counter() - start
+            self._stack.pop()
+            if tracking and tracemalloc.is_tracing() :
+                peak = max(frame[1], tracemalloc.get_traced_memory()[1])
+                record.peak_bytes = peak
+                if self._stack :
+                    self._stack[-1][1] = max(self._stack[-1][1], peak)
+            self.records.append(record)
+            del self.records[:-self.max_records]
+
+    def add(self, name: str, seconds: float, rows: Optional[int] = None, started: float = 0.0) -> StageRecord :
+        """
+        Records a stage timed elsewhere, e.g. a calculation run by a job queue worker.
+        """
+        record = StageRecord(stage=name, seconds=seconds, rows=rows, started=started)
+        self.records.append(record)
+        del self.records[:-self.max_records]
+        return record
+
+    @contextmanager
+    def profile(self, limit: int = 40) -> Iterator[None] :
+        """
+        Captures a cProfile of the block; the top functions by cumulative time end up in profile_text.
+        """
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try :
+            yield
+        finally :
+            profiler.disable()
+            output = io.StringIO()
+            pstats.Stats(profiler, stream=output).sort_stats("cumulative").print_stats(limit)
+            self.profile_text = output.getvalue()
+
+    def clear(self) :
+        self.records = []
+        self.profile_text = None
+
+    def to_frame(self) -> pd.DataFrame :
+        """
+        One row per recorded stage run, in recording order.
+        """
+        return pd.DataFrame(
+            [
+                (record.stage, record.seconds, record.rows, record.throughput,
+                 None if record.peak_bytes is None else record.peak_bytes / 2 ** 20)
+                for record in self.records
+            ],
+            columns=DIAGNOSTICS_COLUMNS,
+        )
+
+    def summary(self) -> pd.DataFrame :
+        """
+        Totals per stage: runs, seconds, rows, throughput and the largest peak memory.
+        """
+        frame = self.to_frame()
+        if frame.empty :
+            return pd.DataFrame(columns=["stage", "runs", "seconds", "rows", "rows/s", "peak memory (MB)"])
+        grouped = frame.groupby("stage", sort=False)
+        summary = pd.DataFrame({
+            "runs" : grouped.size(),
+            "seconds" : grouped["seconds"].sum(),
+            "rows" : grouped["rows"].sum(min_count=1),
+            "peak memory (MB)" : grouped["peak memory (MB)"].max(),
+        })
+        summary.insert(3, "rows/s", summary["rows"] / summary["seconds"])
+        return summary.reset_index()
+
+    def report(self) -> str :
+        """
+        Plain-text per-stage totals, for the command line.
+        """
+        summary = self.summary()
+        width = max([10] + [len(stage) + 2 for stage in summary["stage"]])
+        lines = []
+        for row in summary.itertuples(index=False) :
+            line = f"{row.stage:<{width}}{row.seconds:>10.3f} s"
+            if pd.notna(row.rows) :
+                line += f"{int(row.rows):>14,} rows{row._4:>16,.0f} rows/s"
+            if pd.notna(row._5) :
+                line += f"{row._5:>10.1f} MB peak"
+            lines.append(line)
+        return "\n".join(lines)
+
+    def to_json(self) -> str :
+        """
+        Records and profile as JSON, e.g. to compare runs against a performance budget.
+        """
+        return json.dumps({
+            "records" : [dict(asdict(record), throughput=record.throughput) for record in self.records],
+            "profile" : self.profile_text,
+        }, indent=2)
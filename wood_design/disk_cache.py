@@ -0,0 +1,224 @@
+from dataclasses import asdict
+from typing import Dict, List, Optional
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+import pandas as pd
+from timber_nds.settings import WoodMaterial, RectangularSection, MemberDefinition
+from wood_design.engine import FACTOR_TYPES, ForceArrays
+from wood_design.incremental import forces_fingerprint
+
+MANIFEST = "manifest.json"
+
+CACHE_FORMAT = 1
+
+
+def default_cache_dir() -> str :
+    """
+    Cache directory: $WOOD_DESIGN_CACHE_DIR, else ~/.cache/wood_design.
+    """
+    return os.environ.get("WOOD_DESIGN_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "wood_design"))
+
+
+def inputs_fingerprint(
+        material: WoodMaterial,
+        list_sections: List[RectangularSection],
+        list_elements: List[MemberDefinition],
+        adjustment_factors: dict,
+        support_area_values: dict,
+        forces: ForceArrays,
+        options: Optional[dict] = None,
+) -> str :
+    """
+    Stable content hash of everything a calculation depends on.
+
+    Args:
+        material, list_sections, list_elements, adjustment_factors, support_area_values:
+            Inputs of check_for_all_elements.
+        forces: Forces as column arrays, hashed by names and values.
+        options: Other settings that change the results table, e.g. the envelope pre-filter.
+
+    Returns:
+        A hex digest; equal inputs give the same digest in every session and process.
+    """
+    payload = {
+        "format" : CACHE_FORMAT,
+        "material" : asdict(material),
+        "sections" : [asdict(section) for section in list_sections],
+        "elements" : [asdict(element) for element in list_elements],
+        "adjustment_factors" : {factor_type : asdict(adjustment_factors[factor_type]) for factor_type in FACTOR_TYPES},
+        "support_area_values" : {element.name : support_area_values.get(element.name, 1.0) for element in list_elements},
+        "forces" : forces_fingerprint(forces),
+        "options" : options or {},
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=repr).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=20).hexdigest()
+
+
+def _checksum(data: bytes) -> str :
+    return hashlib.blake2b(data, digest_size=20).hexdigest()
+
+
+def _frame_to_bytes(frame: pd.DataFrame) -> bytes :
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with ipc.new_file(sink, table.schema) as writer :
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _frame_from_bytes(data: bytes) -> pd.DataFrame :
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+    return ipc.open_file(pa.BufferReader(data)).read_all().to_pandas()
+
+
+class ResultCache :
+    """
+    Persistent cache of calculated tables, shared by every session and process using the same directory.
+
+    Every entry is a directory named after its key, holding one Arrow file per table and a manifest
+    with their sizes and checksums. Entries are written to a temporary directory and renamed into
+    place, so readers never see a half-written entry. The manifest modification time records the
+    last access, and the least recently used entries are evicted once the cache exceeds max_bytes
+    or max_entries.
+
+    Args:
+        directory: Cache directory, created if missing.
+        max_bytes: Maximum total size of the cached files.
+        max_entries: Optional maximum number of entries.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = 1 << 30, max_entries: Optional[int] = None) :
+        if max_bytes <= 0 :
+            raise ValueError("max_bytes must be a positive integer.")
+        self.directory = directory or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.corrupted = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _entry_dir(self, key: str) -> str :
+        return os.path.join(self.directory, key)
+
+    def _manifest(self, key: str) -> Optional[dict] :
+        try :
+            with open(os.path.join(self._entry_dir(key), MANIFEST), "r", encoding="utf-8") as file :
+                return json.load(file)
+        except (OSError, ValueError) :
+            return None
+
+    def keys(self) -> List[str] :
+        return [
+            name for name in os.listdir(self.directory)
+            if not name.startswith(".") and os.path.isfile(os.path.join(self.directory, name, MANIFEST))
+        ]
+
+    def __contains__(self, key: str) -> bool :
+        return self._manifest(key) is not None
+
+    def __len__(self) -> int :
+        return len(self.keys())
+
+    def get(self, key: str) -> Optional[Dict[str, pd.DataFrame]] :
+        """
+        Loads an entry, checking every file against its checksum.
+
+        Returns:
+            The cached tables by name, or None on a miss. Corrupted entries are removed and count as misses.
+        """
+        manifest = self._manifest(key)
+        if manifest is None or manifest.get("format") != CACHE_FORMAT :
+            self.misses += 1
+            return None
+
+        frames = {}
+        try :
+            for name, info in manifest["files"].items() :
+                with open(os.path.join(self._entry_dir(key), f"{name}.arrow"), "rb") as file :
+                    data = file.read()
+                if len(data) != info["size"] or _checksum(data) != info["checksum"] :
+                    raise ValueError(f"Checksum mismatch in '{name}'.")
+                frames[name] = _frame_from_bytes(data)
+        except (OSError, ValueError, KeyError) :
+            self.corrupted += 1
+            self.misses += 1
+            self.remove(key)
+            return None
+
+        now = time.time()
+        try :
+            os.utime(os.path.join(self._entry_dir(key), MANIFEST), (now, now))
+        except OSError :
+            pass
+        self.hits += 1
+        return frames
+
+    def put(self, key: str, frames: Dict[str, pd.DataFrame]) :
+        """
+        Stores tables under a key, replacing nothing if another process stored the key first,
+        then evicts least recently used entries beyond the size limits.
+        """
+        if key in self :
+            return
+        # A directory without a readable manifest is a damaged entry.
+        self.remove(key)
+        staging = tempfile.mkdtemp(prefix=f".{key}-", dir=self.directory)
+        try :
+            files = {}
+            for name, frame in frames.items() :
+                data = _frame_to_bytes(frame)
+                with open(os.path.join(staging, f"{name}.arrow"), "wb") as file :
+                    file.write(data)
+                files[name] = {"size" : len(data), "checksum" : _checksum(data)}
+            with open(os.path.join(staging, MANIFEST), "w", encoding="utf-8") as file :
+                json.dump({"format" : CACHE_FORMAT, "created" : time.time(), "files" : files}, file)
+            os.replace(staging, self._entry_dir(key))
+        except OSError :
+            # Another process renamed the same key into place first.
+            shutil.rmtree(staging, ignore_errors=True)
+        self.evict()
+
+    def remove(self, key: str) :
+        shutil.rmtree(self._entry_dir(key), ignore_errors=True)
+
+    def clear(self) :
+        for key in self.keys() :
+            self.remove(key)
+        self.hits = 0
+        self.misses = 0
+        self.corrupted = 0
+
+    def size_bytes(self) -> int :
+        return sum(size for _, _, size in self._entries())
+
+    def _entries(self) -> List[tuple] :
+        entries = []
+        for key in self.keys() :
+            manifest = self._manifest(key)
+            if manifest is None :
+                continue
+            try :
+                last_access = os.path.getmtime(os.path.join(self._entry_dir(key), MANIFEST))
+            except OSError :
+                continue
+            entries.append((last_access, key, sum(info["size"] for info in manifest.get("files", {}).values())))
+        return entries
+
+    def evict(self) :
+        """
+        Removes least recently used entries until the cache is within max_bytes and max_entries.
+        """
+        entries = sorted(self._entries())
+        total = sum(size for _, _, size in entries)
+        while entries and (total > self.max_bytes or (self.max_entries is not None and len(entries) > self.max_entries)) :
+            _, key, size = entries.pop(0)
+            self.remove(key)
+            total -= size
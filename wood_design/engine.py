@@ -0,0 +1,501 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+from timber_nds.settings import (
+    WoodMaterial,
+    RectangularSection,
+    MemberDefinition,
+    Forces,
+    TensionAdjustmentFactors,
+    BendingAdjustmentFactors,
+    ShearAdjustmentFactors,
+    CompressionAdjustmentFactors,
+    PerpendicularAdjustmentFactors,
+    ElasticModulusAdjustmentFactors,
+)
+
+FACTOR_TYPES = [
+    "tension", "bending_yy", "bending_zz", "shear",
+    "compression_yy", "compression_zz", "compression_perp", "elastic_modulus"
+]
+
+FACTOR_ARGUMENTS = {
+    "tension" : "tension_factors",
+    "bending_yy" : "bending_factors_yy",
+    "bending_zz" : "bending_factors_zz",
+    "shear" : "shear_factors",
+    "compression_yy" : "compression_factors_yy",
+    "compression_zz" : "compression_factors_zz",
+    "compression_perp" : "compression_perp_factors",
+    "elastic_modulus" : "elastic_modulus_factors",
+}
+
+DCR_COLUMNS = [
+    "tension (dcr)", "biaxial bending (dcr)", "shear y (dcr)", "shear z (dcr)",
+    "compression (dcr)", "bending and compression (dcr)", "compression perpendicular (dcr)"
+]
+
+MEMBER_DCR_COLUMNS = ["compression perpendicular (dcr)"]
+
+SECTION_DCR_COLUMNS = [column for column in DCR_COLUMNS if column not in MEMBER_DCR_COLUMNS]
+
+RESULT_COLUMNS = ["member", "section", "force"] + DCR_COLUMNS
+
+CAPACITY_COLUMNS = [
+    "tension_capacity", "bending_yy_capacity", "bending_zz_capacity", "shear_capacity",
+    "compression_yy_capacity", "compression_zz_capacity", "compression_perp_capacity"
+]
+
+# Capacities each DCR column is computed from; a column only changes when one of them does.
+DCR_DEPENDENCIES = {
+    "tension (dcr)" : ["tension_capacity"],
+    "biaxial bending (dcr)" : ["bending_yy_capacity", "bending_zz_capacity"],
+    "shear y (dcr)" : ["shear_capacity"],
+    "shear z (dcr)" : ["shear_capacity"],
+    "compression (dcr)" : ["compression_yy_capacity"],
+    "bending and compression (dcr)" : ["compression_yy_capacity", "bending_yy_capacity", "bending_zz_capacity"],
+    "compression perpendicular (dcr)" : ["compression_perp_capacity"],
+}
+
+
+@dataclass
+class ForceArrays :
+    """
+    Column-oriented storage of a list of Forces.
+
+    Args:
+        names: Force names, as produced by create_robot_bar_forces_as_objects.
+        axial, shear_y, shear_z, moment_xx, moment_yy, moment_zz: Force components (kgf, kgfcm).
+    """
+    names: np.ndarray
+    axial: np.ndarray
+    shear_y: np.ndarray
+    shear_z: np.ndarray
+    moment_xx: np.ndarray
+    moment_yy: np.ndarray
+    moment_zz: np.ndarray
+
+    @classmethod
+    def from_forces(cls, list_forces: List[Forces]) -> "ForceArrays" :
+        return cls(
+            names=np.array([forces.name for forces in list_forces], dtype=object),
+            axial=np.array([forces.axial for forces in list_forces], dtype=float),
+            shear_y=np.array([forces.shear_y for forces in list_forces], dtype=float),
+            shear_z=np.array([forces.shear_z for forces in list_forces], dtype=float),
+            moment_xx=np.array([forces.moment_xx for forces in list_forces], dtype=float),
+            moment_yy=np.array([forces.moment_yy for forces in list_forces], dtype=float),
+            moment_zz=np.array([forces.moment_zz for forces in list_forces], dtype=float),
+        )
+
+    @classmethod
+    def concatenate(cls, chunks: List["ForceArrays"]) -> "ForceArrays" :
+        if not chunks :
+            return cls.from_forces([])
+        return cls(**{
+            field : np.concatenate([getattr(chunk, field) for chunk in chunks])
+            for field in ["names", "axial", "shear_y", "shear_z", "moment_xx", "moment_yy", "moment_zz"]
+        })
+
+    def __len__(self) -> int :
+        return len(self.names)
+
+
+@dataclass
+class SectionArrays :
+    """
+    Column-oriented storage of a list of RectangularSection.
+    """
+    names: np.ndarray
+    width: np.ndarray
+    depth: np.ndarray
+
+    @classmethod
+    def from_sections(cls, list_sections: List[RectangularSection]) -> "SectionArrays" :
+        return cls(
+            names=np.array([section.name for section in list_sections], dtype=object),
+            width=np.array([section.width for section in list_sections], dtype=float),
+            depth=np.array([section.depth for section in list_sections], dtype=float),
+        )
+
+    def __len__(self) -> int :
+        return len(self.names)
+
+
+@dataclass
+class MemberArrays :
+    """
+    Column-oriented storage of a list of MemberDefinition and their support areas.
+    """
+    names: np.ndarray
+    length: np.ndarray
+    effective_length_factor_yy: np.ndarray
+    effective_length_factor_zz: np.ndarray
+    support_area: np.ndarray
+
+    @classmethod
+    def from_members(cls, list_elements: List[MemberDefinition], support_area_values: dict) -> "MemberArrays" :
+        return cls(
+            names=np.array([element.name for element in list_elements], dtype=object),
+            length=np.array([element.length for element in list_elements], dtype=float),
+            effective_length_factor_yy=np.array([element.effective_length_factor_yy for element in list_elements],
+                                                dtype=float),
+            effective_length_factor_zz=np.array([element.effective_length_factor_zz for element in list_elements],
+                                                dtype=float),
+            support_area=np.array([support_area_values.get(element.name, 1.0) for element in list_elements],
+                                  dtype=float),
+        )
+
+    def __len__(self) -> int :
+        return len(self.names)
+
+
+def factor_arguments(adjustment_factors: dict) -> dict :
+    """
+    Maps an adjustment factor dictionary keyed by FACTOR_TYPES to the keyword arguments
+    of check_for_all_elements (tension_factors, bending_factors_yy, ...).
+    """
+    return {FACTOR_ARGUMENTS[factor_type] : adjustment_factors[factor_type] for factor_type in FACTOR_TYPES}
+
+
+def combined_factors(
+        tension_factors: TensionAdjustmentFactors,
+        bending_factors_yy: BendingAdjustmentFactors,
+        bending_factors_zz: BendingAdjustmentFactors,
+        shear_factors: ShearAdjustmentFactors,
+        compression_factors_yy: CompressionAdjustmentFactors,
+        compression_factors_zz: CompressionAdjustmentFactors,
+        compression_perp_factors: PerpendicularAdjustmentFactors,
+        elastic_modulus_factors: ElasticModulusAdjustmentFactors,
+) -> Dict[str, float] :
+    """
+    Computes the combined product of every adjustment factor set once.
+
+    Returns:
+        A dictionary keyed like WoodElementCalculator.calculate_combined_factors.
+
+    Assumptions:
+        - The products are taken with np.prod over the dataclass values, exactly as
+          WoodElementCalculator does, so capacities are bit-for-bit identical.
+    """
+    factor_sets = {
+        "tension" : tension_factors,
+        "bending_yy" : bending_factors_yy,
+        "bending_zz" : bending_factors_zz,
+        "shear" : shear_factors,
+        "compression_yy" : compression_factors_yy,
+        "compression_zz" : compression_factors_zz,
+        "compression_perp" : compression_perp_factors,
+        "elastic_modulus" : elastic_modulus_factors,
+    }
+    try :
+        return {key : np.prod(list(factors.__dict__.values())) for key, factors in factor_sets.items()}
+    except TypeError as e :
+        raise TypeError(f"All factor values must be numeric: {e}") from e
+
+
+def section_capacities(sections: SectionArrays, material: WoodMaterial, combined: Dict[str, float]) -> Dict[str, np.ndarray] :
+    """
+    Computes the section-dependent capacities for every section at once.
+
+    Args:
+        sections: Sections as column arrays.
+        material: Wood material.
+        combined: Combined adjustment factors, see combined_factors.
+
+    Returns:
+        A dictionary of arrays of length len(sections), keyed like CAPACITY_COLUMNS
+        (compression_perp_capacity excluded, it depends on the member support area).
+    """
+    area = sections.width * sections.depth
+    section_modulus_yy = (sections.width * sections.depth ** 2) / 6
+    section_modulus_zz = (sections.depth * sections.width ** 2) / 6
+    return {
+        "tension_capacity" : material.tension_strength * area * combined["tension"],
+        "bending_yy_capacity" : material.bending_strength * section_modulus_yy * combined["bending_yy"],
+        "bending_zz_capacity" : material.bending_strength * section_modulus_zz * combined["bending_zz"],
+        "shear_capacity" : 2 / 3 * material.shear_strength * area * combined["shear"],
+        "compression_yy_capacity" : material.compression_parallel_strength * area * combined["compression_yy"],
+        "compression_zz_capacity" : material.compression_parallel_strength * area * combined["compression_zz"],
+    }
+
+
+def member_capacities(members: MemberArrays, material: WoodMaterial, combined: Dict[str, float]) -> Dict[str, np.ndarray] :
+    """
+    Computes the member-dependent capacities (compression perpendicular on the support area).
+    """
+    return {
+        "compression_perp_capacity" : (
+                material.compression_perpendicular_strength * members.support_area * combined["compression_perp"]
+        ),
+    }
+
+
+def section_dcr_arrays(
+        capacities: Dict[str, np.ndarray],
+        forces: ForceArrays,
+        columns: Optional[List[str]] = None,
+) -> Dict[str, np.ndarray] :
+    """
+    Computes the DCRs that depend on the section only, for all section x force pairs.
+
+    Args:
+        capacities: Section capacities of shape (S,).
+        forces: Forces as column arrays of length F.
+        columns: Subset of SECTION_DCR_COLUMNS to compute, all of them by default.
+
+    Returns:
+        A dictionary keyed by the requested columns with arrays of shape (S, F).
+
+    Assumptions:
+        - The rules mirror timber_nds.design.check_for_all_elements: tension for positive axial,
+          compression (yy capacity) for negative axial, and a zero DCR whenever the demand is zero.
+    """
+    columns = SECTION_DCR_COLUMNS if columns is None else columns
+
+    def per_section(key) :
+        return capacities[key][:, None]
+
+    axial = forces.axial[None, :]
+    dcr = {}
+    with np.errstate(divide="ignore", invalid="ignore") :
+        if "tension (dcr)" in columns :
+            dcr["tension (dcr)"] = np.where(axial > 0, np.abs(axial) / per_section("tension_capacity"), 0.0)
+        if {"biaxial bending (dcr)", "bending and compression (dcr)"} & set(columns) :
+            moment_yy = forces.moment_yy[None, :]
+            moment_zz = forces.moment_zz[None, :]
+            dcr_bending_yy = np.where(moment_yy != 0, np.abs(moment_yy) / per_section("bending_yy_capacity"), 0.0)
+            dcr_bending_zz = np.where(moment_zz != 0, np.abs(moment_zz) / per_section("bending_zz_capacity"), 0.0)
+            dcr["biaxial bending (dcr)"] = dcr_bending_yy + dcr_bending_zz
+        if "shear y (dcr)" in columns :
+            shear_y = forces.shear_y[None, :]
+            dcr["shear y (dcr)"] = np.where(shear_y != 0, np.abs(shear_y) / per_section("shear_capacity"), 0.0)
+        if "shear z (dcr)" in columns :
+            shear_z = forces.shear_z[None, :]
+            dcr["shear z (dcr)"] = np.where(shear_z != 0, np.abs(shear_z) / per_section("shear_capacity"), 0.0)
+        if {"compression (dcr)", "bending and compression (dcr)"} & set(columns) :
+            dcr["compression (dcr)"] = np.where(axial < 0, np.abs(axial) / per_section("compression_yy_capacity"),
+                                                0.0)
+    if "bending and compression (dcr)" in columns :
+        dcr["bending and compression (dcr)"] = dcr["compression (dcr)"] + dcr["biaxial bending (dcr)"]
+
+    return {column : dcr[column] for column in columns}
+
+
+def member_dcr_arrays(capacities: Dict[str, np.ndarray], forces: ForceArrays) -> Dict[str, np.ndarray] :
+    """
+    Computes the DCRs that depend on the member only (compression perpendicular on the support area).
+
+    Returns:
+        A dictionary keyed by MEMBER_DCR_COLUMNS with arrays of shape (E, F).
+    """
+    abs_shear_y = np.abs(forces.shear_y)[None, :]
+    abs_shear_z = np.abs(forces.shear_z)[None, :]
+    max_shear = np.where(abs_shear_z > abs_shear_y, abs_shear_z, abs_shear_y)
+    with np.errstate(divide="ignore", invalid="ignore") :
+        dcr_compression_perp = np.where(
+            max_shear > 0, max_shear / capacities["compression_perp_capacity"][:, None], 0.0
+        )
+    return {"compression perpendicular (dcr)" : dcr_compression_perp}
+
+
+def expand_dcr_arrays(section_dcr: Dict[str, np.ndarray], member_dcr: Dict[str, np.ndarray]) -> Dict[str, np.ndarray] :
+    """
+    Broadcasts (S, F) section DCRs and (E, F) member DCRs to (S, E, F) views, without copying.
+    """
+    n_sections, n_forces = next(iter(section_dcr.values())).shape
+    n_members = next(iter(member_dcr.values())).shape[0]
+    shape = (n_sections, n_members, n_forces)
+    dcr = {column : np.broadcast_to(section_dcr[column][:, None, :], shape) for column in SECTION_DCR_COLUMNS}
+    dcr.update({column : np.broadcast_to(member_dcr[column][None, :, :], shape) for column in MEMBER_DCR_COLUMNS})
+    return {column : dcr[column] for column in DCR_COLUMNS}
+
+
+def dcr_arrays(capacities: Dict[str, np.ndarray], forces: ForceArrays) -> Dict[str, np.ndarray] :
+    """
+    Computes every DCR for all section x member x force combinations in one pass.
+
+    Args:
+        capacities: Section capacities of shape (S,) and compression_perp_capacity of shape (E,).
+        forces: Forces as column arrays of length F.
+
+    Returns:
+        A dictionary keyed like DCR_COLUMNS with arrays of shape (S, E, F).
+    """
+    return expand_dcr_arrays(section_dcr_arrays(capacities, forces), member_dcr_arrays(capacities, forces))
+
+
+def check_arrays(
+        sections: SectionArrays,
+        members: MemberArrays,
+        forces: ForceArrays,
+        material: WoodMaterial,
+        combined: Dict[str, float],
+) -> pd.DataFrame :
+    """
+    Runs the design checks on column arrays and returns the results table.
+
+    Returns:
+        A DataFrame with RESULT_COLUMNS, rows ordered section, then member, then force,
+        like timber_nds.design.check_for_all_elements.
+    """
+    if not len(sections) or not len(members) or not len(forces) :
+        return pd.DataFrame()
+
+    capacities = section_capacities(sections, material, combined)
+    capacities.update(member_capacities(members, material, combined))
+    return results_frame(sections, members, forces, dcr_arrays(capacities, forces))
+
+
+def results_frame(
+        sections: SectionArrays,
+        members: MemberArrays,
+        forces: ForceArrays,
+        dcr: Dict[str, np.ndarray],
+) -> pd.DataFrame :
+    """
+    Flattens (S, E, F) DCR arrays into the results table with RESULT_COLUMNS.
+    """
+    n_sections, n_members, n_forces = len(sections), len(members), len(forces)
+    columns = {
+        "member" : np.tile(np.repeat(members.names, n_forces), n_sections),
+        "section" : np.repeat(sections.names, n_members * n_forces),
+        "force" : np.tile(forces.names, n_sections * n_members),
+    }
+    for column in DCR_COLUMNS :
+        columns[column] = dcr[column].ravel()
+    return pd.DataFrame(columns, columns=RESULT_COLUMNS)
+
+
+def profile_capacities(
+        sections: SectionArrays,
+        members: MemberArrays,
+        materials: List[WoodMaterial],
+        combined: List[Dict[str, float]],
+        member_profile: np.ndarray,
+) -> Dict[str, np.ndarray] :
+    """
+    Computes the capacities of members that use different materials and adjustment factors.
+
+    Args:
+        sections: Sections as column arrays.
+        members: Members as column arrays.
+        materials, combined: Material and combined factors of every profile (P of them).
+        member_profile: Profile index of every member, shape (E,).
+
+    Returns:
+        Section capacities of shape (P, S), one row per profile, and compression_perp_capacity
+        of shape (E,), each member with its own profile.
+    """
+    per_profile = [section_capacities(sections, material, factors) for material, factors in zip(materials, combined)]
+    capacities = {key : np.stack([values[key] for values in per_profile]) for key in per_profile[0]}
+    strength = np.array([material.compression_perpendicular_strength for material in materials], dtype=float)
+    factor = np.array([factors["compression_perp"] for factors in combined], dtype=float)
+    capacities["compression_perp_capacity"] = strength[member_profile] * members.support_area * factor[member_profile]
+    return capacities
+
+
+def profile_dcr_arrays(
+        capacities: Dict[str, np.ndarray],
+        member_profile: np.ndarray,
+        forces: ForceArrays,
+) -> Dict[str, np.ndarray] :
+    """
+    Computes every DCR for all section x member x force combinations when members use different profiles.
+
+    Section DCRs are computed once per profile and gathered for every member by its profile index,
+    so the cost grows with the number of profiles, not with the number of members.
+
+    Args:
+        capacities: Capacities from profile_capacities.
+        member_profile: Profile index of every member, shape (E,).
+        forces: Forces as column arrays of length F.
+
+    Returns:
+        A dictionary keyed like DCR_COLUMNS with arrays of shape (S, E, F).
+    """
+    member_dcr = member_dcr_arrays(capacities, forces)
+    section_dcr = [
+        section_dcr_arrays({key : values[profile] for key, values in capacities.items() if values.ndim == 2}, forces)
+        for profile in range(capacities["tension_capacity"].shape[0])
+    ]
+    if len(section_dcr) == 1 :
+        return expand_dcr_arrays(section_dcr[0], member_dcr)
+
+    n_sections, n_forces = section_dcr[0]["tension (dcr)"].shape
+    shape = (n_sections, len(member_profile), n_forces)
+    dcr = {
+        column : np.stack([values[column] for values in section_dcr])[member_profile].transpose(1, 0, 2)
+        for column in SECTION_DCR_COLUMNS
+    }
+    dcr.update({column : np.broadcast_to(member_dcr[column][None, :, :], shape) for column in MEMBER_DCR_COLUMNS})
+    return {column : dcr[column] for column in DCR_COLUMNS}
+
+
+def check_profile_arrays(
+        sections: SectionArrays,
+        members: MemberArrays,
+        forces: ForceArrays,
+        materials: List[WoodMaterial],
+        combined: List[Dict[str, float]],
+        member_profile: np.ndarray,
+) -> pd.DataFrame :
+    """
+    Runs the design checks of members with different materials and adjustment factors in one pass.
+
+    Returns:
+        A DataFrame with RESULT_COLUMNS, ordered like check_arrays. With a single profile
+        the values are identical to check_arrays with that material and factors.
+    """
+    if not len(sections) or not len(members) or not len(forces) :
+        return pd.DataFrame()
+
+    capacities = profile_capacities(sections, members, materials, combined, member_profile)
+    return results_frame(sections, members, forces, profile_dcr_arrays(capacities, member_profile, forces))
+
+
+def batch_check_for_all_elements(
+        list_sections: List[RectangularSection],
+        list_elements: List[MemberDefinition],
+        list_forces: List[Forces],
+        material: WoodMaterial,
+        tension_factors: TensionAdjustmentFactors,
+        bending_factors_yy: BendingAdjustmentFactors,
+        bending_factors_zz: BendingAdjustmentFactors,
+        shear_factors: ShearAdjustmentFactors,
+        compression_factors_yy: CompressionAdjustmentFactors,
+        compression_factors_zz: CompressionAdjustmentFactors,
+        compression_perp_factors: PerpendicularAdjustmentFactors,
+        elastic_modulus_factors: ElasticModulusAdjustmentFactors,
+        support_area_values: dict,
+) -> pd.DataFrame :
+    """
+    Vectorized drop-in replacement for timber_nds.design.check_for_all_elements.
+
+    Args:
+        Same as check_for_all_elements.
+
+    Returns:
+        The same results table, with the same values, computed in one NumPy pass.
+    """
+    if not list_sections or not list_elements or not list_forces :
+        return pd.DataFrame()
+
+    combined = combined_factors(
+        tension_factors=tension_factors,
+        bending_factors_yy=bending_factors_yy,
+        bending_factors_zz=bending_factors_zz,
+        shear_factors=shear_factors,
+        compression_factors_yy=compression_factors_yy,
+        compression_factors_zz=compression_factors_zz,
+        compression_perp_factors=compression_perp_factors,
+        elastic_modulus_factors=elastic_modulus_factors,
+    )
+    forces = list_forces if isinstance(list_forces, ForceArrays) else ForceArrays.from_forces(list_forces)
+    return check_arrays(
+        sections=SectionArrays.from_sections(list_sections),
+        members=MemberArrays.from_members(list_elements, support_area_values),
+        forces=forces,
+        material=material,
+        combined=combined,
+    )
@@ -0,0 +1,212 @@
+from dataclasses import dataclass
+from typing import Optional
+import numpy as np
+import pandas as pd
+from wood_design.engine import ForceArrays, DCR_COLUMNS
+
+DEMAND_COMPONENTS = ["tension", "compression", "moment_yy", "moment_zz", "shear_y", "shear_z"]
+
+
+@dataclass
+class EnvelopeReduction :
+    """
+    Result of the envelope pre-filter.
+
+    Args:
+        forces: Forces kept as candidate governing combinations, in their original order.
+        kept_index: Positions of the kept forces in the input.
+        rows_in: Number of input forces.
+    """
+    forces: ForceArrays
+    kept_index: np.ndarray
+    rows_in: int
+
+    @property
+    def rows_out(self) -> int :
+        return len(self.kept_index)
+
+    @property
+    def pruned(self) -> int :
+        return self.rows_in - self.rows_out
+
+
+def robot_member_node(names: np.ndarray) -> np.ndarray :
+    """
+    Extracts the 'Member/Node' part of Robot force names such as '1//2//4/(C)'.
+    """
+    return pd.Series(names, dtype=object).astype(str).str.rsplit("/", n=2).str[0].to_numpy(dtype=object)
+
+
+def demand_components(forces: ForceArrays) -> np.ndarray :
+    """
+    Builds the demand vector that every DCR is monotonically non-decreasing in.
+
+    Returns:
+        An array of shape (F, 6) with columns DEMAND_COMPONENTS: positive axial (tension),
+        negative axial (compression), |MY|, |MZ|, |FY| and |FZ|.
+
+    Assumptions:
+        - The DCR rules are those of engine.dcr_arrays: tension and compression DCRs grow with
+          the axial demand of their sign, bending with |MY| and |MZ|, shear with |FY| and |FZ|,
+          compression perpendicular with max(|FY|, |FZ|), and the combined checks are sums of these.
+          Capacities are positive, so a force that is not larger in any component can never
+          give a larger DCR, whatever the section or member.
+    """
+    return np.column_stack([
+        np.where(forces.axial > 0, forces.axial, 0.0),
+        np.where(forces.axial < 0, -forces.axial, 0.0),
+        np.abs(forces.moment_yy),
+        np.abs(forces.moment_zz),
+        np.abs(forces.shear_y),
+        np.abs(forces.shear_z),
+    ])
+
+
+def _padded_dominated(demands: np.ndarray, codes: np.ndarray, n_groups: int, max_block: int) -> np.ndarray :
+    """
+    Dominance within many small groups at once, padding every group to the same size.
+    """
+    n_rows, n_components = demands.shape
+    order = np.argsort(codes, kind="stable")
+    sizes = np.bincount(codes, minlength=n_groups)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    width = int(sizes.max())
+
+    # Groups are padded to the same size with -1 rows, which can never dominate a demand >= 0.
+    position = np.arange(n_rows) - np.repeat(starts, sizes)
+    padded = np.full((n_groups, width, n_components), -1.0)
+    padded[codes[order], position] = demands[order]
+    valid = np.zeros((n_groups, width), dtype=bool)
+    valid[codes[order], position] = True
+
+    earlier = np.tri(width, width, -1, dtype=bool)
+    group_block = max(1, max_block // max(1, width * width * n_components))
+    padded_dominated = np.zeros((n_groups, width), dtype=bool)
+    for start in range(0, n_groups, group_block) :
+        block = padded[start :start + group_block]
+        candidate = block[:, None, :, :]
+        row = block[:, :, None, :]
+        greater_equal = (candidate >= row).all(axis=-1)
+        greater = (candidate > row).any(axis=-1)
+        dominates = greater_equal & (greater | earlier[None, :, :])
+        dominates &= valid[start :start + group_block, None, :]
+        padded_dominated[start :start + group_block] = dominates.any(axis=-1)
+
+    dominated = np.zeros(n_rows, dtype=bool)
+    dominated[order] = padded_dominated[codes[order], position]
+    return dominated
+
+
+def _skyline_dominated(demands: np.ndarray, max_block: int, chunk: int = 512) -> np.ndarray :
+    """
+    Dominance within one large group, comparing rows only against the front found so far.
+
+    Rows are visited by decreasing component sum, so every possible dominator of a row is
+    visited before it; dominance being transitive, it is enough to compare against the
+    non-dominated rows kept so far plus the rows of the current chunk.
+    """
+    n_rows, n_components = demands.shape
+    dominated = np.zeros(n_rows, dtype=bool)
+    finite = ~np.isnan(demands).any(axis=1)
+    index = np.flatnonzero(finite)
+    index = index[np.argsort(-demands[index].sum(axis=1), kind="stable")]
+
+    front = np.empty((0, n_components))
+    for start in range(0, len(index), chunk) :
+        rows_index = index[start :start + chunk]
+        rows = demands[rows_index]
+        if len(front) :
+            block = max(1, max_block // (len(rows) * n_components))
+            by_front = np.zeros(len(rows), dtype=bool)
+            for front_start in range(0, len(front), block) :
+                candidates = front[None, front_start :front_start + block, :]
+                by_front |= (candidates >= rows[:, None, :]).all(axis=-1).any(axis=1)
+            dominated[rows_index[by_front]] = True
+            rows_index, rows = rows_index[~by_front], rows[~by_front]
+
+        greater_equal = (rows[None, :, :] >= rows[:, None, :]).all(axis=-1)
+        greater = (rows[None, :, :] > rows[:, None, :]).any(axis=-1)
+        earlier = np.tri(len(rows), len(rows), -1, dtype=bool)
+        by_chunk = (greater_equal & (greater | earlier)).any(axis=1)
+        dominated[rows_index[by_chunk]] = True
+        front = np.concatenate([front, rows[~by_chunk]])
+    return dominated
+
+
+def dominated_mask(
+        demands: np.ndarray,
+        groups: np.ndarray,
+        max_block: int = 20_000_000,
+        small_group: int = 256,
+) -> np.ndarray :
+    """
+    Flags the rows dominated by another row of the same group.
+
+    A row is dominated when another row of its group is at least as large in every
+    demand component and larger in one of them, or equal in all of them and comes first.
+
+    Args:
+        demands: Demand vectors of shape (F, C).
+        groups: Group label of every row.
+        max_block: Upper bound of pairwise comparisons evaluated at once.
+        small_group: Groups up to this size are compared all pairs at once, larger ones
+            with a skyline pass.
+
+    Returns:
+        A boolean array of length F, True for redundant rows.
+
+    Assumptions:
+        - Rows with NaN components are never dominated and never dominate.
+    """
+    n_rows = len(demands)
+    dominated = np.zeros(n_rows, dtype=bool)
+    if not n_rows :
+        return dominated
+
+    codes, uniques = pd.factorize(pd.Series(groups, dtype=object), sort=False)
+    sizes = np.bincount(codes, minlength=len(uniques))
+
+    small = sizes[codes] <= small_group
+    if small.any() :
+        small_codes, small_uniques = pd.factorize(codes[small], sort=False)
+        dominated[small] = _padded_dominated(demands[small], small_codes, len(small_uniques), max_block)
+    for code in np.flatnonzero(sizes > small_group) :
+        rows = np.flatnonzero(codes == code)
+        dominated[rows] = _skyline_dominated(demands[rows], max_block)
+    return dominated
+
+
+def reduce_envelope(forces: ForceArrays, groups: Optional[np.ndarray] = None) -> EnvelopeReduction :
+    """
+    Keeps only the candidate governing force combinations of every member and node.
+
+    Args:
+        forces: Forces as column arrays.
+        groups: Group label per force, defaults to the Robot 'Member/Node' part of the force names.
+
+    Returns:
+        An EnvelopeReduction with the kept forces and the number of pruned rows.
+    """
+    if groups is None :
+        groups = robot_member_node(forces.names)
+    kept_index = np.flatnonzero(~dominated_mask(demand_components(forces), groups))
+    kept = ForceArrays(**{key : value[kept_index] for key, value in forces.__dict__.items()})
+    return EnvelopeReduction(forces=kept, kept_index=kept_index, rows_in=len(forces))
+
+
+def governing_dcr(results_df: pd.DataFrame) -> pd.DataFrame :
+    """
+    Governing (maximum) value of every DCR column and of dcr_max per member and section.
+    """
+    dcr = results_df[["member", "section"] + DCR_COLUMNS].copy()
+    dcr["dcr_max"] = dcr[DCR_COLUMNS].max(axis=1)
+    return dcr.groupby(["member", "section"], sort=True)[DCR_COLUMNS + ["dcr_max"]].max()
+
+
+def verify_envelope(full_results: pd.DataFrame, reduced_results: pd.DataFrame) -> bool :
+    """
+    Checks that a pre-filtered run gives exactly the governing DCRs of the full run.
+    """
+    if full_results.empty or reduced_results.empty :
+        return full_results.empty and reduced_results.empty
+    return governing_dcr(full_results).equals(governing_dcr(reduced_results))
@@ -0,0 +1,364 @@
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from wood_design.engine import ForceArrays
+
+ROBOT_FORCE_COLUMNS = {
+    "FX (kgf)" : "axial",
+    "FY (kgf)" : "shear_y",
+    "FZ (kgf)" : "shear_z",
+    "MX (kgfcm)" : "moment_xx",
+    "MY (kgfcm)" : "moment_yy",
+    "MZ (kgfcm)" : "moment_zz",
+}
+
+ENVELOPE_FIELDS = ["axial", "shear_y", "shear_z", "moment_xx", "moment_yy", "moment_zz"]
+
+
+@dataclass
+class ForcesSummary :
+    """
+    Running summary of an imported force file: row counts, distinct members and cases, and envelopes.
+    """
+    rows: int = 0
+    chunks: int = 0
+    members: set = field(default_factory=set)
+    cases: set = field(default_factory=set)
+    minimum: Dict[str, float] = field(default_factory=lambda : {key : np.inf for key in ENVELOPE_FIELDS})
+    maximum: Dict[str, float] = field(default_factory=lambda : {key : -np.inf for key in ENVELOPE_FIELDS})
+
+    def update(self, members: np.ndarray, cases: np.ndarray, forces: ForceArrays) :
+        self.rows += len(forces)
+        self.chunks += 1
+        self.members.update(members)
+        self.cases.update(cases)
+        if not len(forces) :
+            return
+        for key in ENVELOPE_FIELDS :
+            values = getattr(forces, key)
+            self.minimum[key] = min(self.minimum[key], float(np.nanmin(values)))
+            self.maximum[key] = max(self.maximum[key], float(np.nanmax(values)))
+
+    def envelope(self) -> pd.DataFrame :
+        """
+        Returns the min/max envelope of every force component as a DataFrame.
+        """
+        return pd.DataFrame({"min" : self.minimum, "max" : self.maximum}).loc[ENVELOPE_FIELDS]
+
+
+def split_robot_labels(labels: pd.Series) -> pd.DataFrame :
+    """
+    Splits the Robot 'Member/Node/Case' column into Member, Node, Case and Mode.
+
+    Returns:
+        A DataFrame with four string columns, missing parts filled with "nan",
+        exactly as timber_nds.calculation.import_robot_bar_forces indexes them.
+    """
+    parts = labels.astype(str).str.split(expand=True).reindex(columns=range(4))
+    parts.columns = ["Member", "Node", "Case", "Mode"]
+    return parts.fillna("nan")
+
+
+def robot_chunk_to_arrays(df: pd.DataFrame) -> Tuple[ForceArrays, pd.DataFrame] :
+    """
+    Converts one parsed chunk of a Robot bar-force export to ForceArrays.
+
+    Returns:
+        The forces, named like create_robot_bar_forces_as_objects, and the split label parts.
+    """
+    missing = [column for column in ROBOT_FORCE_COLUMNS if column not in df.columns]
+    if missing :
+        raise ValueError(f"Missing columns in forces file: {', '.join(missing)}")
+
+    parts = split_robot_labels(df[df.columns[0]])
+    names = parts["Member"].str.cat([parts["Node"], parts["Case"], parts["Mode"]], sep="/")
+    values = {
+        key : pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=float)
+        for column, key in ROBOT_FORCE_COLUMNS.items()
+    }
+    return ForceArrays(names=names.to_numpy(dtype=object), **values), parts
+
+
+def iter_robot_bar_forces(
+        filepath_or_buffer,
+        chunksize: int = 100_000,
+        encoding: Optional[str] = None,
+) -> Iterator[Tuple[ForceArrays, pd.DataFrame]] :
+    """
+    Streams a Robot bar-force CSV export in bounded-memory chunks.
+
+    Args:
+        filepath_or_buffer: Path or file-like object of the export.
+        chunksize: Number of rows parsed per chunk.
+        encoding: Text encoding of the file, None for the pandas default.
+
+    Yields:
+        Tuples (forces, parts) with the ForceArrays of the chunk and its split labels.
+
+    Assumptions:
+        - The file uses ';' as separator, ',' as decimal mark and '.' as thousands separator,
+          like the exports read by import_robot_bar_forces.
+    """
+    if chunksize <= 0 :
+        raise ValueError("chunksize must be a positive integer.")
+    reader = pd.read_csv(filepath_or_buffer, sep=";", decimal=",", thousands=".", header=0,
+                         chunksize=chunksize, encoding=encoding)
+    with reader :
+        for chunk in reader :
+            yield robot_chunk_to_arrays(chunk)
+
+
+def import_robot_bar_forces_streaming(
+        filepath_or_buffer,
+        chunksize: int = 100_000,
+        encoding: Optional[str] = None,
+) -> Tuple[ForceArrays, ForcesSummary] :
+    """
+    Imports a Robot bar-force CSV export chunk by chunk, without one Forces object per row.
+
+    Args:
+        filepath_or_buffer: Path or file-like object of the export.
+        chunksize: Number of rows parsed per chunk.
+        encoding: Text encoding of the file, None for the pandas default.
+
+    Returns:
+        The concatenated forces and a ForcesSummary of the file.
+    """
+    summary = ForcesSummary()
+    chunks = []
+    for forces, parts in iter_robot_bar_forces(filepath_or_buffer, chunksize=chunksize, encoding=encoding) :
+        summary.update(parts["Member"].unique(), parts["Case"].unique(), forces)
+        chunks.append(forces)
+    return ForceArrays.concatenate(chunks), summary
+
+
+ROBOT_LABEL_PARTS = ["Member", "Node", "Case", "Mode"]
+
+
+def _robot_label_parts(labels) -> List :
+    """
+    Arrow counterpart of split_robot_labels: splits labels on whitespace into the four parts,
+    missing parts set to "nan" and extra parts dropped.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    split = pc.utf8_split_whitespace(pc.utf8_trim_whitespace(pc.fill_null(labels, "nan")))
+    lengths = pc.list_value_length(split).to_numpy(zero_copy_only=False)
+    offsets = split.offsets.to_numpy()[:-1] - split.offsets[0].as_py()
+    flat = pc.list_flatten(split)
+    parts = []
+    for k in range(len(ROBOT_LABEL_PARTS)) :
+        present = lengths > k
+        values = flat.take(pa.array(np.where(present, offsets + k, 0))) if len(flat) else pa.nulls(len(lengths), pa.string())
+        parts.append(pc.if_else(pa.array(present), values, pa.scalar("nan")))
+    return parts
+
+
+def _robot_number_columns(batch, numbers_as_text: bool) -> Dict[str, np.ndarray] :
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    values = {}
+    for column, key in ROBOT_FORCE_COLUMNS.items() :
+        array = batch.column(batch.schema.get_field_index(column))
+        if numbers_as_text :
+            text = pc.replace_substring(pc.replace_substring(array, ".", ""), ",", ".")
+            try :
+                values[key] = pc.cast(text, pa.float64()).to_numpy(zero_copy_only=False)
+            except pa.ArrowInvalid :
+                values[key] = pd.to_numeric(pd.Series(text.to_numpy(zero_copy_only=False)), errors="coerce").to_numpy(dtype=float)
+        else :
+            values[key] = pc.fill_null(array, np.nan).to_numpy(zero_copy_only=False).astype(float, copy=False)
+    return values
+
+
+def _label_filter(parts: List, members: Optional[set], cases: Optional[set]) :
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    mask = None
+    for part, wanted in ((parts[0], members), (parts[2], cases)) :
+        if wanted is None :
+            continue
+        selected = pc.is_in(pc.utf8_rtrim(part, characters="/"), value_set=pa.array(sorted(wanted), pa.string()))
+        mask = selected if mask is None else pc.and_(mask, selected)
+    return mask
+
+
+def iter_robot_bar_forces_arrow(
+        filepath_or_buffer,
+        block_size: int = 1 << 24,
+        encoding: Optional[str] = None,
+        members: Optional[Iterable] = None,
+        cases: Optional[Iterable] = None,
+        numbers_as_text: bool = False,
+) -> Iterator[Tuple[ForceArrays, np.ndarray, np.ndarray]] :
+    """
+    Streams a Robot bar-force CSV export with the multi-threaded Arrow CSV reader.
+
+    Labels are split with Arrow string kernels instead of pandas .str, numbers are parsed with ','
+    as decimal mark while reading, and rows of unrequested members or cases are dropped before
+    their names and values are converted.
+
+    Args:
+        filepath_or_buffer: Path or file-like object of the export.
+        block_size: Bytes of text parsed per batch.
+        encoding: Text encoding of the file, None for UTF-8.
+        members: Optional member numbers to keep, e.g. ["1", "2"].
+        cases: Optional load case numbers to keep.
+        numbers_as_text: Parse numbers as text first, needed when they contain '.' thousands separators.
+
+    Yields:
+        Tuples (forces, members, cases) with the ForceArrays of the batch, named like
+        create_robot_bar_forces_as_objects, and its distinct Member and Case label parts.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pcsv
+    import pyarrow.compute as pc
+
+    read_options = pcsv.ReadOptions(block_size=block_size, encoding=encoding or "utf8")
+    parse_options = pcsv.ParseOptions(delimiter=";")
+    number_type = pa.string() if numbers_as_text else pa.float64()
+    convert_options = pcsv.ConvertOptions(
+        column_types={column : number_type for column in ROBOT_FORCE_COLUMNS},
+        decimal_point=",",
+        strings_can_be_null=True,
+    )
+    members = None if members is None else {str(member).rstrip("/") for member in members}
+    cases = None if cases is None else {str(case).rstrip("/") for case in cases}
+
+    with pcsv.open_csv(filepath_or_buffer, read_options=read_options, parse_options=parse_options,
+                       convert_options=convert_options) as reader :
+        missing = [column for column in ROBOT_FORCE_COLUMNS if column not in reader.schema.names]
+        if missing :
+            raise ValueError(f"Missing columns in forces file: {', '.join(missing)}")
+        for batch in reader :
+            labels = pc.cast(batch.column(0), pa.string())
+            parts = _robot_label_parts(labels)
+            mask = _label_filter(parts, members, cases)
+            if mask is not None :
+                batch = batch.filter(mask)
+                parts = [part.filter(mask) for part in parts]
+            names = pc.binary_join_element_wise(*parts, "/")
+            forces = ForceArrays(names=names.to_numpy(zero_copy_only=False).astype(object, copy=False),
+                                 **_robot_number_columns(batch, numbers_as_text))
+            yield forces, pc.unique(parts[0]).to_numpy(zero_copy_only=False), \
+                pc.unique(parts[2]).to_numpy(zero_copy_only=False)
+
+
+def import_robot_bar_forces_fast(
+        filepath_or_buffer,
+        encoding: Optional[str] = None,
+        members: Optional[Iterable] = None,
+        cases: Optional[Iterable] = None,
+        block_size: int = 1 << 24,
+) -> Tuple[ForceArrays, ForcesSummary] :
+    """
+    Imports a Robot bar-force CSV export with the Arrow CSV reader, see iter_robot_bar_forces_arrow.
+
+    Returns:
+        The same forces and summary as import_robot_bar_forces_streaming, restricted to the
+        requested members and cases.
+
+    Assumptions:
+        - Numbers are first parsed with ',' as decimal mark; files with '.' thousands separators
+          are detected by the parse error and re-read as text. Files the Arrow reader rejects,
+          e.g. with short rows, are imported with import_robot_bar_forces_streaming.
+    """
+    import pyarrow as pa
+    for numbers_as_text in (False, True, None) :
+        # Every attempt, the pandas fallback included, reads the buffer from the start.
+        if hasattr(filepath_or_buffer, "seek") :
+            filepath_or_buffer.seek(0)
+        if numbers_as_text is None :
+            return _filter_forces(*import_robot_bar_forces_streaming(filepath_or_buffer, encoding=encoding),
+                                  members, cases)
+        try :
+            summary = ForcesSummary()
+            chunks = []
+            for forces, chunk_members, chunk_cases in iter_robot_bar_forces_arrow(
+                    filepath_or_buffer, block_size=block_size, encoding=encoding,
+                    members=members, cases=cases, numbers_as_text=numbers_as_text) :
+                summary.update(chunk_members, chunk_cases, forces)
+                chunks.append(forces)
+            return ForceArrays.concatenate(chunks), summary
+        except pa.ArrowInvalid :
+            continue
+
+
+def iter_robot_bar_forces_fast(
+        filepath_or_buffer,
+        encoding: Optional[str] = None,
+        members: Optional[Iterable] = None,
+        cases: Optional[Iterable] = None,
+        block_size: int = 1 << 24,
+) -> Iterator[Tuple[ForceArrays, np.ndarray, np.ndarray]] :
+    """
+    Streaming counterpart of import_robot_bar_forces_fast, with the same fallbacks.
+
+    Yields:
+        Tuples (forces, members, cases) like iter_robot_bar_forces_arrow.
+
+    Assumptions:
+        - A parse error can come after batches were yielded (e.g. a '.' thousands separator far
+          into the file). The file is then read again as text, or with the pandas reader, and the
+          rows already yielded are skipped, so every row is yielded once and in file order.
+    """
+    import pyarrow as pa
+    yielded = 0
+    for numbers_as_text in (False, True, None) :
+        if hasattr(filepath_or_buffer, "seek") :
+            filepath_or_buffer.seek(0)
+        if numbers_as_text is None :
+            chunks = _iter_robot_bar_forces_filtered(filepath_or_buffer, encoding, members, cases)
+        else :
+            chunks = iter_robot_bar_forces_arrow(filepath_or_buffer, block_size=block_size, encoding=encoding,
+                                                 members=members, cases=cases, numbers_as_text=numbers_as_text)
+        skip = yielded
+        try :
+            for forces, chunk_members, chunk_cases in chunks :
+                if skip >= len(forces) :
+                    skip -= len(forces)
+                    continue
+                if skip :
+                    forces = ForceArrays(**{key : value[skip :] for key, value in forces.__dict__.items()})
+                    chunk_members, chunk_cases = _name_parts(forces)
+                    skip = 0
+                yielded += len(forces)
+                yield forces, chunk_members, chunk_cases
+            return
+        except pa.ArrowInvalid :
+            continue
+
+
+def _iter_robot_bar_forces_filtered(filepath_or_buffer, encoding: Optional[str], members: Optional[Iterable],
+                                    cases: Optional[Iterable]) -> Iterator[Tuple[ForceArrays, np.ndarray, np.ndarray]] :
+    # Pandas reader with the member and case filters of the Arrow reader.
+    for forces, parts in iter_robot_bar_forces(filepath_or_buffer, encoding=encoding) :
+        summary = ForcesSummary()
+        summary.update(parts["Member"].unique(), parts["Case"].unique(), forces)
+        forces, summary = _filter_forces(forces, summary, members, cases)
+        yield forces, np.array(sorted(summary.members), dtype=object), np.array(sorted(summary.cases), dtype=object)
+
+
+def _name_parts(forces: ForceArrays) -> Tuple[np.ndarray, np.ndarray] :
+    """
+    Distinct Member and Case label parts of forces named like create_robot_bar_forces_as_objects.
+    """
+    parts = pd.Series(forces.names, dtype=object).str.split("/", expand=True)
+    return np.unique(parts[0] + "/"), np.unique(parts[4])
+
+
+def _filter_forces(forces: ForceArrays, summary: ForcesSummary, members: Optional[Iterable],
+                   cases: Optional[Iterable]) -> Tuple[ForceArrays, ForcesSummary] :
+    if members is None and cases is None :
+        return forces, summary
+    parts = pd.Series(forces.names, dtype=object).str.split("/", expand=True)
+    keep = np.ones(len(forces), dtype=bool)
+    if members is not None :
+        keep &= parts[0].isin({str(member).rstrip("/") for member in members}).to_numpy()
+    if cases is not None :
+        keep &= parts[4].isin({str(case).rstrip("/") for case in cases}).to_numpy()
+    filtered = ForceArrays(**{key : value[keep] for key, value in forces.__dict__.items()})
+    filtered_summary = ForcesSummary()
+    filtered_summary.update(np.unique(parts[0][keep] + "/"), np.unique(parts[4][keep]), filtered)
+    return filtered, filtered_summary
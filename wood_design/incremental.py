@@ -0,0 +1,210 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+import hashlib
+import numpy as np
+import pandas as pd
+from timber_nds.settings import (
+    WoodMaterial,
+    RectangularSection,
+    MemberDefinition,
+    Forces,
+    TensionAdjustmentFactors,
+    BendingAdjustmentFactors,
+    ShearAdjustmentFactors,
+    CompressionAdjustmentFactors,
+    PerpendicularAdjustmentFactors,
+    ElasticModulusAdjustmentFactors,
+)
+from wood_design.engine import (
+    DCR_DEPENDENCIES,
+    SECTION_DCR_COLUMNS,
+    MEMBER_DCR_COLUMNS,
+    ForceArrays,
+    SectionArrays,
+    MemberArrays,
+    combined_factors,
+    section_capacities,
+    member_capacities,
+    section_dcr_arrays,
+    member_dcr_arrays,
+    expand_dcr_arrays,
+    results_frame,
+)
+
+FORCE_FIELDS = ["axial", "shear_y", "shear_z", "moment_xx", "moment_yy", "moment_zz"]
+
+
+def forces_fingerprint(forces: ForceArrays) -> str :
+    """
+    Content hash of a set of forces (names and values).
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update("\x1f".join(map(str, forces.names)).encode("utf-8"))
+    for key in FORCE_FIELDS :
+        digest.update(np.ascontiguousarray(getattr(forces, key), dtype=float).tobytes())
+    return digest.hexdigest()
+
+
+@dataclass
+class RecalculationPlan :
+    """
+    Describes which slice of the results was recomputed by IncrementalChecker.
+
+    Args:
+        full: True when everything was recomputed (first run or new forces).
+        sections: Recomputed section names per section-dependent DCR column.
+        members: Recomputed member names for the member-dependent DCR columns.
+    """
+    full: bool = False
+    sections: Dict[str, List[str]] = field(default_factory=dict)
+    members: List[str] = field(default_factory=list)
+
+    def is_empty(self) -> bool :
+        return not self.full and not any(self.sections.values()) and not self.members
+
+    def describe(self) -> str :
+        if self.full :
+            return "Full recalculation."
+        if self.is_empty() :
+            return "No input changed, results reused."
+        parts = [f"{column}: {', '.join(map(str, names))}" for column, names in self.sections.items() if names]
+        if self.members :
+            parts.append(f"{', '.join(MEMBER_DCR_COLUMNS)}: {', '.join(map(str, self.members))}")
+        return "Recomputed " + "; ".join(parts) + "."
+
+
+class IncrementalChecker :
+    """
+    Design checks that only recompute the results slice affected by the last input change.
+
+    Every DCR column depends on the forces and on a few capacities (see engine.DCR_DEPENDENCIES);
+    capacities in turn depend on material, section dimensions, adjustment factors and support areas.
+    Capacities are cheap to recompute, so changes are detected on them: a (section, column) row
+    block is recomputed only if the section is new or one of the capacities that column depends on
+    changed, and likewise for members and the compression perpendicular column. A change in the
+    forces recomputes everything.
+    """
+
+    def __init__(self) :
+        self.plan = RecalculationPlan(full=True)
+        self._forces_key: Optional[str] = None
+        self._section_capacities: Dict[str, Dict[str, float]] = {}
+        self._member_capacities: Dict[str, Dict[str, float]] = {}
+        self._section_dcr: Dict[str, Dict[str, np.ndarray]] = {}
+        self._member_dcr: Dict[str, Dict[str, np.ndarray]] = {}
+
+    def reset(self) :
+        self.__init__()
+
+    def check_arrays(
+            self,
+            sections: SectionArrays,
+            members: MemberArrays,
+            forces: ForceArrays,
+            material: WoodMaterial,
+            combined: Dict[str, float],
+    ) -> pd.DataFrame :
+        """
+        Same contract as engine.check_arrays, reusing unchanged slices of the previous run.
+        """
+        if not len(sections) or not len(members) or not len(forces) :
+            return pd.DataFrame()
+
+        forces_key = forces_fingerprint(forces)
+        full = forces_key != self._forces_key
+        if full :
+            self._section_capacities, self._member_capacities = {}, {}
+            self._section_dcr, self._member_dcr = {}, {}
+        plan = RecalculationPlan(full=full, sections={column : [] for column in SECTION_DCR_COLUMNS})
+
+        capacities = section_capacities(sections, material, combined)
+        dirty_columns = {}
+        for i, name in enumerate(sections.names) :
+            new = {key : value[i] for key, value in capacities.items()}
+            old = self._section_capacities.get(name)
+            columns = [
+                column for column in SECTION_DCR_COLUMNS
+                if old is None or any(new[key] != old[key] for key in DCR_DEPENDENCIES[column])
+            ]
+            if columns :
+                dirty_columns[i] = columns
+            self._section_capacities[name] = new
+
+        for columns in {tuple(columns) for columns in dirty_columns.values()} :
+            index = [i for i, dirty in dirty_columns.items() if tuple(dirty) == columns]
+            subset = {key : value[index] for key, value in capacities.items()}
+            computed = section_dcr_arrays(subset, forces, list(columns))
+            for row, i in enumerate(index) :
+                name = sections.names[i]
+                stored = self._section_dcr.setdefault(name, {})
+                for column in columns :
+                    stored[column] = computed[column][row]
+                    plan.sections[column].append(name)
+
+        perp_capacities = member_capacities(members, material, combined)
+        dirty_members = []
+        for i, name in enumerate(members.names) :
+            new = {key : value[i] for key, value in perp_capacities.items()}
+            if self._member_capacities.get(name) != new :
+                dirty_members.append(i)
+            self._member_capacities[name] = new
+        if dirty_members :
+            subset = {key : value[dirty_members] for key, value in perp_capacities.items()}
+            computed = member_dcr_arrays(subset, forces)
+            for row, i in enumerate(dirty_members) :
+                name = members.names[i]
+                self._member_dcr[name] = {column : computed[column][row] for column in MEMBER_DCR_COLUMNS}
+                plan.members.append(name)
+
+        self._forces_key = forces_key
+        self.plan = plan
+        section_dcr = {
+            column : np.stack([self._section_dcr[name][column] for name in sections.names])
+            for column in SECTION_DCR_COLUMNS
+        }
+        member_dcr = {
+            column : np.stack([self._member_dcr[name][column] for name in members.names])
+            for column in MEMBER_DCR_COLUMNS
+        }
+        return results_frame(sections, members, forces, expand_dcr_arrays(section_dcr, member_dcr))
+
+    def check_for_all_elements(
+            self,
+            list_sections: List[RectangularSection],
+            list_elements: List[MemberDefinition],
+            list_forces: List[Forces],
+            material: WoodMaterial,
+            tension_factors: TensionAdjustmentFactors,
+            bending_factors_yy: BendingAdjustmentFactors,
+            bending_factors_zz: BendingAdjustmentFactors,
+            shear_factors: ShearAdjustmentFactors,
+            compression_factors_yy: CompressionAdjustmentFactors,
+            compression_factors_zz: CompressionAdjustmentFactors,
+            compression_perp_factors: PerpendicularAdjustmentFactors,
+            elastic_modulus_factors: ElasticModulusAdjustmentFactors,
+            support_area_values: dict,
+    ) -> pd.DataFrame :
+        """
+        Incremental counterpart of engine.batch_check_for_all_elements, with the same arguments.
+        """
+        if not list_sections or not list_elements or not list_forces :
+            return pd.DataFrame()
+
+        combined = combined_factors(
+            tension_factors=tension_factors,
+            bending_factors_yy=bending_factors_yy,
+            bending_factors_zz=bending_factors_zz,
+            shear_factors=shear_factors,
+            compression_factors_yy=compression_factors_yy,
+            compression_factors_zz=compression_factors_zz,
+            compression_perp_factors=compression_perp_factors,
+            elastic_modulus_factors=elastic_modulus_factors,
+        )
+        forces = list_forces if isinstance(list_forces, ForceArrays) else ForceArrays.from_forces(list_forces)
+        return self.check_arrays(
+            sections=SectionArrays.from_sections(list_sections),
+            members=MemberArrays.from_members(list_elements, support_area_values),
+            forces=forces,
+            material=material,
+            combined=combined,
+        )
@@ -0,0 +1,334 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set
+import asyncio
+import io
+import os
+import threading
+import time
+import uuid
+import numpy as np
+import pandas as pd
+from tqdm import tqdm
+from wood_design.engine import ForceArrays
+
+JOB_STATUSES = ["queued", "running", "done", "failed", "cancelled"]
+
+JOB_COLUMNS = ["id", "label", "status", "progress", "cost", "sessions", "waiting (s)", "running (s)"]
+
+
+def default_job_workers() -> int :
+    """
+    Jobs run at the same time by a server: $WOOD_DESIGN_JOB_WORKERS, else 2.
+    """
+    return int(os.environ.get("WOOD_DESIGN_JOB_WORKERS", 2))
+
+
+class JobCancelled(Exception) :
+    """
+    Raised inside a job function when the job was cancelled.
+    """
+
+
+@dataclass
+class Job :
+    """
+    One calculation submitted to a JobQueue.
+
+    Args:
+        id: Unique job id.
+        key: Deduplication key, identical keys share one job while it is in flight.
+        label: Description shown to users.
+        cost: Size estimate (e.g. result rows) used by the concurrency limits.
+        owners: Sessions waiting for the result.
+        progress: tqdm counter updated by the job function, never printed.
+        status: One of JOB_STATUSES.
+        result: Return value of the job function once done.
+        error: Error message when failed.
+        submitted, started, finished: Timestamps (time.time()), None until reached.
+    """
+    id: str
+    key: str
+    label: str
+    cost: int
+    owners: Set[str]
+    progress: tqdm
+    status: str = "queued"
+    result: Any = None
+    error: Optional[str] = None
+    submitted: float = 0.0
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    _cancel: threading.Event = field(default_factory=threading.Event, repr=False)
+    _done: threading.Event = field(default_factory=threading.Event, repr=False)
+    _task: Optional[asyncio.Task] = field(default=None, repr=False)
+
+    @property
+    def done(self) -> bool :
+        return self._done.is_set()
+
+    @property
+    def fraction(self) -> float :
+        """
+        Completed fraction between 0 and 1.
+        """
+        if self.status == "done" :
+            return 1.0
+        total = self.progress.total
+        return min(1.0, self.progress.n / total) if total else 0.0
+
+    def describe(self) -> str :
+        """
+        Status line with the tqdm progress meter, e.g. 'running: 40%|####   | 4/10 [00:02<00:03, 2.00 chunks/s]'.
+        """
+        if self.status in ["queued", "running"] and self.progress.total :
+            return f"{self.status}: {tqdm.format_meter(**self.progress.format_dict)}"
+        return self.status if self.error is None else f"{self.status}: {self.error}"
+
+    def check_cancelled(self) :
+        """
+        Raises JobCancelled if the job was cancelled; job functions call it between chunks of work.
+        """
+        if self._cancel.is_set() :
+            raise JobCancelled(f"Job '{self.label}' was cancelled.")
+
+    def update(self, n: int = 1) :
+        """
+        Advances the progress by n units, checking for cancellation first.
+        """
+        self.check_cancelled()
+        self.progress.update(n)
+
+    def wait(self, timeout: Optional[float] = None) -> bool :
+        """
+        Blocks until the job is finished; returns False on timeout.
+        """
+        return self._done.wait(timeout)
+
+
+class JobQueue :
+    """
+    In-process job queue shared by all sessions of a server.
+
+    Jobs are scheduled by an asyncio event loop running in a background thread and executed
+    on a thread pool, so submitting never blocks the caller. NumPy releases the GIL in the
+    heavy array operations, so jobs of different sessions run side by side.
+
+    Args:
+        max_workers: Jobs running at the same time.
+        max_large: Jobs with a cost of at least large_cost running at the same time, so a few
+            huge models cannot take every worker.
+        large_cost: Cost from which a job counts as large.
+        max_per_owner: Jobs of one session running at the same time; further jobs wait in the queue.
+        history: Finished jobs kept for listing.
+
+    Assumptions:
+        - Cancellation is cooperative: queued jobs are dropped at once, running jobs stop at their next
+          Job.update or Job.check_cancelled call.
+    """
+
+    def __init__(self, max_workers: int = 2, max_large: int = 1, large_cost: int = 10_000_000,
+                 max_per_owner: int = 1, history: int = 100) :
+        if min(max_workers, max_large, max_per_owner) < 1 :
+            raise ValueError("max_workers, max_large and max_per_owner must be positive integers.")
+        self.max_workers = max_workers
+        self.max_large = max_large
+        self.large_cost = large_cost
+        self.max_per_owner = max_per_owner
+        self.history = history
+        self._jobs: Dict[str, Job] = {}
+        self._in_flight: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="wood-design-job")
+        self._slots = asyncio.Semaphore(max_workers)
+        self._large_slots = asyncio.Semaphore(max_large)
+        self._owner_slots: Dict[str, asyncio.Semaphore] = {}
+        self._owner_jobs: Dict[str, int] = {}
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="wood-design-jobs", daemon=True)
+        self._thread.start()
+
+    def submit(self, function: Callable[[Job], Any], key: str, owner: str, label: str = "",
+               cost: int = 0, total: Optional[int] = None, unit: str = "it") -> Job :
+        """
+        Queues function(job), or joins the in-flight job with the same key.
+
+        Args:
+            function: Called with the Job in a worker thread; reports progress with job.update.
+            key: Deduplication key, e.g. a hash of all inputs.
+            owner: Session submitting the job.
+            label: Description shown to users.
+            cost: Size estimate used by the concurrency limits.
+            total, unit: Progress total and unit.
+
+        Returns:
+            The new job, or the in-flight job with the same key.
+        """
+        with self._lock :
+            job = self._in_flight.get(key)
+            if job is not None :
+                job.owners.add(owner)
+                return job
+            job = Job(
+                id=uuid.uuid4().hex[:12], key=key, label=label, cost=int(cost), owners={owner},
+                progress=tqdm(total=total, unit=unit, desc=label, file=io.StringIO(), mininterval=0.5),
+                submitted=time.time(),
+            )
+            self._jobs[job.id] = job
+            self._in_flight[key] = job
+            finished = [job_id for job_id, other in self._jobs.items() if other.done]
+            for job_id in finished[:max(0, len(self._jobs) - self.history)] :
+                del self._jobs[job_id]
+        # The owner is taken now: by the time _start runs, cancel may have withdrawn it from job.owners.
+        self._loop.call_soon_threadsafe(self._start, job, function, owner)
+        return job
+
+    def cancel(self, job: Job, owner: Optional[str] = None) -> bool :
+        """
+        Cancels a job, or only withdraws owner from it while other sessions still wait for it.
+
+        Returns:
+            True if the job is being cancelled.
+        """
+        with self._lock :
+            if job.done :
+                return False
+            if owner is not None :
+                job.owners.discard(owner)
+                if job.owners :
+                    return False
+            job._cancel.set()
+            if self._in_flight.get(job.key) is job :
+                # Identical jobs submitted from now on start afresh.
+                del self._in_flight[job.key]
+        self._loop.call_soon_threadsafe(self._cancel_queued, job)
+        return True
+
+    def get(self, job_id: str) -> Optional[Job] :
+        with self._lock :
+            return self._jobs.get(job_id)
+
+    def jobs(self, owner: Optional[str] = None) -> List[Job] :
+        """
+        Known jobs in submission order, optionally only those of one session.
+        """
+        with self._lock :
+            return [job for job in self._jobs.values() if owner is None or owner in job.owners]
+
+    def to_frame(self) -> pd.DataFrame :
+        """
+        One row per known job with JOB_COLUMNS, for monitoring.
+        """
+        now = time.time()
+        rows = []
+        for job in self.jobs() :
+            started = job.started or job.finished or now
+            rows.append((job.id, job.label, job.status, job.fraction, job.cost, len(job.owners),
+                         started - job.submitted, None if job.started is None else (job.finished or now) - job.started))
+        return pd.DataFrame(rows, columns=JOB_COLUMNS)
+
+    def shutdown(self, wait: bool = True) :
+        """
+        Cancels every unfinished job and stops the event loop and the workers.
+        """
+        for job in self.jobs() :
+            self.cancel(job)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _start(self, job: Job, function: Callable[[Job], Any], owner: str) :
+        if job._cancel.is_set() :
+            # Cancelled before reaching the loop: closed without ever creating a task.
+            job.status = "cancelled"
+            self._close(job)
+            return
+        if owner not in self._owner_slots :
+            self._owner_slots[owner] = asyncio.Semaphore(self.max_per_owner)
+        self._owner_jobs[owner] = self._owner_jobs.get(owner, 0) + 1
+        job._task = self._loop.create_task(self._run(job, function, owner))
+        # A task cancelled before its first step never enters _run, so the job is closed by a callback.
+        job._task.add_done_callback(lambda task : self._finish(job, owner))
+
+    def _cancel_queued(self, job: Job) :
+        # Runs in the loop thread, where the status only changes from queued to running: no race with _run.
+        if job.status == "queued" and job._task is not None :
+            job._task.cancel()
+
+    async def _run(self, job: Job, function: Callable[[Job], Any], owner: str) :
+        try :
+            async with self._owner_slots[owner], \
+                    self._large_slots if job.cost >= self.large_cost else nullcontext(), \
+                    self._slots :
+                job.check_cancelled()
+                job.status = "running"
+                job.started = time.time()
+                job.result = await self._loop.run_in_executor(self._executor, function, job)
+                job.status = "done"
+        except JobCancelled :
+            job.status = "cancelled"
+        except Exception as e :
+            job.status = "failed"
+            job.error = str(e)
+
+    def _finish(self, job: Job, owner: str) :
+        if job._task.cancelled() :
+            job.status = "cancelled"
+        # Only touched in the loop thread; a session's slots go away with its last job.
+        self._owner_jobs[owner] -= 1
+        if not self._owner_jobs[owner] :
+            del self._owner_jobs[owner], self._owner_slots[owner]
+        self._close(job)
+
+    def _close(self, job: Job) :
+        job.finished = time.time()
+        job.progress.close()
+        with self._lock :
+            if self._in_flight.get(job.key) is job :
+                del self._in_flight[job.key]
+        job._done.set()
+
+
+def run_check_job(
+        job: Job,
+        check_function: Callable[..., pd.DataFrame],
+        list_forces,
+        chunk_size: int = 50_000,
+        **check_kwargs,
+) -> pd.DataFrame :
+    """
+    Runs a check_for_all_elements-like function on chunks of forces, reporting progress to the job.
+
+    Args:
+        job: The running job.
+        check_function: Design check function (vectorized, parallel or reference engine).
+        list_forces: Forces, as ForceArrays or a list of Forces.
+        chunk_size: Forces checked between progress updates and cancellation checks.
+        check_kwargs: Remaining arguments of check_function (list_sections, list_elements, ...).
+
+    Returns:
+        The results table, in the same row order as a single call on all forces.
+    """
+    n_forces = len(list_forces)
+    groups = len(check_kwargs["list_sections"]) * len(check_kwargs["list_elements"])
+    frames = []
+    for start in range(0, n_forces, chunk_size) :
+        job.check_cancelled()
+        stop = min(start + chunk_size, n_forces)
+        if isinstance(list_forces, ForceArrays) :
+            chunk = ForceArrays(**{key : value[start :stop] for key, value in list_forces.__dict__.items()})
+        else :
+            chunk = list_forces[start :stop]
+        frames.append(check_function(list_forces=chunk, **check_kwargs))
+        job.update(stop - start)
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames :
+        return pd.DataFrame()
+    if len(frames) == 1 :
+        return frames[0]
+
+    # Every chunk is ordered section, member, then force: interleave the chunks per section and member.
+    offsets = np.cumsum([0] + [len(frame) for frame in frames[:-1]])
+    order = np.concatenate([offset + np.arange(len(frame)).reshape(groups, -1) for offset, frame in zip(offsets, frames)],
+                           axis=1).ravel()
+    return pd.concat(frames, ignore_index=True).iloc[order].reset_index(drop=True)
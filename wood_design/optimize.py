@@ -0,0 +1,193 @@
+from typing import Dict, Optional
+import numpy as np
+import pandas as pd
+from timber_nds.settings import WoodMaterial
+from wood_design.engine import (
+    SECTION_DCR_COLUMNS,
+    MEMBER_DCR_COLUMNS,
+    ForceArrays,
+    SectionArrays,
+    MemberArrays,
+    section_capacities,
+    member_capacities,
+    section_dcr_arrays,
+    member_dcr_arrays,
+)
+
+# Capacities the section-dependent DCRs are computed from, see engine.DCR_DEPENDENCIES.
+SECTION_CAPACITY_KEYS = [
+    "tension_capacity", "bending_yy_capacity", "bending_zz_capacity", "shear_capacity", "compression_yy_capacity"
+]
+
+OPTIMIZATION_COLUMNS = [
+    "member", "section", "status", "dcr_max", "governing check", "governing force",
+    "sections checked", "force checks"
+]
+
+
+def sort_catalog(catalog: SectionArrays, cost: Optional[np.ndarray] = None) -> SectionArrays :
+    """
+    Sorts a section catalog from lightest to heaviest.
+
+    Args:
+        catalog: Candidate sections.
+        cost: Optional cost per section, the area (width x depth) is used when omitted.
+
+    Returns:
+        The catalog sorted by ascending cost, ties kept in catalog order.
+    """
+    key = catalog.width * catalog.depth if cost is None else np.asarray(cost, dtype=float)
+    order = np.argsort(key, kind="stable")
+    return SectionArrays(names=catalog.names[order], width=catalog.width[order], depth=catalog.depth[order])
+
+
+def _take(forces: ForceArrays, index: np.ndarray) -> ForceArrays :
+    return ForceArrays(**{key : value[index] for key, value in forces.__dict__.items()})
+
+
+class _SectionSearch :
+    """
+    Lightest passing section for one set of forces, with early termination.
+    """
+
+    def __init__(self, catalog: SectionArrays, capacities: Dict[str, np.ndarray], forces: ForceArrays,
+                 limit: float, block_size: int) :
+        self.catalog = catalog
+        self.capacities = capacities
+        self.limit = limit
+        self.block_size = block_size
+        self.force_checks = 0
+        self.sections_checked = 0
+        self.result: Optional[tuple] = None
+
+        # Checking the forces that are worst for the lightest section first makes failures show up early.
+        worst = self._dcr(0, forces).max(axis=0) if len(catalog) else np.zeros(len(forces))
+        self.forces = _take(forces, np.argsort(-np.nan_to_num(worst, nan=np.inf), kind="stable"))
+
+    def _dcr(self, i: int, forces: ForceArrays) -> np.ndarray :
+        capacities = {key : self.capacities[key][i :i + 1] for key in SECTION_CAPACITY_KEYS}
+        dcr = section_dcr_arrays(capacities, forces)
+        return np.stack([dcr[column][0] for column in SECTION_DCR_COLUMNS])
+
+    def evaluate(self, i: int) -> Optional[tuple] :
+        """
+        Checks section i block by block and stops at the first block with a DCR above the limit.
+
+        Returns:
+            None if the section fails, else (dcr_max, governing check, governing force index).
+        """
+        self.sections_checked += 1
+        best = (0.0, None, None)
+        for start in range(0, len(self.forces), self.block_size) :
+            block = _take(self.forces, np.arange(start, min(start + self.block_size, len(self.forces))))
+            self.force_checks += len(block)
+            dcr = self._dcr(i, block)
+            if np.isnan(dcr).any() or (dcr > self.limit).any() :
+                return None
+            column, force = np.unravel_index(np.argmax(dcr), dcr.shape)
+            if dcr[column, force] > best[0] :
+                best = (float(dcr[column, force]), SECTION_DCR_COLUMNS[column], start + force)
+        return best
+
+    def run(self) -> Optional[tuple] :
+        """
+        Searches the catalog and stores (catalog index, dcr_max, governing check, governing force name),
+        or None when no section passes, in self.result.
+        """
+        matrix = np.column_stack([self.capacities[key] for key in SECTION_CAPACITY_KEYS])
+        skipped = np.zeros(len(self.catalog), dtype=bool)
+        for i in range(len(self.catalog)) :
+            if skipped[i] :
+                continue
+            result = self.evaluate(i)
+            if result is not None :
+                dcr_max, check, force = result
+                name = self.forces.names[force] if force is not None else None
+                self.result = (i, dcr_max, check, name)
+                return self.result
+            # Every DCR decreases with its capacities: a section that is not stronger
+            # in any capacity than a failing one fails as well.
+            skipped |= (matrix <= matrix[i]).all(axis=1)
+        return None
+
+
+def optimize_sections(
+        catalog: SectionArrays,
+        members: MemberArrays,
+        forces: ForceArrays,
+        material: WoodMaterial,
+        combined: Dict[str, float],
+        cost: Optional[np.ndarray] = None,
+        member_forces: Optional[Dict[str, np.ndarray]] = None,
+        limit: float = 1.0,
+        block_size: int = 4096,
+) -> pd.DataFrame :
+    """
+    Finds the lightest catalog section of every member whose governing DCR is within the limit.
+
+    Args:
+        catalog: Candidate rectangular sections.
+        members: Members as column arrays.
+        forces: Forces as column arrays.
+        material: Wood material.
+        combined: Combined adjustment factors, see engine.combined_factors.
+        cost: Optional cost per catalog section, the area is used when omitted.
+        member_forces: Optional force indices per member name; by default every member is checked
+            against every force, as in check_for_all_elements.
+        limit: Maximum admissible DCR.
+        block_size: Number of forces checked at once before testing for early exit.
+
+    Returns:
+        A DataFrame with OPTIMIZATION_COLUMNS, one row per member.
+
+    Assumptions:
+        - Sections are searched from lightest to heaviest, so the first passing section is the answer.
+        - Compression perpendicular does not depend on the section: a member failing it has no solution.
+    """
+    if block_size <= 0 :
+        raise ValueError("block_size must be a positive integer.")
+
+    catalog = sort_catalog(catalog, cost)
+    capacities = section_capacities(catalog, material, combined)
+    perp_dcr = member_dcr_arrays(member_capacities(members, material, combined), forces)[MEMBER_DCR_COLUMNS[0]]
+
+    searches: Dict[tuple, _SectionSearch] = {}
+    rows = []
+    for j, member in enumerate(members.names) :
+        index = np.arange(len(forces)) if member_forces is None else np.asarray(member_forces.get(member, []), dtype=int)
+        row = dict.fromkeys(OPTIMIZATION_COLUMNS)
+        row["member"] = member
+
+        member_perp = perp_dcr[j, index]
+        if len(index) and (np.isnan(member_perp).any() or member_perp.max() > limit) :
+            worst = int(np.argmax(np.nan_to_num(member_perp, nan=np.inf)))
+            row.update({"status" : "compression perpendicular exceeds limit",
+                        "dcr_max" : float(member_perp[worst]),
+                        "governing check" : MEMBER_DCR_COLUMNS[0],
+                        "governing force" : forces.names[index[worst]],
+                        "sections checked" : 0, "force checks" : 0})
+            rows.append(row)
+            continue
+
+        # Members checked against the same forces share one search.
+        key = tuple(index.tolist()) if member_forces is not None else None
+        if key not in searches :
+            searches[key] = _SectionSearch(catalog, capacities, _take(forces, index), limit, block_size)
+            searches[key].run()
+        search = searches[key]
+        result = search.result
+
+        if result is None :
+            row.update({"status" : "no section passes", "sections checked" : search.sections_checked,
+                        "force checks" : search.force_checks})
+        else :
+            i, dcr_max, check, force_name = result
+            if len(index) and member_perp.max() > dcr_max :
+                dcr_max, check = float(member_perp.max()), MEMBER_DCR_COLUMNS[0]
+                force_name = forces.names[index[np.argmax(member_perp)]]
+            row.update({"section" : catalog.names[i], "status" : "OK", "dcr_max" : dcr_max,
+                        "governing check" : check, "governing force" : force_name,
+                        "sections checked" : search.sections_checked, "force checks" : search.force_checks})
+        rows.append(row)
+
+    return pd.DataFrame(rows, columns=OPTIMIZATION_COLUMNS)
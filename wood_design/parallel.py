@@ -0,0 +1,206 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, Literal, Optional
+import os
+import numpy as np
+import pandas as pd
+from timber_nds.settings import (
+    WoodMaterial,
+    RectangularSection,
+    MemberDefinition,
+    Forces,
+    TensionAdjustmentFactors,
+    BendingAdjustmentFactors,
+    ShearAdjustmentFactors,
+    CompressionAdjustmentFactors,
+    PerpendicularAdjustmentFactors,
+    ElasticModulusAdjustmentFactors,
+)
+from wood_design.engine import (
+    DCR_COLUMNS,
+    ForceArrays,
+    SectionArrays,
+    MemberArrays,
+    combined_factors,
+    section_capacities,
+    member_capacities,
+    dcr_arrays,
+    results_frame,
+)
+
+Partition = Literal["section", "member"]
+
+FORCE_MATRIX_FIELDS = ["axial", "shear_y", "shear_z", "moment_xx", "moment_yy", "moment_zz"]
+
+
+def _attach(name: str) -> SharedMemory :
+    """
+    Opens a shared memory block created by the parent, which alone tracks and unlinks it.
+    """
+    try :
+        return SharedMemory(name=name, track=False)
+    except TypeError :
+        # Python < 3.13 registers every attached block with the resource tracker
+        memory = SharedMemory(name=name)
+        resource_tracker.unregister(memory._name, "shared_memory")
+        return memory
+
+
+def _check_partition(payload: dict) -> int :
+    """
+    Worker entry point: computes the DCRs of one partition from plain arrays and writes them
+    in place into the shared result block, so nothing but the row count is sent back.
+
+    Args:
+        payload: Dictionary with 'capacities' (arrays), 'forces' (an (F, 6) float matrix),
+            'output' (name of the shared memory block), 'shape' of the whole
+            (len(DCR_COLUMNS), S, E, F) result and 'index', the slice of it covered by the partition.
+
+    Returns:
+        Number of result rows written.
+    """
+    matrix = payload["forces"]
+    forces = ForceArrays(
+        names=np.empty(len(matrix), dtype=object),
+        **{key : matrix[:, i] for i, key in enumerate(FORCE_MATRIX_FIELDS)}
+    )
+    dcr = dcr_arrays(payload["capacities"], forces)
+    memory = _attach(payload["output"])
+    try :
+        output = np.ndarray(payload["shape"], dtype=np.float64, buffer=memory.buf)
+        for i, column in enumerate(DCR_COLUMNS) :
+            output[(i,) + payload["index"]] = dcr[column]
+        rows = dcr[DCR_COLUMNS[0]].size
+        del output
+    finally :
+        memory.close()
+    return rows
+
+
+def partition_bounds(n_items: int, n_parts: int) -> List[tuple] :
+    """
+    Splits range(n_items) into at most n_parts contiguous, nearly equal slices.
+    """
+    n_parts = max(1, min(n_parts, n_items))
+    edges = np.linspace(0, n_items, n_parts + 1).round().astype(int)
+    return [(int(start), int(stop)) for start, stop in zip(edges[:-1], edges[1 :]) if stop > start]
+
+
+def parallel_check_arrays(
+        sections: SectionArrays,
+        members: MemberArrays,
+        forces: ForceArrays,
+        material: WoodMaterial,
+        combined: Dict[str, float],
+        workers: Optional[int] = None,
+        partition: Partition = "section",
+) -> pd.DataFrame :
+    """
+    Runs the design checks over a process pool, partitioned by section or by member.
+
+    Args:
+        sections, members, forces: Inputs as column arrays.
+        material: Wood material.
+        combined: Combined adjustment factors, see engine.combined_factors.
+        workers: Number of worker processes, defaults to os.cpu_count(). 1 runs in-process.
+        partition: "section" or "member", the axis split across workers.
+
+    Returns:
+        The same DataFrame as engine.check_arrays.
+
+    Assumptions:
+        - Every DCR is computed elementwise, so results do not depend on the number of workers.
+        - Workers write their DCRs straight into one shared memory block laid out like the results,
+          which results_frame copies once; no DCR array is pickled or concatenated.
+    """
+    if partition not in ("section", "member") :
+        raise ValueError("partition must be 'section' or 'member'.")
+    if not len(sections) or not len(members) or not len(forces) :
+        return pd.DataFrame()
+
+    workers = workers or os.cpu_count() or 1
+    capacities = section_capacities(sections, material, combined)
+    capacities.update(member_capacities(members, material, combined))
+
+    n_items = len(sections) if partition == "section" else len(members)
+    bounds = partition_bounds(n_items, workers)
+    force_matrix = np.column_stack([getattr(forces, key) for key in FORCE_MATRIX_FIELDS])
+
+    shape = (len(DCR_COLUMNS), len(sections), len(members), len(forces))
+    memory = SharedMemory(create=True, size=int(np.prod(shape)) * np.dtype(np.float64).itemsize)
+    try :
+        payloads = []
+        for start, stop in bounds :
+            if partition == "section" :
+                partial = {key : value[start :stop] for key, value in capacities.items() if key != "compression_perp_capacity"}
+                partial["compression_perp_capacity"] = capacities["compression_perp_capacity"]
+                index = (slice(start, stop),)
+            else :
+                partial = {key : value for key, value in capacities.items() if key != "compression_perp_capacity"}
+                partial["compression_perp_capacity"] = capacities["compression_perp_capacity"][start :stop]
+                index = (slice(None), slice(start, stop))
+            payloads.append({"capacities" : partial, "forces" : force_matrix, "output" : memory.name,
+                             "shape" : shape, "index" : index})
+
+        if workers == 1 or len(payloads) == 1 :
+            for payload in payloads :
+                _check_partition(payload)
+        else :
+            with ProcessPoolExecutor(max_workers=min(workers, len(payloads))) as executor :
+                list(executor.map(_check_partition, payloads))
+
+        output = np.ndarray(shape, dtype=np.float64, buffer=memory.buf)
+        results_df = results_frame(sections, members, forces,
+                                   {column : output[i] for i, column in enumerate(DCR_COLUMNS)})
+        del output
+    finally :
+        memory.close()
+        memory.unlink()
+    return results_df
+
+
+def parallel_check_for_all_elements(
+        list_sections: List[RectangularSection],
+        list_elements: List[MemberDefinition],
+        list_forces: List[Forces],
+        material: WoodMaterial,
+        tension_factors: TensionAdjustmentFactors,
+        bending_factors_yy: BendingAdjustmentFactors,
+        bending_factors_zz: BendingAdjustmentFactors,
+        shear_factors: ShearAdjustmentFactors,
+        compression_factors_yy: CompressionAdjustmentFactors,
+        compression_factors_zz: CompressionAdjustmentFactors,
+        compression_perp_factors: PerpendicularAdjustmentFactors,
+        elastic_modulus_factors: ElasticModulusAdjustmentFactors,
+        support_area_values: dict,
+        workers: Optional[int] = None,
+        partition: Partition = "section",
+) -> pd.DataFrame :
+    """
+    Process-pool counterpart of engine.batch_check_for_all_elements, with the same arguments
+    plus the number of workers and the partition axis.
+    """
+    if not list_sections or not list_elements or not list_forces :
+        return pd.DataFrame()
+
+    combined = combined_factors(
+        tension_factors=tension_factors,
+        bending_factors_yy=bending_factors_yy,
+        bending_factors_zz=bending_factors_zz,
+        shear_factors=shear_factors,
+        compression_factors_yy=compression_factors_yy,
+        compression_factors_zz=compression_factors_zz,
+        compression_perp_factors=compression_perp_factors,
+        elastic_modulus_factors=elastic_modulus_factors,
+    )
+    forces = list_forces if isinstance(list_forces, ForceArrays) else ForceArrays.from_forces(list_forces)
+    return parallel_check_arrays(
+        sections=SectionArrays.from_sections(list_sections),
+        members=MemberArrays.from_members(list_elements, support_area_values),
+        forces=forces,
+        material=material,
+        combined=combined,
+        workers=workers,
+        partition=partition,
+    )
@@ -0,0 +1,199 @@
+from dataclasses import dataclass
+from typing import Iterable, Optional
+import numpy as np
+import pandas as pd
+from wood_design.engine import DCR_COLUMNS
+
+GOVERNING_COLUMNS = ["member", "section", "force", "dcr_max", "governing check"]
+
+MEMBER_SUMMARY_COLUMNS = [
+    "member", "section", "dcr_max", "governing check", "governing force", "forces", "forces over limit"
+]
+
+
+@dataclass
+class PostProcessedResults :
+    """
+    Column-wise reductions of a results table, computed once per calculation.
+
+    Args:
+        results: Results with 'dcr_max' and 'governing check' columns added.
+        by_member: Governing row of every member.
+        by_force: Governing row of every force.
+        member_summary: Governing DCR, check and force per member and section.
+    """
+    results: pd.DataFrame
+    by_member: pd.DataFrame
+    by_force: pd.DataFrame
+    member_summary: pd.DataFrame
+
+
+def governing_dcr_columns(results_df: pd.DataFrame) -> pd.DataFrame :
+    """
+    Computes dcr_max and the name of the governing check of every row.
+
+    Returns:
+        A DataFrame with columns 'dcr_max' and 'governing check', aligned on results_df.
+
+    Assumptions:
+        - NaN DCRs are ignored; a row with only NaN DCRs gets a NaN dcr_max and no governing check.
+    """
+    columns = [column for column in DCR_COLUMNS if column in results_df.columns]
+    dcr = results_df[columns].to_numpy(dtype=float)
+    all_nan = np.isnan(dcr).all(axis=1)
+    governing = np.argmax(np.where(np.isnan(dcr), -np.inf, dcr), axis=1)
+    dcr_max = np.where(all_nan, np.nan, dcr[np.arange(len(dcr)), governing])
+    names = np.array(columns, dtype=object)[governing]
+    names[all_nan] = None
+    return pd.DataFrame({"dcr_max" : dcr_max, "governing check" : names}, index=results_df.index)
+
+
+def _governing_rows(results: pd.DataFrame, key: str) -> pd.DataFrame :
+    ranking = results["dcr_max"].fillna(-np.inf)
+    index = ranking.groupby(results[key], sort=False).idxmax()
+    return results.loc[index.to_numpy(), GOVERNING_COLUMNS].reset_index(drop=True)
+
+
+def member_summary(results: pd.DataFrame, limit: float = 1.0) -> pd.DataFrame :
+    """
+    Compact governing summary: one row per member and section.
+    """
+    ranking = results["dcr_max"].fillna(-np.inf)
+    grouped = ranking.groupby([results["member"], results["section"]], sort=False)
+    index = grouped.idxmax().to_numpy()
+    summary = results.loc[index, ["member", "section", "dcr_max", "governing check", "force"]]
+    summary = summary.rename(columns={"force" : "governing force"}).reset_index(drop=True)
+    summary["forces"] = grouped.size().to_numpy()
+    summary["forces over limit"] = (ranking > limit).groupby([results["member"], results["section"]],
+                                                             sort=False).sum().to_numpy()
+    member_order = pd.factorize(summary["member"], sort=False)[0]
+    summary = summary.iloc[np.argsort(member_order, kind="stable")].reset_index(drop=True)
+    return summary[MEMBER_SUMMARY_COLUMNS]
+
+
+def postprocess_results(results_df: pd.DataFrame, limit: float = 1.0) -> PostProcessedResults :
+    """
+    Adds dcr_max and the governing check to a results table and computes governing rows
+    per member and per force and the per member summary, all with column-wise reductions.
+
+    Args:
+        results_df: Results table with member, section, force and the DCR columns.
+        limit: DCR above which a force counts as over the limit in the summary.
+
+    Returns:
+        A PostProcessedResults.
+    """
+    if results_df.empty :
+        empty = pd.DataFrame(columns=GOVERNING_COLUMNS)
+        return PostProcessedResults(results_df.copy(), empty, empty.copy(), pd.DataFrame(columns=MEMBER_SUMMARY_COLUMNS))
+
+    results = results_df.drop(columns=["dcr_max", "governing check"], errors="ignore")
+    governing = governing_dcr_columns(results)
+    results.insert(3, "dcr_max", governing["dcr_max"])
+    results.insert(4, "governing check", governing["governing check"])
+    return PostProcessedResults(
+        results=results,
+        by_member=_governing_rows(results, "member"),
+        by_force=_governing_rows(results, "force"),
+        member_summary=member_summary(results, limit),
+    )
+
+
+def query_results(
+        table: pd.DataFrame,
+        members: Optional[Iterable] = None,
+        min_dcr: Optional[float] = None,
+        top_n: Optional[int] = None,
+        sort_by: Optional[str] = "dcr_max",
+        ascending: bool = False,
+) -> np.ndarray :
+    """
+    Filters and sorts a table without copying it, for paginated display.
+
+    Args:
+        table: Results (or any table with the filtered columns).
+        members: Only rows of these members.
+        min_dcr: Only rows with dcr_max at or above this value.
+        top_n: Only the first rows after sorting, e.g. the top-N governing rows.
+        sort_by: Column to sort by, None to keep the table order. Missing values go last.
+        ascending: Sort direction.
+
+    Returns:
+        Row positions (for table.iloc) in display order; slice them to get a page.
+    """
+    mask = np.ones(len(table), dtype=bool)
+    if members :
+        mask &= table["member"].isin(list(members)).to_numpy()
+    if min_dcr is not None :
+        mask &= np.nan_to_num(table["dcr_max"].to_numpy(dtype=float), nan=-np.inf) >= min_dcr
+    positions = np.flatnonzero(mask)
+
+    if sort_by is not None :
+        values = pd.Series(table[sort_by].to_numpy()[positions])
+        if top_n is not None and top_n < len(values) and pd.api.types.is_numeric_dtype(values) :
+            # Partial selection instead of a full sort when only the top rows are shown.
+            selected = values.nsmallest(top_n) if ascending else values.nlargest(top_n)
+            return positions[selected.index.to_numpy()]
+        positions = positions[values.sort_values(ascending=ascending, kind="stable", na_position="last").index.to_numpy()]
+    return positions if top_n is None else positions[:top_n]
+
+
+def page_positions(positions: np.ndarray, page: int, page_size: int) -> np.ndarray :
+    """
+    Positions of one page (1-based) of a query_results selection.
+    """
+    start = (max(page, 1) - 1) * page_size
+    return positions[start :start + page_size]
+
+
+def _natural_order(labels: pd.Index) -> np.ndarray :
+    numbers = pd.to_numeric(pd.Series(labels, dtype=object), errors="coerce").to_numpy(dtype=float)
+    return np.lexsort((np.asarray(labels, dtype=str), np.nan_to_num(numbers, nan=np.inf)))
+
+
+def dcr_heatmap_grid(results: pd.DataFrame, section: Optional[str] = None) -> pd.DataFrame :
+    """
+    Governing dcr_max per Robot member and load case, for a heatmap.
+
+    Force names such as '1//2//4/(C)' are split once per distinct force, and every result row is
+    scattered into the grid in one vectorized pass, keeping the largest DCR over nodes, elements
+    and sections. Names that are not Robot labels give one row per force and a single column.
+
+    Args:
+        results: Results table; dcr_max is computed when missing.
+        section: Only results of this section.
+
+    Returns:
+        A DataFrame indexed by member with one column per load case, NaN where a member has no force.
+    """
+    if section is not None :
+        results = results[results["section"] == section]
+    if "dcr_max" in results.columns :
+        dcr = results["dcr_max"].to_numpy(dtype=float)
+    else :
+        dcr = governing_dcr_columns(results)["dcr_max"].to_numpy(dtype=float)
+
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    force_codes, forces = pd.factorize(results["force"], sort=False)
+    parts = pc.split_pattern(pa.array(np.asarray(forces, dtype=object), type=pa.string()), "/")
+    if len(forces) and pc.min(pc.list_value_length(parts)).as_py() >= 5 :
+        member_codes, members = pd.factorize(pc.list_element(parts, 0).to_numpy(zero_copy_only=False), sort=False)
+        case_codes, cases = pd.factorize(pc.list_element(parts, 4).to_numpy(zero_copy_only=False), sort=False)
+    else :
+        member_codes, members = np.arange(len(forces)), pd.Index(forces)
+        case_codes, cases = np.zeros(len(forces), dtype=np.intp), pd.Index(["all"])
+
+    grid = np.full(len(members) * len(cases), -np.inf)
+    cells = member_codes[force_codes] * len(cases) + case_codes[force_codes]
+    np.maximum.at(grid, cells, np.nan_to_num(dcr, nan=-np.inf))
+    grid[np.isneginf(grid)] = np.nan
+    grid = grid.reshape(len(members), len(cases))
+
+    member_order = _natural_order(members)
+    case_order = _natural_order(cases)
+    return pd.DataFrame(
+        grid[np.ix_(member_order, case_order)],
+        index=pd.Index(np.asarray(members)[member_order], name="member"),
+        columns=pd.Index(np.asarray(cases)[case_order], name="case"),
+    )
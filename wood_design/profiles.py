@@ -0,0 +1,158 @@
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Tuple
+import numpy as np
+import pandas as pd
+from timber_nds.settings import WoodMaterial, RectangularSection, MemberDefinition
+from wood_design.cache import CapacityCache
+from wood_design.engine import (
+    FACTOR_TYPES,
+    ForceArrays,
+    SectionArrays,
+    MemberArrays,
+    combined_factors,
+    factor_arguments,
+    check_profile_arrays,
+)
+
+DEFAULT_PROFILE = "Default"
+
+
+@dataclass
+class MemberProfiles :
+    """
+    Distinct material and factor profile pairs used by the members, and the pair of every member.
+
+    Args:
+        labels: (material name, factor profile name) of every profile.
+        materials: Material of every profile.
+        adjustment_factors: Adjustment factor dictionary of every profile, keyed by FACTOR_TYPES.
+        combined: Combined factors of every profile, computed once per profile.
+        member_profile: Profile index of every member, in element order.
+    """
+    labels: List[Tuple[str, str]]
+    materials: List[WoodMaterial]
+    adjustment_factors: List[dict]
+    combined: List[Dict[str, float]]
+    member_profile: np.ndarray
+
+    def __len__(self) -> int :
+        return len(self.labels)
+
+    def mixed(self, default_material: str, default_factor_profile: str = DEFAULT_PROFILE) -> bool :
+        """
+        Whether any member uses another material or factor profile than the main ones, even if all
+        members share that other profile; such runs need the profile-aware engine.
+        """
+        return any(label != (default_material, default_factor_profile) for label in self.labels)
+
+    def fingerprint(self) -> dict :
+        """
+        JSON-serializable description of the profiles and their assignment, for result cache keys.
+        """
+        return {
+            "profiles" : [
+                {
+                    "material" : asdict(material),
+                    "adjustment_factors" : {factor_type : asdict(factors[factor_type]) for factor_type in FACTOR_TYPES},
+                }
+                for material, factors in zip(self.materials, self.adjustment_factors)
+            ],
+            "member_profile" : self.member_profile.tolist(),
+        }
+
+
+def resolve_member_profiles(
+        list_elements: List[MemberDefinition],
+        materials: Dict[str, WoodMaterial],
+        factor_profiles: Dict[str, dict],
+        member_materials: Dict[str, str],
+        member_factor_profiles: Dict[str, str],
+        default_material: str,
+        default_factor_profile: str = DEFAULT_PROFILE,
+) -> MemberProfiles :
+    """
+    Groups the members by the material and factor profile they reference.
+
+    Args:
+        list_elements: Member definitions.
+        materials: Materials by name.
+        factor_profiles: Adjustment factor dictionaries by profile name.
+        member_materials: Material name per element name; missing elements use default_material.
+        member_factor_profiles: Factor profile name per element name; missing elements use default_factor_profile.
+        default_material, default_factor_profile: Names used by elements without an assignment.
+
+    Returns:
+        A MemberProfiles, profiles numbered in order of first use.
+
+    Raises:
+        ValueError: If an element references an unknown material or factor profile.
+    """
+    labels = []
+    member_profile = np.zeros(len(list_elements), dtype=np.intp)
+    for i, element in enumerate(list_elements) :
+        label = (member_materials.get(element.name, default_material),
+                 member_factor_profiles.get(element.name, default_factor_profile))
+        if label[0] not in materials :
+            raise ValueError(f"Element '{element.name}' references unknown material '{label[0]}'.")
+        if label[1] not in factor_profiles :
+            raise ValueError(f"Element '{element.name}' references unknown factor profile '{label[1]}'.")
+        if label not in labels :
+            labels.append(label)
+        member_profile[i] = labels.index(label)
+
+    combined = {name : combined_factors(**factor_arguments(factor_profiles[name])) for name in {label[1] for label in labels}}
+    return MemberProfiles(
+        labels=labels,
+        materials=[materials[material] for material, _ in labels],
+        adjustment_factors=[factor_profiles[profile] for _, profile in labels],
+        combined=[combined[profile] for _, profile in labels],
+        member_profile=member_profile,
+    )
+
+
+def check_member_profiles(
+        list_sections: List[RectangularSection],
+        list_elements: List[MemberDefinition],
+        forces: ForceArrays,
+        support_area_values: dict,
+        profiles: MemberProfiles,
+) -> pd.DataFrame :
+    """
+    Runs the design checks of all members, each with its own material and adjustment factors, in one pass.
+
+    Returns:
+        The results table with RESULT_COLUMNS, ordered like check_for_all_elements.
+    """
+    if not list_sections or not list_elements or not len(forces) :
+        return pd.DataFrame()
+    return check_profile_arrays(
+        SectionArrays.from_sections(list_sections),
+        MemberArrays.from_members(list_elements, support_area_values),
+        forces,
+        profiles.materials,
+        profiles.combined,
+        profiles.member_profile,
+    )
+
+
+def profile_capacity_table(
+        cache: CapacityCache,
+        list_sections: List[RectangularSection],
+        list_elements: List[MemberDefinition],
+        support_area_values: dict,
+        profiles: MemberProfiles,
+) -> pd.DataFrame :
+    """
+    Capacity table (see CapacityCache.capacity_table) of members using different profiles.
+    """
+    tables = []
+    for profile in range(len(profiles)) :
+        elements = [element for element, code in zip(list_elements, profiles.member_profile) if code == profile]
+        tables.append(cache.capacity_table(
+            material=profiles.materials[profile],
+            list_sections=list_sections,
+            list_elements=elements,
+            adjustment_factors=profiles.adjustment_factors[profile],
+            support_area_values=support_area_values,
+        ))
+    return pd.concat(tables, ignore_index=True)
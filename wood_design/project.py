@@ -0,0 +1,174 @@
+from dataclasses import dataclass, field, fields
+from typing import Dict, List
+import tomllib
+from timber_nds.settings import (
+    WoodMaterial,
+    RectangularSection,
+    MemberDefinition,
+    TensionAdjustmentFactors,
+    BendingAdjustmentFactors,
+    ShearAdjustmentFactors,
+    CompressionAdjustmentFactors,
+    PerpendicularAdjustmentFactors,
+    ElasticModulusAdjustmentFactors,
+)
+from wood_design.engine import FACTOR_TYPES
+from wood_design.profiles import DEFAULT_PROFILE, MemberProfiles, resolve_member_profiles
+
+FACTOR_CLASSES = {
+    "tension" : TensionAdjustmentFactors,
+    "bending_yy" : BendingAdjustmentFactors,
+    "bending_zz" : BendingAdjustmentFactors,
+    "shear" : ShearAdjustmentFactors,
+    "compression_yy" : CompressionAdjustmentFactors,
+    "compression_zz" : CompressionAdjustmentFactors,
+    "compression_perp" : PerpendicularAdjustmentFactors,
+    "elastic_modulus" : ElasticModulusAdjustmentFactors,
+}
+
+
+def default_adjustment_factors() -> dict :
+    """
+    Adjustment factors with the defaults used by the app's Adjustment Factors tab.
+    """
+    return {factor_type : FACTOR_CLASSES[factor_type]() for factor_type in FACTOR_TYPES}
+
+
+@dataclass
+class Project :
+    """
+    Everything the design checks need besides the forces.
+
+    Args:
+        material: Wood material.
+        sections: Rectangular sections to check.
+        elements: Member definitions.
+        adjustment_factors: Adjustment factor dataclasses keyed by FACTOR_TYPES.
+        support_area_values: Support area per element name.
+        materials: Other materials by name, for elements that reference them.
+        factor_profiles: Other adjustment factor dictionaries by profile name.
+        member_materials: Material name per element name, when not the main material.
+        member_factor_profiles: Factor profile name per element name, when not adjustment_factors.
+    """
+    material: WoodMaterial
+    sections: List[RectangularSection]
+    elements: List[MemberDefinition]
+    adjustment_factors: dict = field(default_factory=default_adjustment_factors)
+    support_area_values: Dict[str, float] = field(default_factory=dict)
+    materials: Dict[str, WoodMaterial] = field(default_factory=dict)
+    factor_profiles: Dict[str, dict] = field(default_factory=dict)
+    member_materials: Dict[str, str] = field(default_factory=dict)
+    member_factor_profiles: Dict[str, str] = field(default_factory=dict)
+
+    def member_profiles(self) -> MemberProfiles :
+        """
+        Material and adjustment factors of every element; the main ones are named after the
+        material and DEFAULT_PROFILE.
+        """
+        return resolve_member_profiles(
+            self.elements,
+            materials={**self.materials, self.material.name : self.material},
+            factor_profiles={**self.factor_profiles, DEFAULT_PROFILE : self.adjustment_factors},
+            member_materials=self.member_materials,
+            member_factor_profiles=self.member_factor_profiles,
+            default_material=self.material.name,
+        )
+
+
+def _build(cls, values: dict, context: str) :
+    names = {f.name for f in fields(cls)}
+    unknown = sorted(set(values) - names)
+    if unknown :
+        raise ValueError(f"Unknown keys in {context}: {', '.join(unknown)}")
+    return cls(**values)
+
+
+def _build_factors(factors_data: dict, context: str) -> dict :
+    unknown = sorted(set(factors_data) - set(FACTOR_TYPES))
+    if unknown :
+        raise ValueError(f"Unknown adjustment factor types in {context}: {', '.join(unknown)}")
+    return {
+        factor_type : _build(FACTOR_CLASSES[factor_type], factors_data.get(factor_type, {}), f"{context}.{factor_type}")
+        for factor_type in FACTOR_TYPES
+    }
+
+
+def project_from_dict(data: dict) -> Project :
+    """
+    Builds a Project from a dictionary with the layout of a project TOML file.
+
+    The layout is::
+
+        [material]                      # WoodMaterial fields
+        [[sections]]                    # name, width, depth
+        [[elements]]                    # MemberDefinition fields, optional support_area, material and factor_profile
+        [adjustment_factors.tension]    # any *AdjustmentFactors field, per FACTOR_TYPES key
+        [[materials]]                   # optional other materials, referenced by name from elements
+        [factor_profiles.wet.tension]   # optional named factor profiles, same layout as adjustment_factors
+
+    Raises:
+        ValueError: If a table is missing, a key is unknown, names are duplicated,
+            or an element references an unknown material or factor profile.
+    """
+    for key in ("material", "sections", "elements") :
+        if key not in data :
+            raise ValueError(f"Project is missing the '{key}' table.")
+
+    material = _build(WoodMaterial, data["material"], "material")
+    sections = [_build(RectangularSection, values, "sections") for values in data["sections"]]
+
+    elements = []
+    support_area_values = {}
+    member_materials = {}
+    member_factor_profiles = {}
+    for values in data["elements"] :
+        values = dict(values)
+        support_area = values.pop("support_area", None)
+        material_name = values.pop("material", None)
+        factor_profile = values.pop("factor_profile", None)
+        element = _build(MemberDefinition, values, "elements")
+        if support_area is not None :
+            support_area_values[element.name] = float(support_area)
+        if material_name is not None :
+            member_materials[element.name] = material_name
+        if factor_profile is not None :
+            member_factor_profiles[element.name] = factor_profile
+        elements.append(element)
+
+    adjustment_factors = _build_factors(data.get("adjustment_factors", {}), "adjustment_factors")
+    factor_profiles = {
+        name : _build_factors(values, f"factor_profiles.{name}")
+        for name, values in data.get("factor_profiles", {}).items()
+    }
+    if DEFAULT_PROFILE in factor_profiles :
+        raise ValueError(f"'{DEFAULT_PROFILE}' is the name of the adjustment_factors table, use another profile name.")
+    materials = [_build(WoodMaterial, values, "materials") for values in data.get("materials", [])]
+
+    for kind, items in (("section", sections), ("element", elements), ("material", [material] + materials)) :
+        names = [item.name for item in items]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates :
+            raise ValueError(f"Duplicate {kind} names: {', '.join(duplicates)}")
+
+    project = Project(
+        material=material,
+        sections=sections,
+        elements=elements,
+        adjustment_factors=adjustment_factors,
+        support_area_values=support_area_values,
+        materials={item.name : item for item in materials},
+        factor_profiles=factor_profiles,
+        member_materials=member_materials,
+        member_factor_profiles=member_factor_profiles,
+    )
+    # Fails early on elements referencing unknown materials or factor profiles.
+    project.member_profiles()
+    return project
+
+
+def load_project(path: str) -> Project :
+    """
+    Loads a Project from a TOML file, see project_from_dict for the layout.
+    """
+    with open(path, "rb") as file :
+        return project_from_dict(tomllib.load(file))
@@ -0,0 +1,155 @@
+from typing import Any, Dict, Iterator, List, Optional
+import pandas as pd
+from timber_nds.settings import Forces
+from wood_design.engine import ForceArrays
+
+FORCE_FIELDS = ["axial", "shear_y", "shear_z", "moment_xx", "moment_yy", "moment_zz"]
+
+
+class NamedRegistry :
+    """
+    Insertion-ordered collection of named objects (materials, sections, members) indexed by name.
+
+    Args:
+        kind: Human readable name of the stored objects, used in error messages.
+
+    Assumptions:
+        - Stored objects have a 'name' attribute, which is the join key used in the results table.
+    """
+
+    def __init__(self, kind: str) :
+        self.kind = kind
+        self._items: Dict[str, Any] = {}
+
+    def add(self, item: Any) :
+        """
+        Adds an item, refusing duplicate names.
+
+        Raises:
+            ValueError: If an item with the same name is already registered.
+        """
+        if item.name in self._items :
+            raise ValueError(f"{self.kind} '{item.name}' already exists.")
+        self._items[item.name] = item
+
+    def put(self, item: Any) :
+        """
+        Adds an item, replacing any item with the same name.
+        """
+        self._items[item.name] = item
+
+    def get(self, name: str, default: Any = None) -> Any :
+        return self._items.get(name, default)
+
+    def names(self) -> List[str] :
+        return list(self._items)
+
+    def values(self) -> List[Any] :
+        return list(self._items.values())
+
+    def last(self) -> Optional[Any] :
+        return next(reversed(self._items.values()), None)
+
+    def __getitem__(self, name: str) -> Any :
+        return self._items[name]
+
+    def __contains__(self, name: str) -> bool :
+        return name in self._items
+
+    def __iter__(self) -> Iterator[Any] :
+        return iter(self._items.values())
+
+    def __len__(self) -> int :
+        return len(self._items)
+
+
+class ForceRegistry :
+    """
+    Array-backed registry of forces, keyed by position and indexed by name.
+
+    Forces are kept as ForceArrays, so the design engine reads them without building
+    one Forces object per row; Forces objects are only created on demand.
+
+    Args:
+        forces: Initial forces as column arrays.
+
+    Assumptions:
+        - Rows with a repeated name (an export repeating a Member/Node/Case label) are all kept,
+          in order, like the CLI and results_io.export_frame do; lookups by name return the first.
+    """
+
+    def __init__(self, forces: Optional[ForceArrays] = None) :
+        if forces is None :
+            forces = ForceArrays.from_forces([])
+        self._index: Dict[str, int] = {}
+        self.arrays = ForceArrays.from_forces([])
+        self.extend(forces)
+
+    @classmethod
+    def from_forces(cls, list_forces: List[Forces]) -> "ForceRegistry" :
+        return cls(ForceArrays.from_forces(list_forces))
+
+    def extend(self, forces: ForceArrays) :
+        """
+        Appends forces after the registered ones.
+        """
+        offset = len(self.arrays)
+        self.arrays = ForceArrays.concatenate([self.arrays, forces])
+        for i, name in enumerate(forces.names) :
+            self._index.setdefault(name, offset + i)
+
+    def index_of(self, name: str) -> int :
+        """
+        Position of the first force with this name.
+        """
+        return self._index[name]
+
+    def at(self, i: int) -> Forces :
+        """
+        Force at position i.
+        """
+        return Forces(name=self.arrays.names[i], **{field : getattr(self.arrays, field)[i] for field in FORCE_FIELDS})
+
+    def get(self, name: str, default: Any = None) -> Optional[Forces] :
+        """
+        First force with this name, see repeated_names for names carried by several rows.
+        """
+        if name not in self._index :
+            return default
+        return self.at(self._index[name])
+
+    def names(self) -> List[str] :
+        return list(self.arrays.names)
+
+    def repeated_names(self) -> List[str] :
+        """
+        Names carried by more than one row, in order of first appearance.
+        """
+        names = pd.Series(self.arrays.names, dtype=object)
+        return list(pd.unique(names[names.duplicated()]))
+
+    def repeated_rows(self) -> int :
+        """
+        Rows whose name is already carried by an earlier row.
+        """
+        return len(self.arrays) - len(self._index)
+
+    def values(self) -> List[Forces] :
+        return [self.at(i) for i in range(len(self.arrays))]
+
+    def to_frame(self) -> pd.DataFrame :
+        """
+        Returns the forces as a DataFrame with a 'name' column followed by FORCE_FIELDS.
+        """
+        data = {"name" : self.arrays.names}
+        data.update({field : getattr(self.arrays, field) for field in FORCE_FIELDS})
+        return pd.DataFrame(data)
+
+    def __contains__(self, name: str) -> bool :
+        return name in self._index
+
+    def __iter__(self) -> Iterator[Forces] :
+        return iter(self.values())
+
+    def __len__(self) -> int :
+        return len(self.arrays)
@@ -0,0 +1,315 @@
+from typing import Dict, Iterator, List, Optional
+import io
+import os
+import numpy as np
+import pandas as pd
+from wood_design.engine import ForceArrays
+from wood_design.postprocess import governing_dcr_columns
+
+# Column layout of Beams_results.csv: the demand of every check next to its DCR.
+EXPORT_COLUMNS = [
+    "member", "section", "force", "dcr_max",
+    "axial tension", "tension (dcr)",
+    "axial compression", "compression (dcr)",
+    "moment yy", "moment zz", "biaxial bending (dcr)",
+    "shear y", "shear z", "shear y (dcr)", "shear z (dcr)",
+    "bending and compression (dcr)",
+    "compression perpendicular", "compression perpendicular (dcr)",
+]
+
+KEY_COLUMNS = ["member", "section", "force"]
+
+ARROW_SUFFIXES = (".arrow", ".feather")
+
+DEMAND_COLUMNS = [
+    "axial tension", "axial compression", "moment yy", "moment zz", "shear y", "shear z", "compression perpendicular"
+]
+
+
+def force_demands(forces: ForceArrays) -> pd.DataFrame :
+    """
+    Demand of every check, as used by engine.dcr_arrays, indexed by force name.
+    """
+    return pd.DataFrame({
+        "axial tension" : np.where(forces.axial > 0, forces.axial, 0.0),
+        "axial compression" : np.where(forces.axial < 0, -forces.axial, 0.0),
+        "moment yy" : np.abs(forces.moment_yy),
+        "moment zz" : np.abs(forces.moment_zz),
+        "shear y" : np.abs(forces.shear_y),
+        "shear z" : np.abs(forces.shear_z),
+        "compression perpendicular" : np.maximum(np.abs(forces.shear_y), np.abs(forces.shear_z)),
+    }, index=pd.Index(forces.names, name="force"))
+
+
+def export_frame(results_df: pd.DataFrame, forces: Optional[ForceArrays] = None) -> pd.DataFrame :
+    """
+    Lays a results table out like Beams_results.csv.
+
+    Args:
+        results_df: Results table with member, section, force and the DCR columns.
+        forces: Forces the results were computed with, i.e. the ForceArrays passed to the engine;
+            the demand columns are left out when omitted.
+
+    Returns:
+        A DataFrame with the EXPORT_COLUMNS that can be filled in, in that order.
+
+    Raises:
+        ValueError: If the rows are not laid out like engine.results_frame for these forces.
+
+    Assumptions:
+        - Demands are matched by position, so repeated force names get the demands of their own row.
+    """
+    export = results_df.drop(columns=["dcr_max", "governing check"], errors="ignore")
+    export["dcr_max"] = governing_dcr_columns(export)["dcr_max"].to_numpy()
+    if forces is not None :
+        names = export["force"].to_numpy()
+        repeats = len(names) // len(forces) if len(forces) else 0
+        if len(names) != repeats * len(forces) or (repeats and not (names == np.tile(forces.names, repeats)).all()) :
+            raise ValueError("The results were not computed with these forces: rows must repeat the forces "
+                             "in order for every section and member.")
+        demands = force_demands(forces)
+        for column in DEMAND_COLUMNS :
+            export[column] = np.tile(demands[column].to_numpy(), repeats)
+    return export[[column for column in EXPORT_COLUMNS if column in export.columns]]
+
+
+def write_results_csv(
+        results_df: pd.DataFrame,
+        path_or_buffer,
+        forces: Optional[ForceArrays] = None,
+        header: bool = True,
+        mode: str = "w",
+):
+    """
+    Writes results in the Beams_results.csv format (';' separated, no index).
+
+    Args:
+        results_df: Results table, see export_frame.
+        path_or_buffer: File path or buffer; None returns the CSV as a string.
+        forces: Forces the results were computed with, for the demand columns.
+        header: Whether to write the header, False when appending chunks.
+        mode: File mode, 'a' to append chunks to an existing file.
+    """
+    data = _csv_bytes(export_frame(results_df, forces), header)
+    if path_or_buffer is None :
+        return data.decode("utf-8")
+    if isinstance(path_or_buffer, (str, os.PathLike)) :
+        with open(path_or_buffer, mode + "b") as file :
+            file.write(data)
+    elif isinstance(path_or_buffer, io.TextIOBase) :
+        path_or_buffer.write(data.decode("utf-8"))
+    else :
+        path_or_buffer.write(data)
+
+
+def _csv_bytes(export: pd.DataFrame, header: bool) -> bytes :
+    """
+    Formats a table exactly like DataFrame.to_csv(sep=";", index=False), several times faster on
+    large tables: floats are cast to text by Arrow, and only the values Arrow writes differently
+    from Python's repr (exponent notation) are formatted by Python.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    table = pa.Table.from_pandas(export, preserve_index=False)
+    for i, column in enumerate(table.column_names) :
+        values = table.column(column)
+        if pa.types.is_floating(values.type) :
+            table = table.set_column(i, column, _float_text(export[column].to_numpy(dtype=float)))
+        elif pc.any(pc.match_substring_regex(values.cast(pa.string()), r'[;"\r\n]')).as_py() :
+            # Names that need quoting: let pandas apply its quoting rules.
+            return export.to_csv(sep=";", index=False, header=header).encode("utf-8")
+
+    sink = pa.BufferOutputStream()
+    if header :
+        sink.write(export.head(0).to_csv(sep=";", index=False).encode("utf-8"))
+    pa_csv.write_csv(table, sink, pa_csv.WriteOptions(include_header=False, delimiter=";", quoting_style="none"))
+    return sink.getvalue().to_pybytes()
+
+
+def _float_text(values: np.ndarray) :
+    # Python's repr of every float, NaN left null (an empty field, like to_csv).
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    text = pc.cast(pa.array(values, from_pandas=True), pa.string())
+    # Arrow drops the decimal point of whole numbers, add it back so the columns reload as floats.
+    text = pc.if_else(pc.match_substring_regex(text, r"^-?[0-9]+$"), pc.binary_join_element_wise(text, ".0", ""), text)
+    # repr switches to exponent notation below 1e-4 and from 1e16 on, Arrow at other bounds.
+    magnitude = np.abs(values)
+    redo = ((magnitude < 1e-4) & (magnitude > 0)) | ((magnitude >= 1e16) & np.isfinite(magnitude))
+    redo |= pc.match_substring(text, "e").to_numpy(zero_copy_only=False).astype(bool, copy=False) & ~np.isnan(values)
+    if redo.any() :
+        text = text.to_numpy(zero_copy_only=False)
+        text[redo] = [repr(value) for value in values[redo].tolist()]
+        text = pa.array(text, type=pa.string())
+    return text
+
+
+class CsvResultsWriter :
+    """
+    Appends result chunks to a CSV file in the Beams_results.csv format.
+    """
+
+    def __init__(self, path_or_buffer) :
+        self.path_or_buffer = path_or_buffer
+        self.rows = 0
+
+    def write(self, results_df: pd.DataFrame, forces: Optional[ForceArrays] = None) :
+        appending = self.rows > 0
+        write_results_csv(results_df, self.path_or_buffer, forces=forces, header=not appending,
+                          mode="a" if appending else "w")
+        self.rows += len(results_df)
+
+    def close(self) :
+        pass
+
+    def __enter__(self) :
+        return self
+
+    def __exit__(self, *exc_info) :
+        self.close()
+
+
+class ArrowResultsWriter :
+    """
+    Streams result chunks to an Arrow IPC file with typed columns.
+
+    Member, section and force names are dictionary-encoded: every name is stored once and
+    rows only hold int32 codes. The dictionaries grow as new names show up in later chunks
+    and are written as dictionary deltas, so chunks never need to be held in memory together.
+    DCRs and demands are float64. The file is uncompressed so it can be memory-mapped on reload.
+    """
+
+    def __init__(self, sink) :
+        self.sink = sink
+        self.rows = 0
+        self._writer = None
+        self._schema = None
+        self._known: Dict[str, pd.Index] = {column : pd.Index([], dtype=object) for column in KEY_COLUMNS}
+        self._dictionaries: Dict[str, object] = {}
+
+    def _encode(self, column: str, values: pd.Series) :
+        import pyarrow as pa
+        codes, uniques = pd.factorize(values.to_numpy(dtype=object), sort=False)
+        uniques = np.asarray(uniques, dtype=object)
+        known = self._known[column]
+        positions = known.get_indexer(uniques) if len(known) else np.full(len(uniques), -1, dtype=np.intp)
+        new = positions < 0
+        if new.any() or column not in self._dictionaries :
+            added = uniques[new]
+            positions[new] = np.arange(len(known), len(known) + len(added))
+            self._known[column] = known.append(pd.Index(added, dtype=object))
+            added = pa.array(added, type=pa.string())
+            self._dictionaries[column] = added if column not in self._dictionaries \
+                else pa.concat_arrays([self._dictionaries[column], added])
+        return pa.DictionaryArray.from_arrays(pa.array(positions.astype(np.int32)[codes], type=pa.int32()),
+                                              self._dictionaries[column])
+
+    def write(self, results_df: pd.DataFrame, forces: Optional[ForceArrays] = None) :
+        import pyarrow as pa
+        import pyarrow.ipc as ipc
+        export = export_frame(results_df, forces)
+        if self._writer is None :
+            self._schema = pa.schema(
+                [pa.field(column, pa.dictionary(pa.int32(), pa.string())) for column in KEY_COLUMNS]
+                + [pa.field(column, pa.float64()) for column in export.columns if column not in KEY_COLUMNS]
+            )
+            self._writer = ipc.new_file(self.sink, self._schema,
+                                        options=ipc.IpcWriteOptions(emit_dictionary_deltas=True))
+        elif list(export.columns) != self._schema.names :
+            raise ValueError("All result chunks must have the same columns.")
+
+        arrays = [self._encode(column, export[column]) for column in KEY_COLUMNS]
+        arrays += [pa.array(export[column].to_numpy(dtype=float), type=pa.float64())
+                   for column in export.columns if column not in KEY_COLUMNS]
+        self._writer.write_batch(pa.record_batch(arrays, schema=self._schema))
+        self.rows += len(export)
+
+    def close(self) :
+        if self._writer is not None :
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self) :
+        return self
+
+    def __exit__(self, *exc_info) :
+        self.close()
+
+
+def is_arrow_path(path) -> bool :
+    return isinstance(path, (str, os.PathLike)) and str(path).lower().endswith(ARROW_SUFFIXES)
+
+
+def results_writer(path_or_buffer, arrow: Optional[bool] = None) :
+    """
+    Writer for result chunks, Arrow for .arrow/.feather paths (or arrow=True) and CSV otherwise.
+    """
+    if arrow is None :
+        arrow = is_arrow_path(path_or_buffer)
+    return ArrowResultsWriter(path_or_buffer) if arrow else CsvResultsWriter(path_or_buffer)
+
+
+def _open_arrow(source, memory_map: bool) :
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+    if isinstance(source, (str, os.PathLike)) :
+        source = pa.memory_map(str(source), "r") if memory_map else pa.OSFile(str(source), "rb")
+    return ipc.open_file(source)
+
+
+def open_results_arrow(source, memory_map: bool = True) :
+    """
+    Opens an Arrow results file as a pyarrow Table.
+
+    With memory_map, the column buffers point straight into the mapped file: nothing is read
+    until a column is used, and only the pages touched are loaded.
+    """
+    return _open_arrow(source, memory_map).read_all()
+
+
+def iter_results_arrow(source, memory_map: bool = True) -> Iterator[pd.DataFrame] :
+    """
+    Yields an Arrow results file one written chunk at a time, as DataFrames.
+    """
+    reader = _open_arrow(source, memory_map)
+    for i in range(reader.num_record_batches) :
+        yield reader.get_batch(i).to_pandas()
+
+
+def read_results_arrow(source, memory_map: bool = True, columns: Optional[List[str]] = None) -> pd.DataFrame :
+    """
+    Reads an Arrow results file into a DataFrame.
+
+    Args:
+        source: File path or file-like object.
+        memory_map: Memory-map the file instead of reading it.
+        columns: Optional subset of columns to load.
+
+    Returns:
+        The results, with categorical member, section and force columns.
+    """
+    table = open_results_arrow(source, memory_map)
+    if columns is not None :
+        table = table.select(columns)
+    return table.to_pandas()
+
+
+def compare_results(previous: pd.DataFrame, current: pd.DataFrame) -> pd.DataFrame :
+    """
+    Governing dcr_max per member and section of two runs, side by side.
+
+    Returns:
+        A DataFrame with member, section, 'dcr_max previous', 'dcr_max current' and 'change';
+        pairs present in only one run have NaN on the other side.
+    """
+    def governing(results: pd.DataFrame) -> pd.Series :
+        if "dcr_max" not in results.columns :
+            results = results.assign(dcr_max=governing_dcr_columns(results)["dcr_max"].to_numpy())
+        keys = [results[column].astype(str) for column in ("member", "section")]
+        return results["dcr_max"].groupby(keys, sort=False).max()
+
+    comparison = pd.concat([governing(previous).rename("dcr_max previous"),
+                            governing(current).rename("dcr_max current")], axis=1)
+    comparison["change"] = comparison["dcr_max current"] - comparison["dcr_max previous"]
+    return comparison.rename_axis(["member", "section"]).reset_index()
@@ -0,0 +1,210 @@
+from dataclasses import replace
+from typing import Dict, Iterable, List, Tuple
+import itertools
+import numpy as np
+import pandas as pd
+from timber_nds.settings import WoodMaterial
+from wood_design.engine import (
+    FACTOR_TYPES,
+    DCR_COLUMNS,
+    SECTION_DCR_COLUMNS,
+    MEMBER_DCR_COLUMNS,
+    ForceArrays,
+    SectionArrays,
+    MemberArrays,
+    combined_factors,
+    factor_arguments,
+    section_capacities,
+    member_capacities,
+    section_dcr_arrays,
+    member_dcr_arrays,
+)
+from wood_design.envelope import DEMAND_COMPONENTS, demand_components, dominated_mask
+
+# WoodMaterial fields the DCRs depend on.
+MATERIAL_PARAMETERS = [
+    "tension_strength", "bending_strength", "shear_strength",
+    "compression_perpendicular_strength", "compression_parallel_strength",
+]
+
+SWEEP_COLUMNS = ["member", "section", "dcr_max", "governing check"]
+
+
+def sweep_parameters(adjustment_factors: dict) -> List[str] :
+    """
+    Names of the parameters a sweep can vary.
+
+    Returns:
+        MATERIAL_PARAMETERS, every factor field shared by several factor types (e.g. 'due_moisture',
+        which sets the field of all of them) and every '<factor type>.<field>' (e.g. 'tension.due_moisture').
+    """
+    qualified = [f"{factor_type}.{field}" for factor_type in FACTOR_TYPES
+                 for field in adjustment_factors[factor_type].__dict__]
+    fields = [name.split(".")[1] for name in qualified]
+    shared = list(dict.fromkeys(field for field in fields if fields.count(field) > 1))
+    return MATERIAL_PARAMETERS + shared + qualified
+
+
+def sweep_grid(parameters: Dict[str, Iterable[float]]) -> pd.DataFrame :
+    """
+    Full factorial grid of parameter values.
+
+    Args:
+        parameters: Values of every swept parameter, see sweep_parameters.
+
+    Returns:
+        A DataFrame with one column per parameter and one row per grid point, the last parameter varying fastest.
+    """
+    names = list(parameters)
+    values = [np.asarray(list(parameters[name]), dtype=float) for name in names]
+    if any(not len(value) for value in values) :
+        raise ValueError("Every swept parameter needs at least one value.")
+    return pd.DataFrame(list(itertools.product(*values)), columns=names, dtype=float)
+
+
+def apply_point(material: WoodMaterial, adjustment_factors: dict, point: Dict[str, float]) -> Tuple[WoodMaterial, dict] :
+    """
+    Material and adjustment factors of one grid point.
+
+    Raises:
+        ValueError: If a parameter is not in sweep_parameters.
+    """
+    material_values = {}
+    factors = dict(adjustment_factors)
+    for name, value in point.items() :
+        if name in MATERIAL_PARAMETERS :
+            material_values[name] = float(value)
+            continue
+        factor_types = [name.split(".")[0]] if "." in name else FACTOR_TYPES
+        field = name.split(".")[-1]
+        targets = [factor_type for factor_type in factor_types
+                   if factor_type in factors and field in factors[factor_type].__dict__]
+        if not targets :
+            raise ValueError(f"Unknown sweep parameter '{name}'.")
+        for factor_type in targets :
+            factors[factor_type] = replace(factors[factor_type], **{field : float(value)})
+    return replace(material, **material_values), factors
+
+
+def candidate_forces(forces: ForceArrays) -> ForceArrays :
+    """
+    Forces that can govern some check for any positive capacities, see envelope.demand_components.
+
+    The reduction does not depend on the material, factors or sections, so it is done once for the whole grid.
+
+    Assumptions:
+        - Tension, shear and compression perpendicular DCRs are governed by the largest demand of
+          their component, and the biaxial bending and bending and compression DCRs by a force of
+          the (compression, |MY|, |MZ|) Pareto front, whatever the capacities. Forces with a NaN
+          component are always kept.
+    """
+    demands = demand_components(forces)
+    keep = np.isnan(demands).any(axis=1)
+    for component in ["tension", "shear_y", "shear_z"] :
+        values = demands[:, DEMAND_COMPONENTS.index(component)]
+        if len(values) and np.nanmax(values, initial=0.0) > 0 :
+            keep[np.nanargmax(values)] = True
+    combined = demands[:, [DEMAND_COMPONENTS.index(component) for component in ["compression", "moment_yy", "moment_zz"]]]
+    keep |= ~dominated_mask(combined, np.zeros(len(forces), dtype=int)) & (combined > 0).any(axis=1)
+    if not keep.any() and len(forces) :
+        keep[0] = True
+    index = np.flatnonzero(keep)
+    return ForceArrays(**{key : value[index] for key, value in forces.__dict__.items()})
+
+
+def _column_max(dcr: Dict[str, np.ndarray], columns: List[str]) -> np.ndarray :
+    # Maximum over the forces of every column, ignoring NaN like postprocess.governing_dcr_columns.
+    return np.stack([np.where(np.isnan(dcr[column]), -np.inf, dcr[column]).max(axis=-1) for column in columns], axis=-1)
+
+
+def sweep_governing(
+        sections: SectionArrays,
+        members: MemberArrays,
+        forces: ForceArrays,
+        material: WoodMaterial,
+        adjustment_factors: dict,
+        grid: pd.DataFrame,
+        max_block: int = 20_000_000,
+) -> pd.DataFrame :
+    """
+    Governing DCR of every member and section at every grid point.
+
+    Capacities are proportional to the material strengths and to every adjustment factor, so the
+    demand side is shared by the whole grid: the candidate governing forces are found once, and
+    only the capacities are recomputed per point. The DCRs of all points are then evaluated at
+    once, every point acting as a copy of the sections (and members) with its own capacities.
+
+    Args:
+        sections, members, forces: Column arrays, as for engine.check_arrays.
+        material, adjustment_factors: Base material and adjustment factors, keyed by FACTOR_TYPES.
+        grid: Parameter values per point, see sweep_grid.
+        max_block: Upper bound of DCR values evaluated at once.
+
+    Returns:
+        A DataFrame with the grid columns followed by SWEEP_COLUMNS, one row per point, section and member
+        (in that order). The values are those of a full calculation with the material and factors of the point.
+
+    Assumptions:
+        - Ties between checks go to the first of DCR_COLUMNS.
+    """
+    if not len(sections) or not len(members) or not len(forces) or grid.empty :
+        return pd.DataFrame(columns=list(grid.columns) + SWEEP_COLUMNS)
+
+    forces = candidate_forces(forces)
+    n_points, n_sections, n_members = len(grid), len(sections), len(members)
+    section_caps, member_caps = [], []
+    for point in grid.to_dict("records") :
+        point_material, point_factors = apply_point(material, adjustment_factors, point)
+        combined = combined_factors(**factor_arguments(point_factors))
+        section_caps.append(section_capacities(sections, point_material, combined))
+        member_caps.append(member_capacities(members, point_material, combined))
+
+    section_max = np.empty((n_points, n_sections, len(SECTION_DCR_COLUMNS)))
+    member_max = np.empty((n_points, n_members, len(MEMBER_DCR_COLUMNS)))
+    block = max(1, max_block // (max(n_sections, n_members) * len(forces) * len(DCR_COLUMNS)))
+    for start in range(0, n_points, block) :
+        stop = min(start + block, n_points)
+        capacities = {key : np.concatenate([caps[key] for caps in section_caps[start :stop]]) for key in section_caps[0]}
+        section_max[start :stop] = _column_max(section_dcr_arrays(capacities, forces),
+                                               SECTION_DCR_COLUMNS).reshape(stop - start, n_sections, -1)
+        capacities = {key : np.concatenate([caps[key] for caps in member_caps[start :stop]]) for key in member_caps[0]}
+        member_max[start :stop] = _column_max(member_dcr_arrays(capacities, forces),
+                                              MEMBER_DCR_COLUMNS).reshape(stop - start, n_members, -1)
+
+    shape = (n_points, n_sections, n_members)
+    by_column = {column : np.broadcast_to(section_max[:, :, None, i], shape)
+                 for i, column in enumerate(SECTION_DCR_COLUMNS)}
+    by_column.update({column : np.broadcast_to(member_max[:, None, :, i], shape)
+                      for i, column in enumerate(MEMBER_DCR_COLUMNS)})
+    dcr = np.stack([by_column[column] for column in DCR_COLUMNS], axis=-1)
+    governing = np.argmax(dcr, axis=-1)
+    dcr_max = np.take_along_axis(dcr, governing[..., None], axis=-1)[..., 0]
+    names = np.array(DCR_COLUMNS, dtype=object)[governing]
+    names[np.isneginf(dcr_max)] = None
+
+    table = grid.iloc[np.repeat(np.arange(n_points), n_sections * n_members)].reset_index(drop=True)
+    table["member"] = np.tile(members.names, n_points * n_sections)
+    table["section"] = np.tile(np.repeat(sections.names, n_members), n_points)
+    table["dcr_max"] = np.where(np.isneginf(dcr_max), np.nan, dcr_max).ravel()
+    table["governing check"] = names.ravel()
+    return table
+
+
+def sweep_surface(table: pd.DataFrame, member: str, section: str, index: str, columns: str = None) -> pd.DataFrame :
+    """
+    Governing DCR surface of one member and section over one or two swept parameters.
+
+    Args:
+        table: Result of sweep_governing.
+        member, section: Member and section names.
+        index, columns: Parameters along the rows and columns; the other parameters are
+            reduced to their worst (largest) governing DCR.
+
+    Returns:
+        A DataFrame of dcr_max indexed by the values of index, with one column per value of columns
+        (a single 'dcr_max' column without columns).
+    """
+    rows = table[(table["member"] == member) & (table["section"] == section)]
+    keys = [index] if columns is None else [index, columns]
+    surface = rows.groupby(keys)["dcr_max"].max()
+    return surface.to_frame() if columns is None else surface.unstack(columns)